@@ -1,16 +1,44 @@
-﻿from flask import Flask, render_template, request, jsonify, redirect, url_for, send_from_directory, Response, session, g
+﻿from flask import Flask, render_template, request, jsonify, redirect, url_for, send_from_directory, Response, session, g, stream_with_context
+from bisect import bisect_left, insort
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from functools import wraps
+import click
+import copy
+import hashlib
 import json
 import os
-from datetime import datetime
+import threading
+from datetime import datetime, timezone
 import html
 import logging
+import mimetypes
 from logging.handlers import RotatingFileHandler
 import re
+import secrets
+import shutil
+import sqlite3
+import tempfile
+import time
+import unicodedata
+import zipfile
+import zlib
 from time import perf_counter
-from urllib.parse import urlparse
-from werkzeug.exceptions import HTTPException
-from werkzeug.utils import secure_filename
+from urllib.parse import quote, unquote, urlparse
+import requests
+from werkzeug.exceptions import HTTPException, NotFound
+from werkzeug.security import safe_join
+from xml.etree import ElementTree
+
+try:
+    from pypdf import PdfReader
+except ImportError:  # PDF text extraction is optional; DOCX needs only the standard library.
+    PdfReader = None
+try:
+    import fcntl
+except ImportError:  # Windows: migrations are only serialized within one process.
+    fcntl = None
 
 
 app = Flask(__name__)
@@ -18,11 +46,11 @@ app.json.ensure_ascii = False
 app.config['MAX_CONTENT_LENGTH'] = 32 * 1024 * 1024  # 32MB max request size
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 # Store uploaded attachments in the uploads folder (case-sensitive on Linux/Docker).
-app.config['UPLOAD_FOLDER'] = os.path.join(BASE_DIR, 'uploads')
+app.config['UPLOAD_FOLDER'] = os.environ.get('UPLOAD_FOLDER') or os.path.join(BASE_DIR, 'uploads')
 app.config['SECRET_KEY'] = os.environ.get('FLASK_SECRET_KEY') or os.environ.get('SECRET_KEY') or os.urandom(24)
 app.secret_key = app.config['SECRET_KEY']
 
-LOG_DIR = os.path.join(BASE_DIR, 'logs')
+LOG_DIR = os.environ.get('LOG_DIR') or os.path.join(BASE_DIR, 'logs')
 os.makedirs(LOG_DIR, exist_ok=True)
 
 def configure_logging():
@@ -42,13 +70,56 @@ ALLOWED_EXTENSIONS = {'pdf', 'doc', 'docx'}
 MAX_PDF_FILES = 5
 MAX_PROFILE_PDF_FILES = 10
 MAX_TERMS_FILES = 10
+INDEX_PAGE_SIZE = 20
 PROFILE_LOGO_FILENAME = 'profile-logo.png'
 
-# Data files
-DATA_FILE = 'entries.json'
-PAGES_FILE = 'pages.json'
-PROFILE_FILE = 'profile.json'
-TERMS_FILE = 'terms.json'
+# Data files live in DATA_DIR (default: the working directory) so a container can persist them
+# with a single directory mount.
+DATA_DIR = os.environ.get('DATA_DIR', '')
+if DATA_DIR:
+    os.makedirs(DATA_DIR, exist_ok=True)
+DATA_FILE = os.path.join(DATA_DIR, 'entries.json')
+PAGES_FILE = os.path.join(DATA_DIR, 'pages.json')
+PROFILE_FILE = os.path.join(DATA_DIR, 'profile.json')
+TERMS_FILE = os.path.join(DATA_DIR, 'terms.json')
+META_FILE = os.path.join(DATA_DIR, 'meta.json')
+ENTRIES_JOURNAL_FILE = os.path.join(DATA_DIR, 'entries.journal')
+ENTRIES_CHANGES_FILE = os.path.join(DATA_DIR, 'entries.changes')
+MIGRATION_LOCK_FILE = os.path.join(DATA_DIR, 'migrate.lock')
+
+# entries.journal is folded back into entries.json once it grows past either limit.
+JOURNAL_COMPACT_OPS = 500
+JOURNAL_COMPACT_BYTES = 2 * 1024 * 1024
+
+# Bump when stored records need a new migration step (see migrate_data).
+SCHEMA_VERSION = 1
+
+# Storage backend: 'json' (flat files above) or 'sqlite' (single WAL-mode database).
+app.config['STORAGE_BACKEND'] = os.environ.get('STORAGE_BACKEND', 'json').strip().lower()
+app.config['SQLITE_PATH'] = os.environ.get('SQLITE_PATH', os.path.join(DATA_DIR, 'data.sqlite3'))
+
+# Rendered public index pages kept in memory (LRU); RENDER_CACHE_DIR adds an on-disk tier.
+app.config['RENDER_CACHE_SIZE'] = int(os.environ.get('RENDER_CACHE_SIZE', '64'))
+app.config['RENDER_CACHE_DIR'] = os.environ.get('RENDER_CACHE_DIR', '')
+
+# Remote (Wayback) attachments copied into uploads/ by the mirror job are capped at this size.
+app.config['MIRROR_MAX_BYTES'] = int(os.environ.get('MIRROR_MAX_BYTES', str(64 * 1024 * 1024)))
+
+# Resumable chunked uploads (/api/uploads) may declare files up to this size; each PUT is still
+# bounded by MAX_CONTENT_LENGTH.
+app.config['UPLOAD_SESSION_MAX_BYTES'] = int(os.environ.get('UPLOAD_SESSION_MAX_BYTES', str(512 * 1024 * 1024)))
+
+# Background threads that extract searchable text from PDF/DOCX uploads.
+app.config['TEXT_EXTRACT_WORKERS'] = int(os.environ.get('TEXT_EXTRACT_WORKERS', '2'))
+
+# Upload delivery: '' streams files from the Python worker; 'x-accel' (nginx, internal location
+# X_ACCEL_PREFIX aliased to uploads/) or 'x-sendfile' (Apache/lighttpd) only sends headers and
+# leaves the transfer, including Range requests, to the front proxy.
+FILE_OFFLOAD_MODES = ('', 'x-accel', 'x-sendfile')
+app.config['FILE_OFFLOAD'] = os.environ.get('FILE_OFFLOAD', '').strip().lower()
+app.config['X_ACCEL_PREFIX'] = os.environ.get('X_ACCEL_PREFIX', '/_uploads/')
+if app.config['FILE_OFFLOAD'] not in FILE_OFFLOAD_MODES:
+    raise ValueError(f"Unknown FILE_OFFLOAD mode: {app.config['FILE_OFFLOAD']}")
 
 # Create uploads directory if it doesn't exist (and migrate legacy folder if present)
 legacy_uploads = os.path.join(BASE_DIR, 'Uploads')
@@ -81,14 +152,50 @@ def is_pdf_file(filename):
     return get_file_extension(filename) == 'pdf'
 
 
-def build_upload_filename(original_name):
-    root, ext = os.path.splitext(original_name or '')
-    ext = ext.lower()
-    safe_root = secure_filename(root)
-    if not safe_root:
-        safe_root = 'file'
-    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S_%f')
-    return f"{timestamp}_{safe_root}{ext}"
+# Uploads are stored content-addressed as <sha256>.<ext>, so identical files share one blob.
+# Older uploads keep their timestamped names.
+UPLOAD_CHUNK_SIZE = 64 * 1024
+BLOB_NAME_RE = re.compile(r'^[0-9a-f]{64}\.(pdf|doc|docx)$')
+_blob_lock = threading.Lock()
+
+
+def new_upload_part():
+    """Open a temp file in UPLOAD_FOLDER for an upload being written; returns (file, path)."""
+    fd, part_path = tempfile.mkstemp(dir=app.config['UPLOAD_FOLDER'], suffix='.part')
+    return os.fdopen(fd, 'wb'), part_path
+
+
+def save_blob(part_path, sha256, ext, overwrite=False):
+    """Move a fully written part file to its content address; returns the blob filename.
+
+    If the blob already exists the part is dropped (unless overwrite, used to repair a corrupt
+    copy) and the blob's mtime is refreshed so the garbage collector's grace period restarts.
+    """
+    filename = f"{sha256}.{ext}"
+    path = os.path.join(app.config['UPLOAD_FOLDER'], filename)
+    with _blob_lock:
+        if os.path.isfile(path) and not overwrite:
+            os.remove(part_path)
+            os.utime(path)
+        else:
+            os.replace(part_path, path)
+    attachment_texts.schedule(filename)
+    return filename
+
+
+def store_upload(file):
+    """Save an uploaded file as a content-addressed blob; returns its filename."""
+    f, part_path = new_upload_part()
+    digest = hashlib.sha256()
+    try:
+        with f:
+            for chunk in iter(lambda: file.stream.read(UPLOAD_CHUNK_SIZE), b''):
+                digest.update(chunk)
+                f.write(chunk)
+    except Exception:
+        os.remove(part_path)
+        raise
+    return save_blob(part_path, digest.hexdigest(), get_file_extension(file.filename))
 
 
 def load_json_file(path, default):
@@ -106,19 +213,106 @@ def load_json_file(path, default):
         return default
 
 
-def save_json_file(path, payload):
+@contextmanager
+def atomic_write(path, binary=False, fsync=True):
+    """Yield a file that replaces path once the block completes.
+
+    Each call writes its own mkstemp file next to path, so concurrent writers never share a
+    temp file; the last complete document wins and a failed write leaves path untouched.
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or '.', prefix=f'{os.path.basename(path)}.',
+                                    suffix='.tmp')
+    try:
+        with (os.fdopen(fd, 'wb') if binary else os.fdopen(fd, 'w', encoding='utf-8')) as f:
+            yield f
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def save_json_file(path, payload, bump_version=True):
+    """Atomically write payload to path; bump_version=False for rewrites that keep the same content."""
     try:
-        with open(path, 'w', encoding='utf-8') as f:
+        with atomic_write(path) as f:
             json.dump(payload, f, ensure_ascii=False, indent=2)
         count = len(payload) if isinstance(payload, list) else 'n/a'
         app.logger.info('data.save path=%s count=%s', path, count)
     except Exception:
         app.logger.exception('data.save.failed path=%s', path)
         raise
+    finally:
+        invalidate_snapshot(path)
+    if bump_version and path != META_FILE:
+        bump_data_version()
+
+
+# Parsed and normalized documents, shared by every request of this process.
+# A snapshot is reused while the file keeps the same mtime/size/inode and no
+# save_* call bumped its write counter in the meantime.
+_snapshot_lock = threading.RLock()
+_snapshots = {}
+_write_counters = {}
+_snapshot_stats = {}
+
+
+def file_signature(path):
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+
+def invalidate_snapshot(path):
+    with _snapshot_lock:
+        _write_counters[path] = _write_counters.get(path, 0) + 1
+        _snapshots.pop(path, None)
+
+
+def load_snapshot(path, builder, depends_on=()):
+    """Return the cached result of builder() for path, rebuilding it when the file changed.
+
+    depends_on lists extra files whose changes also invalidate the snapshot.
+    """
+    signature = tuple(file_signature(p) for p in (path, *depends_on))
+    with _snapshot_lock:
+        counter = _write_counters.get(path, 0)
+        stats = _snapshot_stats.setdefault(path, {'hits': 0, 'misses': 0})
+        cached = _snapshots.get(path)
+        if cached and cached['signature'] == signature and cached['counter'] == counter:
+            stats['hits'] += 1
+            return cached['value']
+        stats['misses'] += 1
+    value = builder()
+    with _snapshot_lock:
+        # A save during the rebuild already invalidated this snapshot; keep the old state.
+        if _write_counters.get(path, 0) == counter:
+            _snapshots[path] = {'signature': signature, 'counter': counter, 'value': value}
+    return value
+
+
+def snapshot_stats():
+    with _snapshot_lock:
+        return {path: dict(stats) for path, stats in _snapshot_stats.items()}
+
+def is_data_write_request():
+    # Upload sessions only stage files; the entry or document save that attaches them is the write.
+    return (request.method != 'GET' and request.path.startswith('/api/')
+            and not request.path.startswith('/api/uploads'))
+
 
 @app.before_request
 def start_timer():
     g.request_start = perf_counter()
+    if is_data_write_request():
+        g.version_before = get_repository().data_stamp()[0]
 
 
 @app.after_request
@@ -126,7 +320,21 @@ def log_request(response):
     start = getattr(g, 'request_start', None)
     duration = perf_counter() - start if start else 0.0
     app.logger.info('http %s %s %s %.3fs', request.method, request.path, response.status_code, duration)
-    if request.path.startswith('/admin') or request.path.startswith('/api/'):
+    # Re-render only after a write that changed the data (not e.g. a failed or read-only POST).
+    version_before = getattr(g, 'version_before', None)
+    if version_before is not None and response.status_code < 400:
+        if get_repository().data_stamp()[0] != version_before:
+            render_cache.schedule_prewarm()
+    validators = getattr(g, 'validators', None)
+    if validators and response.status_code in (200, 304):
+        etag, last_modified = validators
+        response.set_etag(etag)
+        if last_modified:
+            response.last_modified = last_modified
+        # Cacheable, but always revalidated against the data version.
+        scope = 'private' if request.path.startswith('/api/entries') else 'public'
+        response.headers['Cache-Control'] = f'{scope}, no-cache'
+    elif request.path.startswith('/admin') or request.path.startswith('/api/'):
         response.headers['Cache-Control'] = 'no-store, no-cache, must-revalidate, max-age=0'
         response.headers['Pragma'] = 'no-cache'
     return response
@@ -141,12 +349,35 @@ def handle_exception(error):
         return jsonify({'success': False, 'error': 'Internal server error'}), 500
     return error
 
-def load_entries():
-    """Load entries from JSON file"""
+def load_entries(mutable=False):
+    """Load entries from JSON file.
+
+    The returned list is shared between requests; pass mutable=True to get a
+    private copy that can be changed before calling save_entries().
+    """
+    entries = load_snapshot(DATA_FILE, read_entries, depends_on=(ENTRIES_JOURNAL_FILE,))
+    return copy.deepcopy(entries) if mutable else entries
+
+
+def read_entries():
     entries = load_json_file(DATA_FILE, [])
     if not isinstance(entries, list):
         app.logger.error('entries.invalid type=%s', type(entries))
         return []
+    entries = [entry for entry in entries if isinstance(entry, dict)]
+    ops = read_entries_journal()
+    if ops:
+        entries = apply_entry_ops(entries, ops)
+        entries.sort(key=entry_sort_key, reverse=True)
+    return entries
+
+
+def migrate_entries():
+    """Bring stored entries up to the current schema (legacy PDF fields, bogus AOP numbers, order)."""
+    entries = load_json_file(DATA_FILE, [])
+    if not isinstance(entries, list):
+        app.logger.error('entries.invalid type=%s', type(entries))
+        return False
     cleaned_entries = [entry for entry in entries if isinstance(entry, dict)]
     changed = len(cleaned_entries) != len(entries)
     entries = cleaned_entries
@@ -162,20 +393,32 @@ def load_entries():
     if changed:
         save_entries(entries)
         app.logger.info('entries.normalized count=%s', len(entries))
-    return entries
+    return changed
+
+
+# Stored dates are zero-padded ISO strings; fromisoformat parses those far
+# faster than strptime, which stays as the fallback for anything looser.
+ISO_DATE_RE = re.compile(r'[0-9]{4}-[0-9]{2}-[0-9]{2}')
+ISO_DATETIME_RE = re.compile(r'[0-9]{4}-[0-9]{2}-[0-9]{2} [0-9]{2}:[0-9]{2}:[0-9]{2}')
+
+
+def parse_fixed_datetime(value, fmt, pattern):
+    if pattern.fullmatch(value):
+        return datetime.fromisoformat(value)
+    return datetime.strptime(value, fmt)
 
 
 def parse_entry_datetime(entry):
     raw = (entry or {}).get('date')
     if isinstance(raw, str):
         try:
-            return datetime.strptime(raw, '%Y-%m-%d %H:%M:%S')
+            return parse_fixed_datetime(raw, '%Y-%m-%d %H:%M:%S', ISO_DATETIME_RE)
         except ValueError:
             pass
     publish_date = (entry or {}).get('publish_date')
     if isinstance(publish_date, str):
         try:
-            return datetime.strptime(publish_date, '%Y-%m-%d')
+            return parse_fixed_datetime(publish_date, '%Y-%m-%d', ISO_DATE_RE)
         except ValueError:
             pass
     return datetime.min
@@ -211,6 +454,14 @@ def extract_local_pdf_filename(value):
             return parsed.path.split('/uploads/', 1)[1]
     return None
 
+# Set on pdf_files items that the mirror job copied from a remote URL into uploads/.
+MIRROR_FIELDS = ('source_url', 'sha256', 'size')
+
+def copy_mirror_fields(item, payload):
+    for key in MIRROR_FIELDS:
+        if item.get(key):
+            payload[key] = item[key]
+
 def normalize_pdf_items(entry):
     """Normalize stored PDF files to a list of dicts.
 
@@ -235,6 +486,7 @@ def normalize_pdf_items(entry):
                     payload = {'name': name, 'url': url}
                     if filename:
                         payload['filename'] = filename
+                    copy_mirror_fields(item, payload)
                     pdf_items.append(payload)
             elif isinstance(item, str):
                 filename = item
@@ -281,7 +533,7 @@ def cleanup_entry_fields(entry):
     changed = False
     aop_number = entry.get('aop_number', '')
     if aop_number:
-        date_like = re.search(r"\\b[0-9]{2}\\.[0-9]{2}\\.[0-9]{4}\\b", aop_number)
+        date_like = re.search(r"\b[0-9]{2}\.[0-9]{2}\.[0-9]{4}\b", aop_number)
         if date_like or not any(ch.isdigit() for ch in aop_number):
             entry['aop_number'] = ''
             changed = True
@@ -326,15 +578,186 @@ def normalize_incoming_pdf_links(items):
             filename = extract_local_pdf_filename(url)
             if filename:
                 payload['filename'] = filename
+            copy_mirror_fields(item, payload)
             links.append(payload)
     return links
 
-def save_entries(entries):
-    """Save entries to JSON file"""
-    save_json_file(DATA_FILE, entries)
+def save_entries(entries, bump_version=True):
+    """Save entries to JSON file, newest first"""
+    entries.sort(key=entry_sort_key, reverse=True)
+    save_json_file(DATA_FILE, entries, bump_version)
+
+
+# Single-entry writes are appended to entries.journal (one fsynced JSON line
+# per mutation) instead of rewriting entries.json. Loads replay the journal on
+# top of the snapshot; compaction folds it back in the background.
+_journal_lock = threading.RLock()
+_journal_state = {'ops': None, 'compacting': False}
+
 
-def load_pages():
+def read_entries_journal():
+    ops = []
+    if not os.path.exists(ENTRIES_JOURNAL_FILE):
+        return ops
+    with open(ENTRIES_JOURNAL_FILE, 'r', encoding='utf-8') as f:
+        for line_no, line in enumerate(f, start=1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                op = json.loads(line)
+            except json.JSONDecodeError:
+                # A torn final line from a crash mid-append; everything before it is intact.
+                app.logger.warning('journal.skip_invalid line=%s', line_no)
+                continue
+            if isinstance(op, dict):
+                ops.append(op)
+    return ops
+
+
+def apply_entry_ops(entries, ops):
+    positions = {entry.get('id'): index for index, entry in enumerate(entries)}
+    entries = list(entries)
+    deleted = set()
+    for op in ops:
+        if op.get('op') == 'put' and isinstance(op.get('entry'), dict):
+            entry = op['entry']
+            entry_id = entry.get('id')
+            deleted.discard(entry_id)
+            if entry_id in positions:
+                entries[positions[entry_id]] = entry
+            else:
+                positions[entry_id] = len(entries)
+                entries.append(entry)
+        elif op.get('op') == 'delete':
+            deleted.add(op.get('id'))
+    if deleted:
+        entries = [entry for entry in entries if entry.get('id') not in deleted]
+    return entries
+
+
+def append_entries_journal(*ops):
+    """Append journal records with a single fsync and one data_version bump for all of them."""
+    with _journal_lock:
+        with open(ENTRIES_JOURNAL_FILE, 'a', encoding='utf-8') as f:
+            f.write(''.join(json.dumps(op, ensure_ascii=False) + '\n' for op in ops))
+            f.flush()
+            os.fsync(f.fileno())
+        invalidate_snapshot(DATA_FILE)
+        version, changed_at = bump_data_version()
+        append_entry_changes([
+            (op['entry'].get('id') if op.get('op') == 'put' else op.get('id'), op.get('op') == 'delete')
+            for op in ops
+        ], version, changed_at)
+        if _journal_state['ops'] is None:
+            _journal_state['ops'] = len(read_entries_journal())
+        else:
+            _journal_state['ops'] += len(ops)
+        needs_compaction = (
+            _journal_state['ops'] >= JOURNAL_COMPACT_OPS
+            or os.path.getsize(ENTRIES_JOURNAL_FILE) >= JOURNAL_COMPACT_BYTES
+        )
+        if needs_compaction and not _journal_state['compacting']:
+            _journal_state['compacting'] = True
+            threading.Thread(target=compact_entries_journal, name='entries-compaction', daemon=True).start()
+
+
+# entries.changes: one line per entry write ({id, version, at, deleted}) that
+# feeds GET /api/entries?since=; only the newest line per id matters.
+def append_entry_changes(changes, version, changed_at):
+    """changes: (entry id, deleted) pairs written at the same data version."""
+    records = [
+        {'id': entry_id, 'version': version, 'at': changed_at, 'deleted': deleted}
+        for entry_id, deleted in changes
+    ]
+    with open(ENTRIES_CHANGES_FILE, 'a', encoding='utf-8') as f:
+        f.write(''.join(json.dumps(record) + '\n' for record in records))
+        f.flush()
+        os.fsync(f.fileno())
+    invalidate_snapshot(ENTRIES_CHANGES_FILE)
+
+
+def read_entry_changes():
+    """entry id -> newest change record."""
+    changes = {}
+    if not os.path.exists(ENTRIES_CHANGES_FILE):
+        return changes
+    with open(ENTRIES_CHANGES_FILE, 'r', encoding='utf-8') as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if isinstance(record, dict) and 'id' in record:
+                changes[record['id']] = record
+    return changes
+
+
+def compact_entry_changes():
+    """Rewrite entries.changes with only the newest record per entry."""
+    with _journal_lock:
+        changes = read_entry_changes()
+        with atomic_write(ENTRIES_CHANGES_FILE) as f:
+            for record in sorted(changes.values(), key=lambda item: item.get('version', 0)):
+                f.write(json.dumps(record) + '\n')
+        invalidate_snapshot(ENTRIES_CHANGES_FILE)
+
+
+def save_entry(entry):
+    """Persist a new or changed entry as a single journal record"""
+    append_entries_journal({'op': 'put', 'entry': entry})
+
+
+def save_entry_batch(entries):
+    """Persist several entries with one journal write"""
+    append_entries_journal(*({'op': 'put', 'entry': entry} for entry in entries))
+
+
+def remove_entry(entry_id):
+    """Persist an entry deletion as a single journal record"""
+    append_entries_journal({'op': 'delete', 'id': entry_id})
+
+
+def replace_entries(entries, bump_version=True):
+    """Write the full entry list to entries.json and drop the journal it supersedes.
+
+    Compaction passes bump_version=False: the entries are the same, so validators and
+    cached pages stay valid.
+    """
+    with _journal_lock:
+        save_entries(entries, bump_version)
+        # entries.json is durable now; replaying the old journal again would be harmless.
+        if os.path.exists(ENTRIES_JOURNAL_FILE):
+            with open(ENTRIES_JOURNAL_FILE, 'w', encoding='utf-8') as f:
+                f.flush()
+                os.fsync(f.fileno())
+        invalidate_snapshot(DATA_FILE)
+        _journal_state['ops'] = 0
+
+
+def compact_entries_journal():
+    """Fold entries.journal into entries.json and truncate the journal."""
+    try:
+        with _journal_lock:
+            if not os.path.exists(ENTRIES_JOURNAL_FILE):
+                return
+            entries = read_entries()
+            replace_entries(entries, bump_version=False)
+            if os.path.exists(ENTRIES_CHANGES_FILE):
+                compact_entry_changes()
+            app.logger.info('journal.compacted count=%s', len(entries))
+    except Exception:
+        app.logger.exception('journal.compact.failed')
+    finally:
+        _journal_state['compacting'] = False
+
+def load_pages(mutable=False):
     """Load pages from JSON file"""
+    pages = load_snapshot(PAGES_FILE, read_pages)
+    return copy.deepcopy(pages) if mutable else pages
+
+
+def read_pages():
     pages = load_json_file(PAGES_FILE, [])
     if not pages:
         return [
@@ -345,6 +768,15 @@ def load_pages():
     if not isinstance(pages, list):
         app.logger.error('pages.invalid type=%s', type(pages))
         return []
+    return [page for page in pages if isinstance(page, dict)]
+
+
+def migrate_pages():
+    """Drop imported CSV header rows and default the searchable flag."""
+    pages = load_json_file(PAGES_FILE, [])
+    if not isinstance(pages, list):
+        app.logger.error('pages.invalid type=%s', type(pages))
+        return False
     changed = False
     cleaned_pages = []
     for page in pages:
@@ -358,9 +790,8 @@ def load_pages():
             changed = True
         cleaned_pages.append(page)
     if changed:
-        pages = cleaned_pages
-        save_pages(pages)
-    return pages
+        save_pages(cleaned_pages)
+    return changed
 
 def save_pages(pages):
     """Save pages to JSON file"""
@@ -376,39 +807,74 @@ def normalize_profile_body(text):
         body = unescaped
     body = body.replace("\r\n", "\n").replace("\r", "\n")
     body = re.sub(r"&lt;\s*br\s*/?\s*&gt;", "\n", body, flags=re.IGNORECASE)
-    body = re.sub(r"<br\\s*/?>", "\n", body, flags=re.IGNORECASE)
+    body = re.sub(r"<br\s*/?>", "\n", body, flags=re.IGNORECASE)
     body = re.sub(r"</(p|h1|h2|h3|h4|h5|h6)>", "\n", body, flags=re.IGNORECASE)
     body = re.sub(r"<[^>]+>", "", body)
     body = re.sub(r"\n{3,}", "\n\n", body).strip()
     return body
 
-def load_profile():
+def load_profile(mutable=False):
+    profile = load_snapshot(PROFILE_FILE, read_profile)
+    return copy.deepcopy(profile) if mutable else profile
+
+
+def read_profile():
     data = load_json_file(PROFILE_FILE, {})
     if not isinstance(data, dict):
         return {'title': '', 'body': '', 'files': []}
+    return {
+        'title': data.get('title') or '',
+        'body': data.get('body') or '',
+        'files': data.get('files') if isinstance(data.get('files'), list) else []
+    }
+
+
+def migrate_profile():
+    """Unescape legacy HTML in the profile body and trim the title."""
+    data = load_json_file(PROFILE_FILE, {})
+    if not isinstance(data, dict):
+        data = {}
     profile = {
         'title': (data.get('title') or '').strip(),
         'body': normalize_profile_body(data.get('body', '')),
         'files': data.get('files') if isinstance(data.get('files'), list) else []
     }
-    if profile != data:
-        save_profile(profile)
-    return profile
+    if profile == data:
+        return False
+    save_profile(profile)
+    return True
 
-def save_profile(profile):
-    profile = {
+def build_profile_document(profile):
+    return {
         'title': profile.get('title', ''),
         'body': normalize_profile_body(profile.get('body', '')),
         'files': profile.get('files', [])
     }
-    save_json_file(PROFILE_FILE, profile)
 
 
-def load_terms():
+def save_profile(profile):
+    save_json_file(PROFILE_FILE, build_profile_document(profile))
+
+
+def load_terms(mutable=False):
+    terms = load_snapshot(TERMS_FILE, read_terms)
+    return copy.deepcopy(terms) if mutable else terms
+
+
+def read_terms():
     data = load_json_file(TERMS_FILE, {})
     if not isinstance(data, dict):
         return {'files': []}
     files = data.get('files')
+    return {'files': files if isinstance(files, list) else []}
+
+
+def migrate_terms():
+    """Rewrite terms files with names, descriptions and viewer URLs filled in."""
+    data = load_json_file(TERMS_FILE, {})
+    if not isinstance(data, dict):
+        data = {}
+    files = data.get('files')
     if not isinstance(files, list):
         files = []
     normalized_files = []
@@ -427,12 +893,13 @@ def load_terms():
             'url': f"/pdf/{filename}"
         })
     terms = {'files': normalized_files}
-    if terms != data:
-        save_terms(terms)
-    return terms
+    if terms == data:
+        return False
+    save_terms(terms)
+    return True
 
 
-def save_terms(terms):
+def build_terms_document(terms):
     files = terms.get('files')
     if not isinstance(files, list):
         files = []
@@ -451,7 +918,1302 @@ def save_terms(terms):
             'filename': filename,
             'url': f"/pdf/{filename}"
         })
-    save_json_file(TERMS_FILE, {'files': normalized_files})
+    return {'files': normalized_files}
+
+
+def save_terms(terms):
+    save_json_file(TERMS_FILE, build_terms_document(terms))
+
+
+def load_meta():
+    meta = load_json_file(META_FILE, {})
+    return meta if isinstance(meta, dict) else {}
+
+
+def save_meta(meta):
+    save_json_file(META_FILE, meta)
+
+
+# data_version in meta.json grows by one on every save of the JSON backend;
+# it drives ETag/Last-Modified validators for public pages and API reads.
+# All read-modify-write cycles on meta.json hold _meta_lock.
+_meta_lock = threading.Lock()
+
+
+def bump_data_version():
+    with _meta_lock:
+        meta = load_meta()
+        meta['data_version'] = int(meta.get('data_version', 0)) + 1
+        meta['data_modified_at'] = int(time.time())
+        save_meta(meta)
+    return meta['data_version'], meta['data_modified_at']
+
+
+def allocate_entry_id(floor, count=1):
+    """Reserve `count` consecutive entry ids from meta.json's counter and return the first.
+
+    Ids are never reused after deletes.
+    """
+    with _meta_lock:
+        meta = load_meta()
+        entry_id = max(int(meta.get('next_entry_id', 1)), floor)
+        meta['next_entry_id'] = entry_id + count
+        save_meta(meta)
+    return entry_id
+
+
+def reset_entry_changes():
+    """Start the change feed over after a wholesale rewrite; older `since` values get a full resync."""
+    with _journal_lock:
+        with _meta_lock:
+            meta = load_meta()
+            meta['changes_floor'] = int(meta.get('data_version', 0))
+            meta['changes_floor_at'] = int(meta.get('data_modified_at', 0))
+            save_meta(meta)
+        if os.path.exists(ENTRIES_CHANGES_FILE):
+            with open(ENTRIES_CHANGES_FILE, 'w', encoding='utf-8') as f:
+                f.flush()
+                os.fsync(f.fileno())
+        invalidate_snapshot(ENTRIES_CHANGES_FILE)
+
+
+def current_data_stamp():
+    meta = load_snapshot(META_FILE, load_meta)
+    return int(meta.get('data_version', 0)), int(meta.get('data_modified_at', 0))
+
+
+_migration_lock = threading.Lock()
+
+
+@contextmanager
+def migration_lock():
+    """Serialize migrations between threads and, via flock on MIGRATION_LOCK_FILE, between processes."""
+    with _migration_lock, open(MIGRATION_LOCK_FILE, 'a') as lock_file:
+        if fcntl is not None:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+
+def migrate_data(force=False):
+    """Normalize legacy records once and record the schema version.
+
+    Request handlers only read data; everything that used to be fixed up on
+    load (legacy pdf_file/label fields, escaped profile HTML, date-like AOP
+    numbers, entry order) is done here instead. Runs under migration_lock and
+    re-reads meta.json there, so only the first of several processes does the work.
+    """
+    with migration_lock():
+        return _migrate_data(force)
+
+
+def _migrate_data(force):
+    meta = load_meta()
+    if 'changes_floor' not in meta:
+        # Entries written before the change feed existed have no change records.
+        reset_entry_changes()
+    current = meta.get('schema_version', 0)
+    if not force and current >= SCHEMA_VERSION:
+        return False
+    compact_entries_journal()
+    changed = {
+        'entries': migrate_entries(),
+        'pages': migrate_pages(),
+        'profile': migrate_profile(),
+        'terms': migrate_terms(),
+    }
+    if changed['entries']:
+        reset_entry_changes()
+    # The migration bumped data_version while saving; don't overwrite it.
+    meta = load_meta()
+    meta['schema_version'] = SCHEMA_VERSION
+    meta['migrated_at'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    save_meta(meta)
+    app.logger.info('data.migrate from=%s to=%s changed=%s', current, SCHEMA_VERSION,
+                    ','.join(name for name, value in changed.items() if value) or 'none')
+    return True
+
+
+@app.cli.command('migrate-data')
+@click.option('--force', is_flag=True, help='Re-run the migration even if the schema is current.')
+def migrate_data_command(force):
+    """Upgrade entries/pages/profile/terms to the current schema."""
+    if migrate_data(force=force):
+        click.echo(f'Data migrated to schema version {SCHEMA_VERSION}.')
+    else:
+        click.echo(f'Data already at schema version {SCHEMA_VERSION}.')
+
+
+_data_prepared = False
+
+
+def prepare_data():
+    """Migrate the data once per process before it is served; a no-op after the first call."""
+    global _data_prepared
+    if _data_prepared:
+        return
+    meta = load_snapshot(META_FILE, load_meta)
+    if meta.get('schema_version', 0) < SCHEMA_VERSION or 'changes_floor' not in meta:
+        migrate_data()
+    _data_prepared = True
+
+
+# Importing the module (CLI, copy-storage, each server worker) never touches the data files;
+# the first request of a process migrates them if `flask migrate-data` has not been run.
+@app.before_request
+def prepare_data_before_request():
+    prepare_data()
+
+
+class JsonRepository:
+    """Storage backed by the JSON documents and entries.journal."""
+
+    name = 'json'
+
+    def list_entries(self, page_id=None, offset=0, limit=None):
+        entry_store.ensure_current(self)
+        return entry_store.list(page_id, offset, limit)
+
+    def get_entry(self, entry_id):
+        entry_store.ensure_current(self)
+        return entry_store.get(entry_id)
+
+    def iter_entries(self, page_id=None):
+        entry_store.ensure_current(self)
+        return iter(entry_store.list(page_id))
+
+    def count_entries(self, page_id=None):
+        entry_store.ensure_current(self)
+        return entry_store.count(page_id)
+
+    def page_counts(self):
+        entry_store.ensure_current(self)
+        return entry_store.counts()
+
+    def entry_ids(self, page_id):
+        entry_store.ensure_current(self)
+        return entry_store.ids(page_id)
+
+    def existing_duplicates(self, keys):
+        """The subset of entry_duplicate_key() values that stored entries already have."""
+        entry_store.ensure_current(self)
+        return entry_store.existing_duplicates(keys)
+
+    def entries_version(self):
+        return (file_signature(DATA_FILE), file_signature(ENTRIES_JOURNAL_FILE))
+
+    def data_stamp(self):
+        return current_data_stamp()
+
+    def entry_changes(self, since_version=None, since_time=None):
+        """(changed entries, deleted ids) after a version or timestamp; None when a full resync is needed.
+
+        Writers publish the new data_version and append its change records under _journal_lock,
+        so reading under the same lock sees the records of every version already published.
+        """
+        with _journal_lock:
+            meta = load_snapshot(META_FILE, load_meta)
+            if since_version is not None and since_version < int(meta.get('changes_floor', 0)):
+                return None
+            if since_time is not None and since_time < int(meta.get('changes_floor_at', 0)):
+                return None
+            entry_store.ensure_current(self)
+            records = list(load_snapshot(ENTRIES_CHANGES_FILE, read_entry_changes).values())
+        changed, deleted = [], []
+        for record in sorted(records, key=lambda item: item.get('version', 0)):
+            if since_version is not None and record.get('version', 0) <= since_version:
+                continue
+            # Timestamps have one-second resolution, so the boundary second is sent again.
+            if since_time is not None and record.get('at', 0) < since_time:
+                continue
+            entry = None if record.get('deleted') else entry_store.get(record['id'])
+            if entry is None:
+                deleted.append(record['id'])
+            else:
+                changed.append(entry)
+        return changed, deleted
+
+    def next_entry_id(self, count=1):
+        entry_store.ensure_current(self)
+        return allocate_entry_id(entry_store.max_id() + 1, count)
+
+    def save_entry(self, entry):
+        save_entry(entry)
+        notify_entry_change(self, entry['id'], entry)
+
+    def save_entries(self, entries):
+        if not entries:
+            return
+        save_entry_batch(entries)
+        for entry in entries:
+            notify_entry_change(self, entry['id'], entry)
+
+    def delete_entry(self, entry_id):
+        remove_entry(entry_id)
+        notify_entry_change(self, entry_id, None)
+
+    def replace_entries(self, entries):
+        replace_entries(list(entries))
+        reset_entry_changes()
+
+    def list_pages(self, mutable=False):
+        return load_pages(mutable=mutable)
+
+    def save_pages(self, pages):
+        save_pages(pages)
+
+    def load_profile(self, mutable=False):
+        return load_profile(mutable=mutable)
+
+    def save_profile(self, profile):
+        save_profile(profile)
+
+    def load_terms(self, mutable=False):
+        return load_terms(mutable=mutable)
+
+    def save_terms(self, terms):
+        save_terms(terms)
+
+
+class SqliteRepository:
+    """Storage in a single SQLite database (WAL mode) with indexed entry columns.
+
+    Entries keep their full JSON document in the data column; the columns next
+    to it exist only for lookups and ordering.
+    """
+
+    name = 'sqlite'
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS entries (
+            id INTEGER PRIMARY KEY,
+            page_id INTEGER NOT NULL DEFAULT 0,
+            date TEXT NOT NULL DEFAULT '',
+            publish_date TEXT NOT NULL DEFAULT '',
+            aop_number TEXT NOT NULL DEFAULT '',
+            internal_number TEXT NOT NULL DEFAULT '',
+            sort_key TEXT NOT NULL DEFAULT '',
+            data TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_entries_page ON entries (page_id, sort_key, id);
+        CREATE INDEX IF NOT EXISTS idx_entries_sort ON entries (sort_key, id);
+        CREATE INDEX IF NOT EXISTS idx_entries_date ON entries (date);
+        CREATE INDEX IF NOT EXISTS idx_entries_publish_date ON entries (publish_date);
+        CREATE INDEX IF NOT EXISTS idx_entries_aop ON entries (aop_number);
+        CREATE INDEX IF NOT EXISTS idx_entries_internal ON entries (internal_number);
+        CREATE TABLE IF NOT EXISTS pages (
+            position INTEGER NOT NULL,
+            id INTEGER PRIMARY KEY,
+            data TEXT NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS documents (
+            name TEXT PRIMARY KEY,
+            data TEXT NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS meta (
+            key TEXT PRIMARY KEY,
+            value INTEGER NOT NULL
+        );
+        INSERT OR IGNORE INTO meta (key, value) VALUES ('data_version', 0);
+        INSERT OR IGNORE INTO meta (key, value) VALUES ('data_modified_at', 0);
+        INSERT OR IGNORE INTO meta (key, value) VALUES ('next_entry_id', 1);
+        CREATE TABLE IF NOT EXISTS entry_changes (
+            id INTEGER PRIMARY KEY,
+            version INTEGER NOT NULL,
+            changed_at INTEGER NOT NULL,
+            deleted INTEGER NOT NULL DEFAULT 0
+        );
+        CREATE INDEX IF NOT EXISTS idx_entry_changes_version ON entry_changes (version);
+        INSERT OR IGNORE INTO meta (key, value) SELECT 'changes_floor', value FROM meta WHERE key = 'data_version';
+        INSERT OR IGNORE INTO meta (key, value) SELECT 'changes_floor_at', value FROM meta WHERE key = 'data_modified_at';
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._local = threading.local()
+        self._cache_lock = threading.Lock()
+        self._entries_cache = None
+        with self.connect() as conn:
+            conn.executescript(self.SCHEMA)
+
+    def connect(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            self._local.conn = conn
+        return conn
+
+    def data_version(self):
+        row = self.connect().execute("SELECT value FROM meta WHERE key = 'data_version'").fetchone()
+        return row[0] if row else 0
+
+    def entries_version(self):
+        return self.data_version()
+
+    def data_stamp(self):
+        rows = dict(self.connect().execute(
+            "SELECT key, value FROM meta WHERE key IN ('data_version', 'data_modified_at')"
+        ).fetchall())
+        return rows.get('data_version', 0), rows.get('data_modified_at', 0)
+
+    def _bump_version(self, conn):
+        changed_at = int(time.time())
+        conn.execute("UPDATE meta SET value = value + 1 WHERE key = 'data_version'")
+        conn.execute("UPDATE meta SET value = ? WHERE key = 'data_modified_at'", (changed_at,))
+        row = conn.execute("SELECT value FROM meta WHERE key = 'data_version'").fetchone()
+        return row[0], changed_at
+
+    @staticmethod
+    def _record_change(conn, entry_id, stamp, deleted):
+        conn.execute(
+            'INSERT OR REPLACE INTO entry_changes (id, version, changed_at, deleted) VALUES (?, ?, ?, ?)',
+            (entry_id, stamp[0], stamp[1], int(deleted))
+        )
+
+    def entry_changes(self, since_version=None, since_time=None):
+        """(changed entries, deleted ids) after a version or timestamp; None when a full resync is needed."""
+        conn = self.connect()
+        meta = dict(conn.execute(
+            "SELECT key, value FROM meta WHERE key IN ('changes_floor', 'changes_floor_at')"
+        ).fetchall())
+        if since_version is not None and since_version < meta.get('changes_floor', 0):
+            return None
+        if since_time is not None and since_time < meta.get('changes_floor_at', 0):
+            return None
+        rows = conn.execute(
+            'SELECT c.id, e.data FROM entry_changes c LEFT JOIN entries e ON e.id = c.id '
+            'WHERE c.version > ? AND c.changed_at >= ? ORDER BY c.version',
+            (-1 if since_version is None else since_version, 0 if since_time is None else since_time)
+        ).fetchall()
+        changed = [json.loads(data) for _, data in rows if data is not None]
+        deleted = [entry_id for entry_id, data in rows if data is None]
+        return changed, deleted
+
+    @staticmethod
+    def entry_columns(entry):
+        sort_date, entry_id = entry_sort_key(entry)
+        return (
+            entry_id,
+            int(entry.get('page_id') or 0),
+            entry.get('date') or '',
+            entry.get('publish_date') or '',
+            entry.get('aop_number') or '',
+            entry.get('internal_number') or '',
+            sort_date.isoformat(sep=' ', timespec='seconds'),
+            json.dumps(entry, ensure_ascii=False),
+        )
+
+    def _insert_entries(self, conn, entries):
+        conn.executemany(
+            'INSERT OR REPLACE INTO entries '
+            '(id, page_id, date, publish_date, aop_number, internal_number, sort_key, data) '
+            'VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+            [self.entry_columns(entry) for entry in entries]
+        )
+
+    def list_entries(self, page_id=None, offset=0, limit=None):
+        if page_id is not None or offset or limit is not None:
+            where = 'WHERE page_id = ?' if page_id is not None else ''
+            params = [page_id] if page_id is not None else []
+            params.extend([-1 if limit is None else limit, offset])
+            rows = self.connect().execute(
+                f'SELECT data FROM entries {where} ORDER BY sort_key DESC, id DESC LIMIT ? OFFSET ?', params
+            ).fetchall()
+            return [json.loads(row[0]) for row in rows]
+        version = self.data_version()
+        with self._cache_lock:
+            if self._entries_cache and self._entries_cache[0] == version:
+                return self._entries_cache[1]
+        rows = self.connect().execute('SELECT data FROM entries ORDER BY sort_key DESC, id DESC').fetchall()
+        entries = [json.loads(row[0]) for row in rows]
+        with self._cache_lock:
+            self._entries_cache = (version, entries)
+        return entries
+
+    def iter_entries(self, page_id=None):
+        """Yield entries newest first straight from the cursor, so exports never hold the full list."""
+        where, params = ('WHERE page_id = ?', [page_id]) if page_id is not None else ('', [])
+        # A dedicated connection keeps the open cursor independent of writes on this thread.
+        conn = sqlite3.connect(self.path, timeout=30)
+        try:
+            for (data,) in conn.execute(f'SELECT data FROM entries {where} ORDER BY sort_key DESC, id DESC', params):
+                yield json.loads(data)
+        finally:
+            conn.close()
+
+    def get_entry(self, entry_id):
+        row = self.connect().execute('SELECT data FROM entries WHERE id = ?', (entry_id,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def count_entries(self, page_id=None):
+        if page_id is None:
+            row = self.connect().execute('SELECT COUNT(*) FROM entries').fetchone()
+        else:
+            row = self.connect().execute('SELECT COUNT(*) FROM entries WHERE page_id = ?', (page_id,)).fetchone()
+        return row[0]
+
+    def page_counts(self):
+        rows = self.connect().execute('SELECT page_id, COUNT(*) FROM entries GROUP BY page_id').fetchall()
+        return dict(rows)
+
+    def existing_duplicates(self, keys):
+        # Titles compare casefolded, which SQLite cannot do for non-ASCII text, so only the
+        # pages involved are read (via the page_id index) and compared here.
+        keys = set(keys)
+        found = set()
+        for page_id in {key[0] for key in keys}:
+            found.update(key for key in map(entry_duplicate_key, self.iter_entries(page_id)) if key in keys)
+        return found
+
+    def entry_ids(self, page_id):
+        rows = self.connect().execute('SELECT id FROM entries WHERE page_id = ?', (page_id,)).fetchall()
+        return {row[0] for row in rows}
+
+    def next_entry_id(self, count=1):
+        # The UPDATE takes the write lock first, so concurrent callers never get the same ids.
+        with self.connect() as conn:
+            conn.execute(
+                "UPDATE meta SET value = MAX(value, COALESCE((SELECT MAX(id) FROM entries), 0) + 1) + ? "
+                "WHERE key = 'next_entry_id'", (count,)
+            )
+            row = conn.execute("SELECT value FROM meta WHERE key = 'next_entry_id'").fetchone()
+        return row[0] - count
+
+    def save_entry(self, entry):
+        with self.connect() as conn:
+            self._insert_entries(conn, [entry])
+            self._record_change(conn, entry['id'], self._bump_version(conn), False)
+        notify_entry_change(self, entry['id'], entry)
+
+    def save_entries(self, entries):
+        if not entries:
+            return
+        with self.connect() as conn:
+            self._insert_entries(conn, entries)
+            stamp = self._bump_version(conn)
+            for entry in entries:
+                self._record_change(conn, entry['id'], stamp, False)
+        for entry in entries:
+            notify_entry_change(self, entry['id'], entry)
+
+    def delete_entry(self, entry_id):
+        with self.connect() as conn:
+            conn.execute('DELETE FROM entries WHERE id = ?', (entry_id,))
+            self._record_change(conn, entry_id, self._bump_version(conn), True)
+        notify_entry_change(self, entry_id, None)
+
+    def replace_entries(self, entries):
+        with self.connect() as conn:
+            conn.execute('DELETE FROM entries')
+            self._insert_entries(conn, entries)
+            version, changed_at = self._bump_version(conn)
+            # Start the change feed over; older `since` values get a full resync.
+            conn.execute('DELETE FROM entry_changes')
+            conn.execute("UPDATE meta SET value = ? WHERE key = 'changes_floor'", (version,))
+            conn.execute("UPDATE meta SET value = ? WHERE key = 'changes_floor_at'", (changed_at,))
+
+    def list_pages(self, mutable=False):
+        rows = self.connect().execute('SELECT data FROM pages ORDER BY position').fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def save_pages(self, pages):
+        with self.connect() as conn:
+            conn.execute('DELETE FROM pages')
+            conn.executemany(
+                'INSERT INTO pages (position, id, data) VALUES (?, ?, ?)',
+                [(position, page['id'], json.dumps(page, ensure_ascii=False)) for position, page in enumerate(pages)]
+            )
+            self._bump_version(conn)
+        app.logger.info('data.save backend=sqlite table=pages count=%s', len(pages))
+
+    def load_document(self, name, default):
+        row = self.connect().execute('SELECT data FROM documents WHERE name = ?', (name,)).fetchone()
+        return json.loads(row[0]) if row else default
+
+    def save_document(self, name, payload):
+        with self.connect() as conn:
+            conn.execute(
+                'INSERT OR REPLACE INTO documents (name, data) VALUES (?, ?)',
+                (name, json.dumps(payload, ensure_ascii=False))
+            )
+            self._bump_version(conn)
+        app.logger.info('data.save backend=sqlite document=%s', name)
+
+    def load_profile(self, mutable=False):
+        return self.load_document('profile', {'title': '', 'body': '', 'files': []})
+
+    def save_profile(self, profile):
+        self.save_document('profile', build_profile_document(profile))
+
+    def load_terms(self, mutable=False):
+        return self.load_document('terms', {'files': []})
+
+    def save_terms(self, terms):
+        self.save_document('terms', build_terms_document(terms))
+
+
+# Derived in-memory structures (search index, ...) that want single-entry
+# deltas instead of a full rebuild after each admin write.
+_entry_listeners = []
+
+
+def notify_entry_change(repo, entry_id, entry):
+    """Tell derived structures that entry_id was saved (entry) or deleted (None)."""
+    for listener in _entry_listeners:
+        try:
+            listener(repo, entry_id, entry)
+        except Exception:
+            app.logger.exception('entries.listener.failed listener=%s', listener)
+
+
+class EntryStore:
+    """In-memory index of the JSON backend's entries.
+
+    Holds an id -> record map plus (sort_key, id) keys kept ascending, both
+    overall and per page, so point lookups are O(1) and single-entry changes
+    are a bisect insert/remove instead of a full re-sort. Sort keys and
+    duplicate keys are computed once per entry when it is added.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self.version = None
+        self.order = []
+        self.keys = {}
+        self.members = {}
+        self.entries = {}
+        self.entry_keys = {}
+        self.duplicate_counts = {}
+
+    def _add(self, entry):
+        entry_id = entry.get('id')
+        page_id = entry.get('page_id')
+        key = entry_sort_key(entry)
+        duplicate_key = entry_duplicate_key(entry)
+        insort(self.order, key)
+        insort(self.keys.setdefault(page_id, []), key)
+        self.members.setdefault(page_id, set()).add(entry_id)
+        self.entries[entry_id] = entry
+        self.entry_keys[entry_id] = (page_id, key, duplicate_key)
+        self.duplicate_counts[duplicate_key] = self.duplicate_counts.get(duplicate_key, 0) + 1
+
+    @staticmethod
+    def _discard_key(keys, key):
+        position = bisect_left(keys, key)
+        if position < len(keys) and keys[position] == key:
+            del keys[position]
+
+    def _remove(self, entry_id):
+        self.entries.pop(entry_id, None)
+        located = self.entry_keys.pop(entry_id, None)
+        if located is None:
+            return
+        page_id, key, duplicate_key = located
+        self._discard_key(self.order, key)
+        self._discard_key(self.keys.get(page_id, []), key)
+        self.members.get(page_id, set()).discard(entry_id)
+        if self.duplicate_counts.get(duplicate_key, 0) > 1:
+            self.duplicate_counts[duplicate_key] -= 1
+        else:
+            self.duplicate_counts.pop(duplicate_key, None)
+
+    def ensure_current(self, repo):
+        version = repo.entries_version()
+        if self.version is not None and self.version == version:
+            return
+        entries = load_entries()
+        with self._lock:
+            self.order = []
+            self.keys = {}
+            self.members = {}
+            self.entries = {}
+            self.entry_keys = {}
+            self.duplicate_counts = {}
+            for entry in entries:
+                self._add(entry)
+            self.version = version
+        app.logger.info('entry_store.rebuild entries=%s pages=%s', len(entries), len(self.keys))
+
+    def apply_change(self, repo, entry_id, entry):
+        with self._lock:
+            if self.version is None or repo.name != 'json':
+                return
+            self._remove(entry_id)
+            if entry is not None:
+                self._add(entry)
+            self.version = repo.entries_version()
+
+    def get(self, entry_id):
+        with self._lock:
+            return self.entries.get(entry_id)
+
+    def list(self, page_id=None, offset=0, limit=None):
+        with self._lock:
+            keys = self.order if page_id is None else self.keys.get(page_id, [])
+            end = len(keys) - offset
+            start = 0 if limit is None else max(0, end - limit)
+            return [self.entries[entry_id] for _, entry_id in reversed(keys[start:max(end, 0)])]
+
+    def count(self, page_id=None):
+        with self._lock:
+            if page_id is None:
+                return len(self.order)
+            return len(self.keys.get(page_id, []))
+
+    def counts(self):
+        with self._lock:
+            return {page_id: len(keys) for page_id, keys in self.keys.items() if keys}
+
+    def ids(self, page_id):
+        with self._lock:
+            return set(self.members.get(page_id, ()))
+
+    def max_id(self):
+        with self._lock:
+            return max(self.entries, default=0)
+
+    def existing_duplicates(self, keys):
+        with self._lock:
+            return {key for key in keys if key in self.duplicate_counts}
+
+
+entry_store = EntryStore()
+_entry_listeners.append(entry_store.apply_change)
+
+
+STORAGE_BACKENDS = {
+    'json': lambda: JsonRepository(),
+    'sqlite': lambda: SqliteRepository(app.config['SQLITE_PATH']),
+}
+_repositories = {}
+_repositories_lock = threading.Lock()
+
+
+def get_repository(backend=None):
+    """Return the (process-wide) repository for backend, defaulting to STORAGE_BACKEND."""
+    backend = backend or app.config['STORAGE_BACKEND']
+    if backend not in STORAGE_BACKENDS:
+        raise ValueError(f'Unknown storage backend: {backend}')
+    with _repositories_lock:
+        if backend not in _repositories:
+            _repositories[backend] = STORAGE_BACKENDS[backend]()
+        return _repositories[backend]
+
+
+@app.cli.command('copy-storage')
+@click.option('--from', 'source', type=click.Choice(sorted(STORAGE_BACKENDS)), required=True)
+@click.option('--to', 'target', type=click.Choice(sorted(STORAGE_BACKENDS)), required=True)
+def copy_storage_command(source, target):
+    """Copy entries, pages, profile and terms from one storage backend to another."""
+    if source == target:
+        raise click.BadParameter('source and target must differ')
+    src = get_repository(source)
+    dst = get_repository(target)
+    entries = src.list_entries()
+    dst.replace_entries(entries)
+    dst.save_pages(src.list_pages())
+    dst.save_profile(src.load_profile())
+    dst.save_terms(src.load_terms())
+    app.logger.info('storage.copy from=%s to=%s entries=%s', source, target, len(entries))
+    click.echo(f'Copied {len(entries)} entries from {source} to {target}.')
+
+
+SEARCH_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+# Stress marks are sometimes typed over Bulgarian vowels ("ѝ", "а̀"); they must not split or change words.
+SEARCH_STRIP_MARKS = {'\u0300', '\u0301'}
+
+
+def normalize_search_text(value):
+    text = unicodedata.normalize('NFD', value or '')
+    text = ''.join(ch for ch in text if ch not in SEARCH_STRIP_MARKS)
+    return unicodedata.normalize('NFC', text).casefold()
+
+
+def tokenize_search_text(value):
+    return SEARCH_TOKEN_RE.findall(normalize_search_text(value))
+
+
+def entry_search_text(entry):
+    parts = [
+        entry.get('title', ''),
+        entry.get('heading', ''),
+        entry.get('aop_number', ''),
+        entry.get('publish_date', ''),
+        entry.get('internal_number', ''),
+        entry.get('content', ''),
+    ]
+    for f in entry.get('files', []) or []:
+        if isinstance(f, dict):
+            parts.extend([f.get('name', ''), f.get('url', ''), f.get('published_at', '')])
+    return ' '.join(str(part or '') for part in parts)
+
+
+class SearchIndex:
+    """Inverted index token -> entry ids with prefix lookup over a sorted token list.
+
+    Built from the repository on first use (or when the stored entries or the
+    extracted attachment text changed behind our back) and patched per entry by
+    admin writes afterwards.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self.version = None
+        self.text_stamp = None
+        self.postings = {}
+        self.tokens = []
+        self.entry_tokens = {}
+        self.title_tokens = {}
+        self.sort_keys = {}
+        self.entries = {}
+
+    def _add(self, entry):
+        entry_id = entry.get('id')
+        text = f"{entry_search_text(entry)} {attachment_texts.entry_text(entry)}"
+        tokens = set(tokenize_search_text(text))
+        self.entry_tokens[entry_id] = tokens
+        self.title_tokens[entry_id] = set(tokenize_search_text(f"{entry.get('title', '')} {entry.get('heading', '')}"))
+        self.sort_keys[entry_id] = entry_sort_key(entry)
+        self.entries[entry_id] = entry
+        for token in tokens:
+            ids = self.postings.get(token)
+            if ids is None:
+                self.postings[token] = {entry_id}
+                insort(self.tokens, token)
+            else:
+                ids.add(entry_id)
+
+    def _remove(self, entry_id):
+        self.entries.pop(entry_id, None)
+        self.title_tokens.pop(entry_id, None)
+        self.sort_keys.pop(entry_id, None)
+        for token in self.entry_tokens.pop(entry_id, ()):
+            ids = self.postings.get(token)
+            if ids is None:
+                continue
+            ids.discard(entry_id)
+            if not ids:
+                del self.postings[token]
+                position = bisect_left(self.tokens, token)
+                if position < len(self.tokens) and self.tokens[position] == token:
+                    del self.tokens[position]
+
+    def rebuild(self, repo):
+        version = repo.entries_version()
+        # Read before the text files, so text stored during the rebuild triggers another one.
+        text_stamp = attachment_texts.stamp()
+        entries = repo.list_entries()
+        with self._lock:
+            self.postings = {}
+            self.tokens = []
+            self.entry_tokens = {}
+            self.title_tokens = {}
+            self.sort_keys = {}
+            self.entries = {}
+            for entry in entries:
+                self._add(entry)
+            self.version = version
+            self.text_stamp = text_stamp
+        app.logger.info('search.index.rebuild entries=%s tokens=%s', len(entries), len(self.tokens))
+
+    def ensure_current(self, repo):
+        if (self.version is None or self.version != repo.entries_version()
+                or self.text_stamp != attachment_texts.stamp()):
+            self.rebuild(repo)
+
+    def apply_change(self, repo, entry_id, entry):
+        with self._lock:
+            if self.version is None:
+                return
+            self._remove(entry_id)
+            if entry is not None:
+                self._add(entry)
+            self.version = repo.entries_version()
+
+    def prefix_ids(self, prefix):
+        ids = set()
+        position = bisect_left(self.tokens, prefix)
+        while position < len(self.tokens) and self.tokens[position].startswith(prefix):
+            ids |= self.postings[self.tokens[position]]
+            position += 1
+        return ids
+
+    def search(self, query, candidates=None):
+        """Return entries matching every query token (as a word prefix), best first.
+
+        Entries whose title/heading contains a term rank above those that only
+        match in content or files; ties go to the newest entry. candidates
+        optionally restricts the search to a set of entry ids (e.g. one page).
+        """
+        terms = sorted(set(tokenize_search_text(query)), key=len, reverse=True)
+        if not terms:
+            return []
+        with self._lock:
+            matched = candidates
+            # Rarest-looking (longest) terms first keeps the running intersection small.
+            for term in terms:
+                ids = self.prefix_ids(term)
+                matched = ids if matched is None else matched & ids
+                if not matched:
+                    return []
+            ranked = []
+            for entry_id in matched:
+                title_tokens = self.title_tokens.get(entry_id, ())
+                title_hits = sum(1 for term in terms if any(token.startswith(term) for token in title_tokens))
+                ranked.append(((title_hits, self.sort_keys[entry_id]), self.entries[entry_id]))
+        ranked.sort(key=lambda item: item[0], reverse=True)
+        return [entry for _, entry in ranked]
+
+
+SEARCH_DEFAULT_LIMIT = 50
+SEARCH_MAX_LIMIT = 200
+SEARCH_SNIPPET_RADIUS = 80
+
+
+def parse_int_arg(name, default, minimum=0, maximum=None):
+    raw = request.args.get(name, '')
+    try:
+        value = int(raw)
+    except (TypeError, ValueError):
+        return default
+    value = max(minimum, value)
+    return min(value, maximum) if maximum is not None else value
+
+
+def project_entry(entry, fields):
+    if not fields:
+        return entry
+    projected = {'id': entry.get('id')}
+    for field in fields:
+        if field in entry:
+            projected[field] = entry[field]
+    return projected
+
+
+def build_search_snippet(entry, query):
+    """Short HTML-escaped excerpt around the first match, with matches wrapped in <mark>."""
+    terms = sorted(set(tokenize_search_text(query)), key=len, reverse=True)
+    if not terms:
+        return ''
+    pattern = re.compile(r"\b(" + "|".join(re.escape(term) for term in terms) + r")\w*", re.IGNORECASE)
+    texts = [entry.get('content') or '', entry.get('title') or '', entry.get('heading') or '']
+    for text in texts + attachment_texts.entry_texts(entry):
+        text = normalize_text(text)
+        match = pattern.search(text)
+        if not match:
+            continue
+        start = max(0, match.start() - SEARCH_SNIPPET_RADIUS)
+        end = min(len(text), match.end() + SEARCH_SNIPPET_RADIUS)
+        excerpt = text[start:end]
+        parts = []
+        last = 0
+        for hit in pattern.finditer(excerpt):
+            parts.append(html.escape(excerpt[last:hit.start()]))
+            parts.append(f"<mark>{html.escape(hit.group(0))}</mark>")
+            last = hit.end()
+        parts.append(html.escape(excerpt[last:]))
+        prefix = '…' if start > 0 else ''
+        suffix = '…' if end < len(text) else ''
+        return f"{prefix}{''.join(parts)}{suffix}"
+    return ''
+
+
+search_index = SearchIndex()
+_entry_listeners.append(search_index.apply_change)
+
+
+def is_plain_filename(name):
+    return bool(name) and name == os.path.basename(name) and name not in ('.', '..')
+
+
+def entry_upload_files(entry):
+    """Local upload filenames referenced by an entry's pdf_files."""
+    names = (extract_local_pdf_filename(item) for item in entry.get('pdf_files') or [])
+    return {name for name in names if is_plain_filename(name)}
+
+
+def document_upload_files(document):
+    """Local upload filenames referenced by the profile or terms document."""
+    names = (extract_local_pdf_filename(item) for item in document.get('files') or [] if isinstance(item, dict))
+    return {name for name in names if is_plain_filename(name)}
+
+
+class UploadRefs:
+    """Reference counts of files in uploads/ across entries, the profile and terms.
+
+    Entry references are counted once from the repository and patched per entry
+    by admin writes; the profile and terms are small and read on demand.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self.version = None
+        self.counts = {}
+        self.entry_files = {}
+
+    def _add(self, entry):
+        files = entry_upload_files(entry)
+        self.entry_files[entry.get('id')] = files
+        for name in files:
+            self.counts[name] = self.counts.get(name, 0) + 1
+
+    def _remove(self, entry_id):
+        for name in self.entry_files.pop(entry_id, ()):
+            self.counts[name] -= 1
+            if not self.counts[name]:
+                del self.counts[name]
+
+    def rebuild(self, repo):
+        version = repo.entries_version()
+        with self._lock:
+            self.counts = {}
+            self.entry_files = {}
+            for entry in repo.iter_entries():
+                self._add(entry)
+            self.version = version
+        app.logger.info('uploads.refs.rebuild files=%s', len(self.counts))
+
+    def ensure_current(self, repo):
+        if self.version is None or self.version != repo.entries_version():
+            self.rebuild(repo)
+
+    def apply_change(self, repo, entry_id, entry):
+        with self._lock:
+            if self.version is None:
+                return
+            self._remove(entry_id)
+            if entry is not None:
+                self._add(entry)
+            self.version = repo.entries_version()
+
+    def document_files(self, repo):
+        return ({PROFILE_LOGO_FILENAME} | document_upload_files(repo.load_profile())
+                | document_upload_files(repo.load_terms()))
+
+    def count(self, repo, filename):
+        self.ensure_current(repo)
+        with self._lock:
+            entries = self.counts.get(filename, 0)
+        return entries + (1 if filename in self.document_files(repo) else 0)
+
+    def referenced(self, repo):
+        self.ensure_current(repo)
+        with self._lock:
+            names = set(self.counts)
+        return names | self.document_files(repo)
+
+
+upload_refs = UploadRefs()
+_entry_listeners.append(upload_refs.apply_change)
+
+# Unreferenced blobs (and abandoned .part files) younger than this are left alone, so an
+# upload that is stored but not yet saved into its record is never collected.
+UPLOAD_GC_GRACE_SECONDS = 600
+
+
+class UploadCollector:
+    """Background garbage collector for content-addressed uploads nobody references."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.state = {'running': False, 'pending': False}
+
+    def schedule(self):
+        with self.lock:
+            if self.state['running']:
+                self.state['pending'] = True
+                return
+            self.state['running'] = True
+        threading.Thread(target=self._loop, name='uploads-gc', daemon=True).start()
+
+    def _loop(self):
+        while True:
+            try:
+                self.collect(get_repository())
+            except Exception:
+                app.logger.exception('uploads.gc_failed')
+            with self.lock:
+                if not self.state['pending']:
+                    self.state['running'] = False
+                    return
+                self.state['pending'] = False
+
+    def collect(self, repo, grace_seconds=UPLOAD_GC_GRACE_SECONDS):
+        """Remove unreferenced blobs and stale part files; returns (files removed, bytes freed)."""
+        start = perf_counter()
+        referenced = upload_refs.referenced(repo) | upload_sessions.finished_blobs()
+        upload_sessions.expire(time.time() - UPLOAD_SESSION_TTL_SECONDS)
+        cutoff = time.time() - grace_seconds
+        removed = freed = 0
+        for name in os.listdir(app.config['UPLOAD_FOLDER']):
+            if not name.endswith('.part') and (not BLOB_NAME_RE.match(name) or name in referenced):
+                continue
+            path = os.path.join(app.config['UPLOAD_FOLDER'], name)
+            # save_blob() takes the same lock, so a blob being deduplicated right now is either
+            # touched before this check or recreated after the removal.
+            with _blob_lock:
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                if stat.st_mtime > cutoff:
+                    continue
+                if not name.endswith('.part') and (upload_refs.count(repo, name)
+                                                    or name in upload_sessions.finished_blobs()):
+                    continue
+                os.remove(path)
+            if not name.endswith('.part'):
+                attachment_texts.discard(name)
+            removed += 1
+            freed += stat.st_size
+        app.logger.info('uploads.gc removed=%s freed=%s duration=%.3fs', removed, freed, perf_counter() - start)
+        return removed, freed
+
+
+upload_collector = UploadCollector()
+
+
+def release_uploads(repo, filenames):
+    """Drop files no record references any more.
+
+    Legacy uploads are deleted right away; content-addressed blobs are left to the
+    background collector so a concurrent upload of the same content stays safe.
+    """
+    collect = False
+    for filename in set(filenames):
+        if not is_plain_filename(filename) or upload_refs.count(repo, filename):
+            continue
+        if BLOB_NAME_RE.match(filename):
+            collect = True
+            continue
+        path = os.path.join(app.config['UPLOAD_FOLDER'], filename)
+        if os.path.isfile(path):
+            os.remove(path)
+            attachment_texts.discard(filename)
+            app.logger.info('uploads.delete filename=%s', filename)
+    if collect:
+        upload_collector.schedule()
+
+
+@app.cli.command('gc-uploads')
+@click.option('--grace', type=int, default=UPLOAD_GC_GRACE_SECONDS, show_default=True,
+              help='Keep unreferenced blobs younger than this many seconds.')
+def gc_uploads_command(grace):
+    """Delete content-addressed uploads that no entry, profile or terms file references."""
+    removed, freed = upload_collector.collect(get_repository(), grace)
+    click.echo(f'Removed {removed} files ({freed} bytes).')
+
+
+# Extracted text is capped per file so one huge attachment cannot bloat the search index.
+TEXT_EXTRACT_MAX_CHARS = 200000
+WORD_NAMESPACE = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+
+
+def extract_pdf_text(path, max_chars):
+    reader = PdfReader(path)
+    if reader.is_encrypted:
+        reader.decrypt('')
+    parts = []
+    total = 0
+    for page in reader.pages:
+        text = page.extract_text() or ''
+        parts.append(text)
+        total += len(text)
+        if total >= max_chars:
+            break
+    return '\n'.join(parts)[:max_chars]
+
+
+def extract_docx_text(path, max_chars):
+    """Paragraph text of word/document.xml, streamed so large documents stop at max_chars."""
+    parts = []
+    total = 0
+    with zipfile.ZipFile(path) as archive, archive.open('word/document.xml') as document:
+        for _, elem in ElementTree.iterparse(document):
+            if elem.tag == f'{WORD_NAMESPACE}t' and elem.text:
+                parts.append(elem.text)
+                total += len(elem.text)
+            elif elem.tag == f'{WORD_NAMESPACE}tab':
+                parts.append('\t')
+            elif elem.tag in (f'{WORD_NAMESPACE}p', f'{WORD_NAMESPACE}br'):
+                parts.append('\n')
+                if elem.tag == f'{WORD_NAMESPACE}p':
+                    elem.clear()
+            if total >= max_chars:
+                break
+    return ''.join(parts)[:max_chars]
+
+
+# Legacy binary .doc files are not extracted.
+TEXT_EXTRACTORS = {'docx': extract_docx_text}
+# Blob extensions (see BLOB_NAME_RE) that may share a content hash with a legacy upload.
+TEXT_BLOB_EXTENSIONS = ('pdf', 'doc', 'docx')
+if PdfReader is not None:
+    TEXT_EXTRACTORS['pdf'] = extract_pdf_text
+
+
+class AttachmentTexts:
+    """Text of PDF/DOCX uploads, kept in uploads/.text/<sha256>.txt for the search index.
+
+    New blobs are queued from save_blob() and extracted on a small thread pool, so
+    uploads and the mirror never wait for it; files the search index finds without
+    text (older uploads) are queued the same way. Text is keyed by content hash, so
+    identical files are extracted once and unchanged files are skipped. Legacy
+    uploads are hashed once; their hashes are kept in uploads/.text/legacy.json.
+    stamp() is read from the directory itself, so every process sees the same value
+    and it survives restarts; the search index rebuilds when it changes.
+    """
+
+    def __init__(self, directory):
+        self.directory = directory
+        self.lock = threading.Lock()
+        self.executor = None
+        self.pending = set()
+        self.hashes = None
+        self.hashes_signature = None
+
+    def _path(self, sha256):
+        return os.path.join(self.directory, f'{sha256}.txt')
+
+    def _legacy_hashes(self):
+        """Legacy upload filename -> sha256, reloaded when another process rewrote it; call with self.lock held."""
+        path = os.path.join(self.directory, 'legacy.json')
+        signature = file_signature(path)
+        if self.hashes is None or signature != self.hashes_signature:
+            hashes = load_json_file(path, {})
+            self.hashes = hashes if isinstance(hashes, dict) else {}
+            self.hashes_signature = signature
+        return self.hashes
+
+    def _save_legacy_hashes(self):
+        os.makedirs(self.directory, exist_ok=True)
+        path = os.path.join(self.directory, 'legacy.json')
+        with atomic_write(path, fsync=False) as f:
+            json.dump(self.hashes, f)
+        self.hashes_signature = file_signature(path)
+
+    def _sha256(self, filename):
+        if BLOB_NAME_RE.match(filename):
+            return filename.split('.', 1)[0]
+        with self.lock:
+            return self._legacy_hashes().get(filename)
+
+    def stamp(self):
+        """(version, modified_at) of the stored text.
+
+        Every text file and legacy.json is written by rename (or removed) inside the
+        directory, which moves its mtime, so this changes with any stored text.
+        """
+        try:
+            stat = os.stat(self.directory)
+        except OSError:
+            return 0, 0
+        return stat.st_mtime_ns, int(stat.st_mtime)
+
+    def schedule(self, filename):
+        if not is_plain_filename(filename) or get_file_extension(filename) not in TEXT_EXTRACTORS:
+            return
+        with self.lock:
+            if filename in self.pending:
+                return
+            self.pending.add(filename)
+            if self.executor is None:
+                self.executor = ThreadPoolExecutor(max_workers=app.config['TEXT_EXTRACT_WORKERS'],
+                                                   thread_name_prefix='text-extract')
+        self.executor.submit(self._run, filename)
+
+    def _run(self, filename):
+        try:
+            self.extract(filename)
+        except Exception:
+            app.logger.exception('text.extract_failed filename=%s', filename)
+        finally:
+            with self.lock:
+                self.pending.discard(filename)
+
+    def extract(self, filename, force=False):
+        """Extract and store the text of one upload unless its content was seen before.
+
+        Returns True when text is stored for the file. Unreadable files store empty text
+        so they are not retried; force re-extracts.
+        """
+        extractor = TEXT_EXTRACTORS.get(get_file_extension(filename))
+        path = os.path.join(app.config['UPLOAD_FOLDER'], filename)
+        if extractor is None or not os.path.isfile(path):
+            return False
+        known = self._sha256(filename)
+        sha256 = known or file_sha256(path)
+        text_path = self._path(sha256)
+        if force or not os.path.isfile(text_path):
+            start = perf_counter()
+            try:
+                text = extractor(path, TEXT_EXTRACT_MAX_CHARS)
+            except Exception as exc:
+                app.logger.warning('text.extract_failed filename=%s error=%s', filename, exc)
+                text = ''
+            os.makedirs(self.directory, exist_ok=True)
+            with atomic_write(text_path, fsync=False) as f:
+                f.write(text)
+            app.logger.info('text.extract filename=%s chars=%s duration=%.3fs',
+                            filename, len(text), perf_counter() - start)
+        if not known and not BLOB_NAME_RE.match(filename):
+            with self.lock:
+                self._legacy_hashes()[filename] = sha256
+                self._save_legacy_hashes()
+        return True
+
+    def text(self, filename):
+        """Stored text of an upload; queues extraction and returns '' when there is none yet."""
+        sha256 = self._sha256(filename)
+        if sha256:
+            try:
+                with open(self._path(sha256), 'r', encoding='utf-8') as f:
+                    return f.read()
+            except FileNotFoundError:
+                pass
+        self.schedule(filename)
+        return ''
+
+    def entry_texts(self, entry):
+        return [text for text in (self.text(name) for name in sorted(entry_upload_files(entry))) if text]
+
+    def entry_text(self, entry):
+        return ' '.join(self.entry_texts(entry))
+
+    def discard(self, filename):
+        """Forget the text of a deleted upload, unless another file with the same content still uses it."""
+        sha256 = self._sha256(filename)
+        with self.lock:
+            hashes = self._legacy_hashes()
+            if hashes.pop(filename, None):
+                self._save_legacy_hashes()
+            shared = sha256 in hashes.values()
+        if not sha256 or shared:
+            return
+        blob_names = (f'{sha256}.{ext}' for ext in TEXT_BLOB_EXTENSIONS)
+        if any(os.path.isfile(os.path.join(app.config['UPLOAD_FOLDER'], name)) for name in blob_names):
+            return
+        if os.path.isfile(self._path(sha256)):
+            os.remove(self._path(sha256))
+
+
+attachment_texts = AttachmentTexts(os.path.join(app.config['UPLOAD_FOLDER'], '.text'))
+
+
+@app.cli.command('extract-text')
+@click.option('--force', is_flag=True, help='Extract again even when text for the content is stored.')
+def extract_text_command(force):
+    """Extract searchable text from every referenced PDF/DOCX upload."""
+    repo = get_repository()
+    names = sorted(upload_refs.referenced(repo))
+    extracted = sum(1 for name in names if attachment_texts.extract(name, force))
+    click.echo(f'Stored text for {extracted} of {len(names)} files.')
+
 
 CREDENTIALS_FILE = 'cred.json'
 
@@ -499,11 +2261,176 @@ def requires_admin(f):
     return decorated
 
 
+def check_not_modified(extra_stamp=None):
+    """Return a 304 response when the client's validators match the current data version.
+
+    Otherwise remember the validators so log_request can attach them to the
+    full response. Call before any rendering or serialization work.
+    extra_stamp is an optional (version, modified_at) pair for responses that also
+    depend on data outside the repository (e.g. extracted attachment text).
+    """
+    version, modified_at = get_repository().data_stamp()
+    g.data_version = version
+    variant = hashlib.sha1(request.full_path.encode('utf-8')).hexdigest()[:12]
+    etag = f"v{version}-{variant}"
+    if extra_stamp:
+        extra_version, extra_modified_at = extra_stamp
+        etag = f"{etag}-x{extra_version}"
+        modified_at = max(modified_at or 0, extra_modified_at or 0)
+    last_modified = datetime.fromtimestamp(modified_at, timezone.utc) if modified_at else None
+    g.validators = (etag, last_modified)
+    if request.if_none_match:
+        not_modified = request.if_none_match.contains(etag)
+    elif request.if_modified_since and last_modified:
+        not_modified = last_modified <= request.if_modified_since
+    else:
+        not_modified = False
+    if not not_modified:
+        return None
+    return Response(status=304)
+
+
+class RenderCache:
+    """Rendered index pages keyed by (page, cursor, data version).
+
+    Entries from an older data version are dropped as soon as a newer one is
+    seen, so admin writes invalidate the cache without any explicit hook.
+    After a write, schedule_prewarm re-renders the first chunk of every page
+    in a background thread so visitors get prebuilt bytes.
+    """
+
+    def __init__(self, max_items, directory=''):
+        self.max_items = max_items
+        self.directory = directory
+        self.version = None
+        self.items = OrderedDict()
+        self.lock = threading.Lock()
+        self.stats = {'hits': 0, 'disk_hits': 0, 'misses': 0}
+        self.prewarm_state = {'running': False, 'pending': False}
+
+    def _path(self, version, key):
+        page_id, cursor = key
+        return os.path.join(self.directory, f'v{version}', f'{page_id or "main"}-{cursor}.html')
+
+    def _set_version(self, version):
+        """Switch to version if it is newer; returns whether version is the current one.
+
+        A request or prewarm still working on an older version must not drop the newer cache.
+        """
+        if self.version is not None and version <= self.version:
+            return version == self.version
+        self.version = version
+        self.items.clear()
+        if self.directory and os.path.isdir(self.directory):
+            for name in os.listdir(self.directory):
+                if name != f'v{version}':
+                    shutil.rmtree(os.path.join(self.directory, name), ignore_errors=True)
+        return True
+
+    def get(self, version, key):
+        with self.lock:
+            if not self._set_version(version):
+                self.stats['misses'] += 1
+                return None
+            body = self.items.get(key)
+            if body is not None:
+                self.items.move_to_end(key)
+                self.stats['hits'] += 1
+                return body
+        if self.directory:
+            try:
+                with open(self._path(version, key), 'rb') as f:
+                    body = f.read()
+            except OSError:
+                body = None
+            if body is not None:
+                self._remember(version, key, body)
+                with self.lock:
+                    self.stats['disk_hits'] += 1
+                return body
+        with self.lock:
+            self.stats['misses'] += 1
+        return None
+
+    def _remember(self, version, key, body):
+        with self.lock:
+            if not self._set_version(version):
+                return False
+            self.items[key] = body
+            self.items.move_to_end(key)
+            while len(self.items) > self.max_items:
+                self.items.popitem(last=False)
+        return True
+
+    def contains(self, version, key):
+        with self.lock:
+            if self.version == version and key in self.items:
+                return True
+        return bool(self.directory) and key[1] == 0 and os.path.isfile(self._path(version, key))
+
+    def put(self, version, key, body):
+        # Only first chunks go to disk; deeper cursors are rarely requested twice.
+        if not self._remember(version, key, body) or not self.directory or key[1] != 0:
+            return
+        path = self._path(version, key)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with atomic_write(path, binary=True, fsync=False) as f:
+                f.write(body)
+        except OSError:
+            app.logger.warning('render_cache.disk_write_failed path=%s', path)
+
+    def schedule_prewarm(self):
+        with self.lock:
+            if self.prewarm_state['running']:
+                self.prewarm_state['pending'] = True
+                return
+            self.prewarm_state['running'] = True
+        threading.Thread(target=self._prewarm_loop, name='render-prewarm', daemon=True).start()
+
+    def _prewarm_loop(self):
+        while True:
+            try:
+                self.prewarm()
+            except Exception:
+                app.logger.exception('render_cache.prewarm_failed')
+            with self.lock:
+                if not self.prewarm_state['pending']:
+                    self.prewarm_state['running'] = False
+                    return
+                self.prewarm_state['pending'] = False
+
+    def prewarm(self):
+        start = perf_counter()
+        repo = get_repository()
+        version = repo.data_stamp()[0]
+        page_ids = [None] + [page.get('id') for page in repo.list_pages()]
+        rendered = 0
+        for page_id in page_ids:
+            if self.contains(version, (page_id, 0)):
+                continue
+            path = '/' if page_id is None else f'/?page={page_id}'
+            with app.test_request_context(path):
+                self.put(version, (page_id, 0), render_index(repo, page_id, 0))
+            rendered += 1
+        app.logger.info('render_cache.prewarm version=%s pages=%s rendered=%s duration=%.3fs',
+                        version, len(page_ids), rendered, perf_counter() - start)
+
+    def info(self):
+        with self.lock:
+            return {'version': self.version, 'items': len(self.items), **self.stats}
+
+
+render_cache = RenderCache(app.config['RENDER_CACHE_SIZE'], app.config['RENDER_CACHE_DIR'])
+
+
 @app.route('/')
 def index():
     """Main page showing all entries"""
+    not_modified = check_not_modified()
+    if not_modified:
+        return not_modified
     page_arg = request.args.get('page')
-    is_main_page = page_arg is None
     page_id = None
     if page_arg is not None:
         try:
@@ -511,32 +2438,74 @@ def index():
         except:
             page_id = 1
 
-    entries = load_entries()
-    pages = load_pages()
-    profile = load_profile()
-    terms = load_terms()
+    cursor = parse_int_arg('cursor', 0)
+
+    key = (page_id, cursor)
+    body = render_cache.get(g.data_version, key)
+    if body is None:
+        body = render_index(get_repository(), page_id, cursor)
+        render_cache.put(g.data_version, key, body)
+    return Response(body, mimetype='text/html')
+
+
+def render_index(repo, page_id, cursor):
+    """Render index.html for a page (None for the main page) as UTF-8 bytes."""
+    is_main_page = page_id is None
+    pages = repo.list_pages()
+    profile = repo.load_profile()
+    terms = repo.load_terms()
     profile_logo_url = None
     logo_path = os.path.join(app.config['UPLOAD_FOLDER'], PROFILE_LOGO_FILENAME)
     if os.path.isfile(logo_path):
         profile_logo_url = url_for('uploaded_file', filename=PROFILE_LOGO_FILENAME)
 
-    # Filter entries by page when a page is selected. Otherwise show all.
-    if page_id is None:
-        page_entries = entries
-    else:
-        page_entries = [e for e in entries if e.get('page_id') == page_id]
-    app.logger.info('index page_id=%s entries=%s', page_id or 'all', len(page_entries))
+    # The main page only shows the profile; a selected page shows its newest
+    # entries and main.js pulls older ones from /api/panels on scroll.
+    page_entries, next_cursor = [], None
+    if not is_main_page:
+        page_entries, next_cursor = list_entry_chunk(repo, page_id, cursor)
+    app.logger.info('index page_id=%s cursor=%s entries=%s', page_id or 'all', cursor, len(page_entries))
 
     return render_template(
         'index.html',
         entries=page_entries,
+        next_cursor=next_cursor,
         pages=pages,
+        page_counts=repo.page_counts(),
         current_page=page_id,
         is_main_page=is_main_page,
         profile=profile,
         terms=terms,
         profile_logo_url=profile_logo_url
-    )
+    ).encode('utf-8')
+
+def list_entry_chunk(repo, page_id, cursor, limit=INDEX_PAGE_SIZE):
+    """Return (entries, next_cursor) for one chunk of a page; next_cursor is None at the end."""
+    # Ask for one extra entry to learn whether another chunk follows.
+    entries = repo.list_entries(page_id, offset=cursor, limit=limit + 1)
+    if len(entries) > limit:
+        return entries[:limit], cursor + limit
+    return entries, None
+
+
+@app.route('/api/panels')
+def get_entry_panels():
+    """Rendered panel HTML for the next chunk of a page (lazy loading on the public index)"""
+    not_modified = check_not_modified()
+    if not_modified:
+        return not_modified
+    try:
+        page_id = int(request.args.get('page', ''))
+    except ValueError:
+        return jsonify({'success': False, 'error': 'Missing page'}), 400
+    cursor = parse_int_arg('cursor', 0)
+    entries, next_cursor = list_entry_chunk(get_repository(), page_id, cursor)
+    return jsonify({
+        'success': True,
+        'html': render_template('_entry_panels.html', entries=entries),
+        'count': len(entries),
+        'next_cursor': next_cursor
+    })
 
 @app.route('/page/<int:page_id>')
 def page_view(page_id):
@@ -572,12 +2541,15 @@ def admin():
     """Admin page for managing entries"""
     if not is_session_auth():
         return redirect(url_for('admin_login', next=request.full_path))
-    entries = load_entries()
-    pages = load_pages()
-    profile = load_profile()
-    terms = load_terms()
+    repo = get_repository()
+    entries = repo.list_entries()
+    pages = repo.list_pages()
+    profile = repo.load_profile()
+    terms = repo.load_terms()
     app.logger.info('admin.view user=%s', session.get('admin_user'))
-    return render_template('admin.html', entries=entries, pages=pages, profile=profile, terms=terms)
+    return render_template('admin.html', entries=entries, pages=pages, profile=profile, terms=terms,
+                           page_counts=repo.page_counts(), max_entry_files=MAX_PDF_FILES,
+                           max_profile_files=MAX_PROFILE_PDF_FILES, max_terms_files=MAX_TERMS_FILES)
 
 
 @app.route('/logout', methods=['GET', 'POST'])
@@ -595,15 +2567,157 @@ def logout():
 @app.route('/api/entries', methods=['GET'])
 @requires_admin
 def get_entries():
-    """API endpoint to get all entries"""
-    entries = load_entries()
-    return jsonify(entries)
+    """API endpoint to get all entries, or with ?since=<version> / ?since_time=<epoch> only the changes"""
+    not_modified = check_not_modified()
+    if not_modified:
+        return not_modified
+    repo = get_repository()
+    if 'since' not in request.args and 'since_time' not in request.args:
+        return jsonify(repo.list_entries())
+    try:
+        since_version = int(request.args['since']) if 'since' in request.args else None
+        since_time = int(request.args['since_time']) if 'since_time' in request.args else None
+    except ValueError:
+        return jsonify({'success': False, 'error': 'since and since_time must be integers'}), 400
+    # Read the stamp first: entry_changes() then includes at least every write up to that version,
+    # so a write racing with this request is sent again next time, never lost.
+    version, modified_at = repo.data_stamp()
+    changes = None
+    if since_version is None or since_version <= version:
+        changes = repo.entry_changes(since_version, since_time)
+    if changes is None:
+        entries, deleted, full = repo.list_entries(), [], True
+    else:
+        (entries, deleted), full = changes, False
+    app.logger.info('entries.feed since=%s since_time=%s full=%s changed=%s deleted=%s',
+                    since_version, since_time, full, len(entries), len(deleted))
+    return jsonify({
+        'success': True,
+        'version': version,
+        'modified_at': modified_at,
+        'full': full,
+        'entries': entries,
+        'deleted': deleted,
+    })
+
+
+@app.route('/api/entries/<int:entry_id>', methods=['GET'])
+@requires_admin
+def get_entry(entry_id):
+    """API endpoint to get a single entry (admin edit form)"""
+    not_modified = check_not_modified()
+    if not_modified:
+        return not_modified
+    entry = get_repository().get_entry(entry_id)
+    if not entry:
+        return jsonify({'success': False, 'error': 'Entry not found'}), 404
+    return jsonify({'success': True, 'entry': entry})
+
+
+def render_admin_entry(entry):
+    """Admin list row for one entry, so admin.js can patch the list in place."""
+    return render_template('_admin_entry_item.html', entry=entry, pages=get_repository().list_pages())
+
+EXPORT_CHUNK_BYTES = 64 * 1024
+
+
+def parse_export_range(date_from, date_to):
+    """Inclusive (start, end) dates for YYYY-MM-DD bounds; raises ValueError on bad input."""
+    start = datetime.strptime(date_from, '%Y-%m-%d').date() if date_from else None
+    end = datetime.strptime(date_to, '%Y-%m-%d').date() if date_to else None
+    return start, end
+
+
+# Imported entries carry DD.MM.YYYY publish dates; the admin form sends YYYY-MM-DD.
+PUBLISH_DATE_FORMATS = ('%d.%m.%Y', '%Y-%m-%d')
+
+
+def parse_publish_date(value):
+    for fmt in PUBLISH_DATE_FORMATS:
+        try:
+            return datetime.strptime((value or '').strip(), fmt).date()
+        except ValueError:
+            continue
+    return None
+
+
+def filter_published(entries, start, end):
+    """Entries whose publish_date is within [start, end]; without bounds every entry passes."""
+    if start is None and end is None:
+        yield from entries
+        return
+    for entry in entries:
+        published = parse_publish_date(entry.get('publish_date'))
+        if published and (start is None or published >= start) and (end is None or published <= end):
+            yield entry
+
+
+def export_entry_chunks(entries, compress=False):
+    """NDJSON bytes for an entry iterator, in ~EXPORT_CHUNK_BYTES pieces (gzip-compressed if asked)."""
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31) if compress else None
+    buffer, size = [], 0
+    for entry in entries:
+        line = (json.dumps(entry, ensure_ascii=False) + '\n').encode('utf-8')
+        buffer.append(line)
+        size += len(line)
+        if size >= EXPORT_CHUNK_BYTES:
+            chunk = b''.join(buffer)
+            buffer, size = [], 0
+            chunk = compressor.compress(chunk) if compressor else chunk
+            if chunk:
+                yield chunk
+    chunk = b''.join(buffer)
+    if compressor:
+        chunk = compressor.compress(chunk) + compressor.flush()
+    if chunk:
+        yield chunk
+
+
+@app.route('/api/entries/export', methods=['GET'])
+@requires_admin
+def export_entries():
+    """Stream entries as NDJSON (one per line, newest first) with optional page/date filters"""
+    page_id = request.args.get('page', type=int)
+    try:
+        start, end = parse_export_range(request.args.get('from'), request.args.get('to'))
+    except ValueError:
+        return jsonify({'success': False, 'error': 'from and to must be YYYY-MM-DD dates'}), 400
+    compress = request.args.get('gzip') in ('1', 'true') or request.accept_encodings['gzip'] > 0
+    entries = filter_published(get_repository().iter_entries(page_id), start, end)
+    app.logger.info('entries.export page_id=%s from=%s to=%s gzip=%s',
+                    page_id, request.args.get('from'), request.args.get('to'), compress)
+    response = Response(stream_with_context(export_entry_chunks(entries, compress)),
+                        mimetype='application/x-ndjson')
+    response.headers['Content-Disposition'] = 'attachment; filename=entries.ndjson'
+    response.headers['Vary'] = 'Accept-Encoding'
+    if compress:
+        response.headers['Content-Encoding'] = 'gzip'
+    return response
+
+
+@app.cli.command('export-entries')
+@click.option('--output', '-o', default='-', help='Target file ("-" for stdout).')
+@click.option('--page', 'page_id', type=int, default=None, help='Only entries of this page id.')
+@click.option('--from', 'date_from', default=None, help='Earliest publish date (YYYY-MM-DD).')
+@click.option('--to', 'date_to', default=None, help='Latest publish date (YYYY-MM-DD).')
+@click.option('--gzip', 'compress', is_flag=True, help='Gzip the output.')
+def export_entries_command(output, page_id, date_from, date_to, compress):
+    """Write entries as NDJSON without building the whole document in memory."""
+    try:
+        start, end = parse_export_range(date_from, date_to)
+    except ValueError:
+        raise click.BadParameter('--from/--to must be YYYY-MM-DD dates')
+    entries = filter_published(get_repository().iter_entries(page_id), start, end)
+    with click.open_file(output, 'wb') as f:
+        for chunk in export_entry_chunks(entries, compress):
+            f.write(chunk)
+
 
 @app.route('/api/entries', methods=['POST'])
 @requires_admin
 def add_entry():
     """API endpoint to add a new entry with optional PDF"""
-    entries = load_entries()
+    repo = get_repository()
     
     # Handle multipart form data
     title = normalize_text(request.form.get('title', ''))
@@ -624,24 +2738,27 @@ def add_entry():
     if not title or page_id <= 0:
         return jsonify({'success': False, 'error': 'Missing required fields'}), 400
     
-    # Handle file upload
+    # Handle file upload (multipart files and/or finished chunked uploads)
     pdf_items = []
     files = request.files.getlist('pdf_files')
-    if len([f for f in files if f and f.filename]) > MAX_PDF_FILES:
+    uploads = read_upload_ids(request.form.get('upload_ids'))
+    total_files = len([f for f in files if f and f.filename]) + len(uploads)
+    if total_files > MAX_PDF_FILES:
         return jsonify({'success': False, 'error': f'Maximum {MAX_PDF_FILES} files allowed'}), 400
-    total_files = len([f for f in files if f and f.filename])
     label_index = 1
     for file in files:
         if not file or file.filename == '':
             continue
         if not allowed_file(file.filename):
             return jsonify({'success': False, 'error': 'Only PDF or Word files allowed'}), 400
-        pdf_filename = build_upload_filename(file.filename)
-        save_path = os.path.join(app.config['UPLOAD_FOLDER'], pdf_filename)
-        file.save(save_path)
-        label = build_pdf_label(pdf_label, label_index, total_files)
+        pdf_filename = store_upload(file)
+        label = build_pdf_label(pdf_label, label_index, total_files) or file.filename
         pdf_items.append({'filename': pdf_filename, 'label': label})
         label_index += 1
+    for upload in uploads:
+        label = build_pdf_label(pdf_label, label_index, total_files) or upload['name']
+        pdf_items.append({'filename': upload['blob'], 'label': label})
+        label_index += 1
 
     files_list = []
     if files_raw:
@@ -670,7 +2787,7 @@ def add_entry():
             pdf_links.append({'name': label, 'url': f"/pdf/{filename}", 'filename': filename})
 
     new_entry = {
-        'id': max([e['id'] for e in entries], default=0) + 1,
+        'id': repo.next_entry_id(),
         'title': title,
         'heading': heading,
         'aop_number': aop_number,
@@ -687,42 +2804,145 @@ def add_entry():
     }
     cleanup_entry_fields(new_entry)
     
-    entries.append(new_entry)
-    save_entries(entries)
+    repo.save_entry(new_entry)
+    for upload in uploads:
+        upload_sessions.discard(upload['id'])
     app.logger.info('entries.add id=%s page_id=%s pdfs=%s', new_entry.get('id'), page_id, len(pdf_links))
 
-    return jsonify({'success': True, 'entry': new_entry})
+    return jsonify({'success': True, 'entry': new_entry, 'html': render_admin_entry(new_entry)})
+
+
+BULK_MAX_ITEMS = 1000
+
+
+def entry_duplicate_key(entry):
+    """(page_id, title, publish_date or heading), the same identity as duplicate_key() in the Wayback importer.
+
+    Titles compare casefolded and whitespace-normalized, dates whitespace-normalized.
+    """
+    return (
+        int(entry.get('page_id') or 0),
+        normalize_for_compare(entry.get('title') or ''),
+        normalize_text(entry.get('publish_date') or entry.get('heading') or ''),
+    )
+
+
+def entry_from_payload(item, page_ids):
+    """Build an entry (without id) from one bulk item; returns (entry, error)."""
+    if not isinstance(item, dict):
+        return None, 'Item must be an object'
+    title = normalize_text(str(item.get('title') or ''))
+    page_id_raw = str(item.get('page_id') or '').strip()
+    page_id = int(page_id_raw) if page_id_raw.isdigit() else 0
+    if not title or page_id <= 0:
+        return None, 'Missing required fields'
+    if page_id not in page_ids:
+        return None, f'Unknown page {page_id}'
+    files_list = item.get('files') if isinstance(item.get('files'), list) else []
+    pdf_links = item.get('pdf_files', item.get('pdf_links'))
+    entry = {
+        'title': title,
+        'heading': normalize_text(str(item.get('heading') or '')),
+        'aop_number': str(item.get('aop_number') or ''),
+        'publish_date': str(item.get('publish_date') or ''),
+        'start_date': str(item.get('start_date') or ''),
+        'internal_number': str(item.get('internal_number') or ''),
+        'content': str(item.get('content') or ''),
+        'files': normalize_incoming_files(files_list),
+        'pdf_files': normalize_incoming_pdf_links(pdf_links if isinstance(pdf_links, list) else []),
+        'source_url': str(item.get('source_url') or ''),
+        'imported_at': str(item.get('imported_at') or ''),
+        'page_id': page_id,
+    }
+    cleanup_entry_fields(entry)
+    return entry, None
+
+
+def read_bulk_items():
+    """Bulk request body as a list: a JSON array, or NDJSON (one object per line).
+
+    Unparseable NDJSON lines are returned as None and reported as invalid.
+    """
+    if request.mimetype in ('application/x-ndjson', 'application/jsonl'):
+        items = []
+        for line in request.get_data(as_text=True).splitlines():
+            if not line.strip():
+                continue
+            try:
+                items.append(json.loads(line))
+            except json.JSONDecodeError:
+                items.append(None)
+        return items
+    items = request.get_json(silent=True)
+    return items if isinstance(items, list) else None
+
+
+@app.route('/api/entries/bulk', methods=['POST'])
+@requires_admin
+def add_entries_bulk():
+    """Validate and create many entries with one storage commit (JSON array or NDJSON body)"""
+    items = read_bulk_items()
+    if items is None:
+        return jsonify({'success': False, 'error': 'Expected a JSON array or NDJSON body'}), 400
+    if len(items) > BULK_MAX_ITEMS:
+        return jsonify({'success': False, 'error': f'Maximum {BULK_MAX_ITEMS} entries per request'}), 400
+
+    repo = get_repository()
+    page_ids = {page.get('id') for page in repo.list_pages()}
+    parsed = [entry_from_payload(item, page_ids) for item in items]
+    seen = repo.existing_duplicates({entry_duplicate_key(entry) for entry, error in parsed if not error})
+    results, accepted = [], []
+    for index, (entry, error) in enumerate(parsed):
+        if error:
+            results.append({'index': index, 'status': 'invalid', 'error': error})
+            continue
+        key = entry_duplicate_key(entry)
+        if key in seen:
+            results.append({'index': index, 'status': 'duplicate'})
+            continue
+        seen.add(key)
+        results.append({'index': index, 'status': 'created'})
+        accepted.append((results[-1], entry))
+
+    if accepted:
+        first_id = repo.next_entry_id(len(accepted))
+        now = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        for offset, (result, entry) in enumerate(accepted):
+            entry['id'] = first_id + offset
+            entry['date'] = now
+            result['id'] = entry['id']
+        repo.save_entries([entry for _, entry in accepted])
+
+    counts = {status: sum(1 for r in results if r['status'] == status) for status in ('created', 'duplicate', 'invalid')}
+    app.logger.info('entries.bulk items=%s created=%s duplicate=%s invalid=%s',
+                    len(items), counts['created'], counts['duplicate'], counts['invalid'])
+    return jsonify({'success': True, 'results': results, **counts})
+
 
 @app.route('/api/entries/<int:entry_id>', methods=['DELETE'])
 @requires_admin
 def delete_entry(entry_id):
     """API endpoint to delete an entry"""
-    entries = load_entries()
-    
-    # Find and delete associated PDF file
-    for entry in entries:
-        if entry['id'] == entry_id and entry.get('pdf_files'):
-            for pdf_item in entry.get('pdf_files', []):
-                pdf_name = extract_local_pdf_filename(pdf_item)
-                if not pdf_name:
-                    continue
-                pdf_path = os.path.join(app.config['UPLOAD_FOLDER'], pdf_name)
-                if os.path.exists(pdf_path):
-                    os.remove(pdf_path)
-                    app.logger.info('entries.delete.pdf filename=%s', pdf_name)
-            break
-    
-    entries = [e for e in entries if e['id'] != entry_id]
-    save_entries(entries)
+    repo = get_repository()
+    entry = repo.get_entry(entry_id)
+    if not entry:
+        return jsonify({'success': False, 'error': 'Entry not found'}), 404
+    repo.delete_entry(entry_id)
     app.logger.info('entries.delete id=%s', entry_id)
+    # Attached files go only once nothing else references them.
+    release_uploads(repo, entry_upload_files(entry))
 
-    return jsonify({'success': True})
+    return jsonify({'success': True, 'id': entry_id})
 
 @app.route('/api/entries/<int:entry_id>', methods=['PUT'])
 @requires_admin
 def update_entry(entry_id):
     """API endpoint to update an entry"""
-    entries = load_entries()
+    repo = get_repository()
+    existing = repo.get_entry(entry_id)
+    if not existing:
+        return jsonify({'success': False, 'error': 'Entry not found'}), 404
+    previous_files = entry_upload_files(existing)
     
     # Handle both JSON and form data
     if request.is_json:
@@ -740,6 +2960,8 @@ def update_entry(entry_id):
         source_url = data.get('source_url', '')
         imported_at = data.get('imported_at', '')
         page_id = data.get('page_id', 1)
+        pdf_items = []
+        uploads = []
     else:
         title = request.form.get('title', '')
         heading = request.form.get('heading', '')
@@ -774,87 +2996,659 @@ def update_entry(entry_id):
         page_id = int(request.form.get('page_id', 1))
         pdf_label = request.form.get('pdf_label', '').strip()
         
-        # Handle file upload
+        # Handle file upload (multipart files and/or finished chunked uploads)
         pdf_items = []
         files = request.files.getlist('pdf_files')
-        existing_count = 0
-        for entry in entries:
-            if entry['id'] == entry_id:
-                existing_count = len(entry.get('pdf_files', []))
-                break
-        incoming_count = len([f for f in files if f and f.filename])
+        uploads = read_upload_ids(request.form.get('upload_ids'))
+        existing_count = len(existing.get('pdf_files', [])) if existing else 0
+        incoming_count = len([f for f in files if f and f.filename]) + len(uploads)
         if existing_count + incoming_count > MAX_PDF_FILES:
             return jsonify({'success': False, 'error': f'Maximum {MAX_PDF_FILES} files allowed'}), 400
-        total_files = len([f for f in files if f and f.filename])
+        total_files = incoming_count
         label_index = 1
         for file in files:
             if not file or file.filename == '':
                 continue
             if not allowed_file(file.filename):
                 return jsonify({'success': False, 'error': 'Only PDF or Word files allowed'}), 400
-            pdf_filename = build_upload_filename(file.filename)
-            save_path = os.path.join(app.config['UPLOAD_FOLDER'], pdf_filename)
-            file.save(save_path)
-            label = build_pdf_label(pdf_label, label_index, total_files)
+            pdf_filename = store_upload(file)
+            label = build_pdf_label(pdf_label, label_index, total_files) or file.filename
             pdf_items.append({'filename': pdf_filename, 'label': label})
             label_index += 1
+        for upload in uploads:
+            label = build_pdf_label(pdf_label, label_index, total_files) or upload['name']
+            pdf_items.append({'filename': upload['blob'], 'label': label})
+            label_index += 1
     
-    for entry in entries:
-        if entry['id'] == entry_id:
-            # Delete old PDF if new one is uploaded
-            entry['title'] = title
-            entry['heading'] = heading
-            entry['aop_number'] = aop_number
-            entry['publish_date'] = publish_date
-            entry['start_date'] = start_date
-            entry['internal_number'] = internal_number
-            entry['content'] = content
-            entry['files'] = files_list
-            if pdf_links_provided:
-                entry['pdf_files'] = pdf_links
-            entry['source_url'] = source_url
-            entry['imported_at'] = imported_at
-            entry['page_id'] = page_id
-            if pdf_items:
-                for item in pdf_items:
-                    filename = item.get('filename')
-                    label = item.get('label') or filename
-                    if filename:
-                        entry['pdf_files'] = (entry.get('pdf_files') or []) + [
-                            {'name': label, 'url': f"/pdf/{filename}", 'filename': filename}
-                        ]
-            cleanup_entry_fields(entry)
-            break
+    entry = copy.deepcopy(existing)
+    entry['title'] = title
+    entry['heading'] = heading
+    entry['aop_number'] = aop_number
+    entry['publish_date'] = publish_date
+    entry['start_date'] = start_date
+    entry['internal_number'] = internal_number
+    entry['content'] = content
+    entry['files'] = files_list
+    if pdf_links_provided:
+        entry['pdf_files'] = pdf_links
+    entry['source_url'] = source_url
+    entry['imported_at'] = imported_at
+    entry['page_id'] = page_id
+    if pdf_items:
+        for item in pdf_items:
+            filename = item.get('filename')
+            label = item.get('label') or filename
+            if filename:
+                entry['pdf_files'] = (entry.get('pdf_files') or []) + [
+                    {'name': label, 'url': f"/pdf/{filename}", 'filename': filename}
+                ]
+    cleanup_entry_fields(entry)
+    repo.save_entry(entry)
+    for upload in uploads:
+        upload_sessions.discard(upload['id'])
+    release_uploads(repo, previous_files - entry_upload_files(entry))
     
-    save_entries(entries)
     app.logger.info('entries.update id=%s page_id=%s', entry_id, page_id)
-    return jsonify({'success': True})
+    return jsonify({'success': True, 'entry': entry, 'html': render_admin_entry(entry)})
 
 @app.route('/api/entries/<int:entry_id>/pdfs', methods=['DELETE'])
 @requires_admin
 def delete_entry_pdfs(entry_id):
     """Remove all PDFs for a given entry"""
-    entries = load_entries()
-    for entry in entries:
-        if entry['id'] == entry_id:
-            for pdf_item in entry.get('pdf_files', []):
-                pdf_name = extract_local_pdf_filename(pdf_item)
-                if not pdf_name:
-                    continue
-                pdf_path = os.path.join(app.config['UPLOAD_FOLDER'], pdf_name)
-                if os.path.exists(pdf_path):
-                    os.remove(pdf_path)
-                    app.logger.info('entries.delete.pdf filename=%s', pdf_name)
-            entry['pdf_files'] = []
-            break
-    save_entries(entries)
+    repo = get_repository()
+    entry = repo.get_entry(entry_id)
+    if not entry:
+        return jsonify({'success': False, 'error': 'Entry not found'}), 404
+    entry = copy.deepcopy(entry)
+    previous_files = entry_upload_files(entry)
+    entry['pdf_files'] = []
+    repo.save_entry(entry)
+    release_uploads(repo, previous_files)
     app.logger.info('entries.delete_pdfs id=%s', entry_id)
+    return jsonify({'success': True, 'entry': entry, 'html': render_admin_entry(entry)})
+
+
+UPLOAD_SESSION_ID_RE = re.compile(r'^[0-9a-f]{32}$')
+CONTENT_RANGE_RE = re.compile(r'^bytes (\d+)-(\d+)/(\d+)$')
+UPLOAD_SESSION_TTL_SECONDS = 24 * 3600
+# Creating a session also expires idle ones, at most this often.
+UPLOAD_SESSION_SWEEP_SECONDS = 600
+
+
+class UploadSessionError(Exception):
+    def __init__(self, message, status=400):
+        super().__init__(message)
+        self.status = status
+
+
+class UploadSessions:
+    """Resumable chunked uploads kept in uploads/.sessions/.
+
+    <id>.json holds {id, name, size, received, sha256?, blob?} and <id>.part the bytes so
+    far. Chunks must arrive in order; the running sha256 lives in memory and is rebuilt
+    from the part file after a restart. A finished upload becomes a blob that forms
+    attach through their upload_ids field; idle sessions expire after a day.
+    """
+
+    def __init__(self, directory):
+        self.directory = directory
+        self.lock = threading.Lock()
+        self.session_locks = {}
+        self.hashers = {}
+        self.swept_at = 0
+
+    def _path(self, upload_id, suffix):
+        return os.path.join(self.directory, f'{upload_id}{suffix}')
+
+    def _session_lock(self, upload_id):
+        with self.lock:
+            return self.session_locks.setdefault(upload_id, threading.Lock())
+
+    def _save(self, state):
+        with atomic_write(self._path(state['id'], '.json'), fsync=False) as f:
+            json.dump(state, f, ensure_ascii=False)
+
+    def _hasher(self, upload_id, received):
+        offset, hasher = self.hashers.get(upload_id, (None, None))
+        if offset != received:
+            hasher = hashlib.sha256()
+            with open(self._path(upload_id, '.part'), 'rb') as f:
+                remaining = received
+                while remaining:
+                    chunk = f.read(min(UPLOAD_CHUNK_SIZE, remaining))
+                    if not chunk:
+                        break
+                    hasher.update(chunk)
+                    remaining -= len(chunk)
+        return hasher
+
+    def create(self, name, size, sha256=None):
+        if not allowed_file(name) or '.' not in name:
+            raise UploadSessionError('Only PDF or Word files allowed')
+        max_bytes = app.config['UPLOAD_SESSION_MAX_BYTES']
+        if size < 0 or size > max_bytes:
+            raise UploadSessionError(f'File size must be between 0 and {max_bytes} bytes')
+        os.makedirs(self.directory, exist_ok=True)
+        self.sweep()
+        state = {'id': secrets.token_hex(16), 'name': name, 'size': size, 'received': 0}
+        if sha256:
+            state['sha256'] = sha256.lower()
+        open(self._path(state['id'], '.part'), 'wb').close()
+        self._save(state)
+        return state
+
+    def get(self, upload_id):
+        if not UPLOAD_SESSION_ID_RE.match(upload_id or ''):
+            return None
+        try:
+            with open(self._path(upload_id, '.json'), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def write(self, upload_id, start, end, total, stream):
+        """Append bytes start..end (inclusive) from stream; a retried chunk that was already stored is a no-op."""
+        with self._session_lock(upload_id):
+            state = self.get(upload_id)
+            if state is None:
+                raise UploadSessionError('Upload not found', 404)
+            if state.get('blob'):
+                raise UploadSessionError('Upload already finished', 409)
+            if total != state['size'] or end < start or end >= total:
+                raise UploadSessionError('Content-Range does not match the upload')
+            received = state['received']
+            if end < received:
+                return state
+            if start != received:
+                raise UploadSessionError(f'Expected a chunk starting at byte {received}', 409)
+            hasher = self._hasher(upload_id, received)
+            written = 0
+            try:
+                with open(self._path(upload_id, '.part'), 'r+b') as f:
+                    f.seek(received)
+                    f.truncate()
+                    for chunk in iter(lambda: stream.read(UPLOAD_CHUNK_SIZE), b''):
+                        written += len(chunk)
+                        if written > end - start + 1:
+                            raise UploadSessionError('Chunk is longer than its Content-Range')
+                        hasher.update(chunk)
+                        f.write(chunk)
+                if written != end - start + 1:
+                    raise UploadSessionError('Chunk is shorter than its Content-Range')
+            except Exception:
+                # Drop the partial chunk so the client can resend it from `received`.
+                with open(self._path(upload_id, '.part'), 'r+b') as f:
+                    f.truncate(received)
+                self.hashers.pop(upload_id, None)
+                raise
+            state['received'] = received + written
+            self.hashers[upload_id] = (state['received'], hasher)
+            self._save(state)
+            return state
+
+    def finish(self, upload_id):
+        """Verify the upload and turn it into a blob; returns the state with `blob`."""
+        with self._session_lock(upload_id):
+            state = self.get(upload_id)
+            if state is None:
+                raise UploadSessionError('Upload not found', 404)
+            if state.get('blob'):
+                return state
+            if state['received'] != state['size']:
+                raise UploadSessionError(f"Only {state['received']} of {state['size']} bytes received", 409)
+            sha256 = self._hasher(upload_id, state['received']).hexdigest()
+            if state.get('sha256') and state['sha256'] != sha256:
+                self.discard(upload_id)
+                raise UploadSessionError('Checksum mismatch; upload discarded', 422)
+            state['sha256'] = sha256
+            state['blob'] = save_blob(self._path(upload_id, '.part'), sha256, get_file_extension(state['name']))
+            self.hashers.pop(upload_id, None)
+            self._save(state)
+            return state
+
+    def resolve(self, upload_ids):
+        """Finished uploads for a form's upload_ids; raises UploadSessionError for unknown or unfinished ones."""
+        uploads = []
+        for upload_id in upload_ids:
+            state = self.get(upload_id) if isinstance(upload_id, str) else None
+            if state is None or not state.get('blob'):
+                raise UploadSessionError(f'Upload {upload_id} is unknown or not finished')
+            uploads.append(state)
+        return uploads
+
+    def discard(self, upload_id):
+        self.hashers.pop(upload_id, None)
+        for suffix in ('.part', '.json'):
+            path = self._path(upload_id, suffix)
+            if os.path.exists(path):
+                os.remove(path)
+        with self.lock:
+            self.session_locks.pop(upload_id, None)
+
+    def finished_blobs(self):
+        """Blobs of finished uploads not yet attached; the collector must keep them."""
+        blobs = set()
+        for name in self._names('.json'):
+            state = self.get(name[:-len('.json')])
+            if state and state.get('blob'):
+                blobs.add(state['blob'])
+        return blobs
+
+    def _names(self, suffix):
+        try:
+            return [name for name in os.listdir(self.directory) if name.endswith(suffix)]
+        except OSError:
+            return []
+
+    def sweep(self):
+        """Expire idle sessions unless that was done in the last UPLOAD_SESSION_SWEEP_SECONDS."""
+        now = time.time()
+        with self.lock:
+            if now - self.swept_at < UPLOAD_SESSION_SWEEP_SECONDS:
+                return
+            self.swept_at = now
+        self.expire(now - UPLOAD_SESSION_TTL_SECONDS)
+
+    def expire(self, cutoff):
+        for name in self._names('.json'):
+            try:
+                idle = os.path.getmtime(os.path.join(self.directory, name)) < cutoff
+            except OSError:
+                continue
+            if idle:
+                self.discard(name[:-len('.json')])
+                app.logger.info('uploads.session.expired id=%s', name[:-len('.json')])
+
+
+upload_sessions = UploadSessions(os.path.join(app.config['UPLOAD_FOLDER'], '.sessions'))
+
+
+def read_upload_ids(raw):
+    """Parse the upload_ids form field (JSON list) into finished uploads."""
+    if not raw:
+        return []
+    try:
+        upload_ids = json.loads(raw)
+    except json.JSONDecodeError:
+        raise UploadSessionError('upload_ids must be a JSON list')
+    if not isinstance(upload_ids, list):
+        raise UploadSessionError('upload_ids must be a JSON list')
+    return upload_sessions.resolve(upload_ids)
+
+
+def upload_session_payload(state):
+    payload = {key: state[key] for key in ('id', 'name', 'size', 'received', 'sha256') if key in state}
+    if state.get('blob'):
+        payload['filename'] = state['blob']
+        payload['url'] = f"/pdf/{state['blob']}"
+    return payload
+
+
+@app.errorhandler(UploadSessionError)
+def handle_upload_session_error(exc):
+    return jsonify({'success': False, 'error': str(exc)}), exc.status
+
+
+@app.route('/api/uploads', methods=['POST'])
+@requires_admin
+def create_upload():
+    """Start a resumable upload. Body: {name, size, sha256?}."""
+    data = request.get_json(silent=True) or {}
+    name = (data.get('name') or '').strip()
+    size = data.get('size')
+    if not name or not isinstance(size, int):
+        return jsonify({'success': False, 'error': 'name and size are required'}), 400
+    sha256 = data.get('sha256')
+    if sha256 is not None and not re.match(r'^[0-9a-fA-F]{64}$', str(sha256)):
+        return jsonify({'success': False, 'error': 'sha256 must be a hex digest'}), 400
+    state = upload_sessions.create(name, size, sha256)
+    app.logger.info('uploads.session.create id=%s size=%s', state['id'], size)
+    return jsonify({'success': True, 'upload': upload_session_payload(state)}), 201
+
+
+@app.route('/api/uploads/<upload_id>', methods=['GET'])
+@requires_admin
+def get_upload(upload_id):
+    """Upload state; `received` is where a resumed upload continues."""
+    state = upload_sessions.get(upload_id)
+    if state is None:
+        return jsonify({'success': False, 'error': 'Upload not found'}), 404
+    return jsonify({'success': True, 'upload': upload_session_payload(state)})
+
+
+@app.route('/api/uploads/<upload_id>', methods=['PUT'])
+@requires_admin
+def put_upload_chunk(upload_id):
+    """Store one chunk; the body is raw bytes described by Content-Range: bytes start-end/total."""
+    match = CONTENT_RANGE_RE.match(request.headers.get('Content-Range', ''))
+    if not match:
+        return jsonify({'success': False, 'error': 'Content-Range: bytes start-end/total is required'}), 400
+    start, end, total = (int(value) for value in match.groups())
+    state = upload_sessions.write(upload_id, start, end, total, request.stream)
+    return jsonify({'success': True, 'upload': upload_session_payload(state)})
+
+
+@app.route('/api/uploads/<upload_id>/finish', methods=['POST'])
+@requires_admin
+def finish_upload(upload_id):
+    """Check size and checksum and store the file; attach it through a form's upload_ids."""
+    state = upload_sessions.finish(upload_id)
+    app.logger.info('uploads.session.finish id=%s blob=%s', upload_id, state['blob'])
+    return jsonify({'success': True, 'upload': upload_session_payload(state)})
+
+
+@app.route('/api/uploads/<upload_id>', methods=['DELETE'])
+@requires_admin
+def delete_upload(upload_id):
+    if upload_sessions.get(upload_id) is None:
+        return jsonify({'success': False, 'error': 'Upload not found'}), 404
+    upload_sessions.discard(upload_id)
+    app.logger.info('uploads.session.discard id=%s', upload_id)
     return jsonify({'success': True})
 
+
+MIRROR_CHUNK_SIZE = 64 * 1024
+MIRROR_TIMEOUT = 60
+MIRROR_CONTENT_TYPES = {
+    'application/pdf': 'pdf',
+    'application/msword': 'doc',
+    'application/vnd.openxmlformats-officedocument.wordprocessingml.document': 'docx',
+}
+
+
+class MirrorError(Exception):
+    """A remote attachment could not be copied into uploads/."""
+
+
+def file_sha256(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(MIRROR_CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def is_remote_attachment(item):
+    url = item.get('url') or ''
+    return not item.get('filename') and url.startswith(('http://', 'https://'))
+
+
+def mirror_extension(url, content_type):
+    name = unquote(os.path.basename(urlparse(url).path))
+    if '.' in name and allowed_file(name):
+        return get_file_extension(name)
+    ext = MIRROR_CONTENT_TYPES.get(content_type)
+    if not ext:
+        raise MirrorError(f'Unsupported attachment type {content_type or "unknown"}')
+    return ext
+
+
+def download_attachment(url, expected_sha256=None, overwrite=False):
+    """Stream url into UPLOAD_FOLDER in chunks; returns (blob filename, sha256, size).
+
+    The body goes to a .part file that becomes a blob only after the size cap,
+    Content-Length, PDF signature and (when re-mirroring) the recorded sha256 check out.
+    """
+    max_bytes = app.config['MIRROR_MAX_BYTES']
+    try:
+        resp = requests.get(url, stream=True, timeout=MIRROR_TIMEOUT)
+    except requests.RequestException as exc:
+        raise MirrorError(f'Download failed: {exc}') from exc
+    with resp:
+        if resp.status_code != 200:
+            raise MirrorError(f'HTTP {resp.status_code}')
+        declared = resp.headers.get('Content-Length', '')
+        if declared.isdigit() and int(declared) > max_bytes:
+            raise MirrorError(f'Attachment is larger than {max_bytes} bytes')
+        content_type = (resp.headers.get('Content-Type') or '').split(';')[0].strip().lower()
+        ext = mirror_extension(url, content_type)
+        f, part_path = new_upload_part()
+        digest = hashlib.sha256()
+        size = 0
+        head = b''
+        try:
+            try:
+                with f:
+                    for chunk in resp.iter_content(MIRROR_CHUNK_SIZE):
+                        size += len(chunk)
+                        if size > max_bytes:
+                            raise MirrorError(f'Attachment is larger than {max_bytes} bytes')
+                        if len(head) < 4:
+                            head += chunk[:4]
+                        digest.update(chunk)
+                        f.write(chunk)
+            except requests.RequestException as exc:
+                raise MirrorError(f'Download failed: {exc}') from exc
+            if declared.isdigit() and 'Content-Encoding' not in resp.headers and size != int(declared):
+                raise MirrorError(f'Truncated download ({size} of {declared} bytes)')
+            if ext == 'pdf' and not head.startswith(b'%PDF'):
+                raise MirrorError('Response is not a PDF')
+            sha256 = digest.hexdigest()
+            if expected_sha256 and sha256 != expected_sha256:
+                raise MirrorError('Checksum differs from the previously mirrored copy')
+            filename = save_blob(part_path, sha256, ext, overwrite)
+        except Exception:
+            if os.path.exists(part_path):
+                os.remove(part_path)
+            raise
+    return filename, sha256, size
+
+
+def needs_mirror(item, verify=False):
+    """True for remote pdf_files items, and for mirrored copies that are missing (or corrupt with verify)."""
+    if not isinstance(item, dict):
+        return False
+    if is_remote_attachment(item):
+        return True
+    if not item.get('filename') or not item.get('source_url'):
+        return False
+    path = os.path.join(app.config['UPLOAD_FOLDER'], item['filename'])
+    if not os.path.isfile(path):
+        return True
+    return bool(verify and item.get('sha256') and file_sha256(path) != item['sha256'])
+
+
+def mirror_entry_attachments(repo, entry_id, verify=False):
+    """Copy an entry's remote pdf_files into uploads/ and point them at /pdf/<filename>.
+
+    Returns (mirrored, failed). The entry is re-read after downloading so edits made in
+    the meantime are kept.
+    """
+    entry = repo.get_entry(entry_id)
+    if not entry:
+        return 0, 0
+    downloads = {}
+    failed = 0
+    for item in entry.get('pdf_files') or []:
+        if not needs_mirror(item, verify) or item['url'] in downloads:
+            continue
+        source_url = item.get('source_url') or item['url']
+        # A local copy that is missing or corrupt is repaired in place.
+        repair = bool(item.get('filename'))
+        try:
+            downloads[item['url']] = (source_url,) + download_attachment(source_url, item.get('sha256'), repair)
+        except MirrorError as exc:
+            failed += 1
+            app.logger.warning('mirror.failed id=%s url=%s error=%s', entry_id, source_url, exc)
+    if not downloads:
+        return 0, failed
+
+    entry = copy.deepcopy(repo.get_entry(entry_id) or {})
+    used = set()
+    replaced = set()
+    pdf_files = entry.get('pdf_files') or []
+    for index, item in enumerate(pdf_files):
+        if not isinstance(item, dict) or item.get('url') not in downloads:
+            continue
+        source_url, filename, sha256, size = downloads[item['url']]
+        if item.get('filename') and item['filename'] != filename:
+            replaced.add(item['filename'])
+        pdf_files[index] = {
+            'name': item.get('name') or filename,
+            'url': f"/pdf/{filename}",
+            'filename': filename,
+            'source_url': source_url,
+            'sha256': sha256,
+            'size': size,
+        }
+        used.add(item['url'])
+    if used:
+        repo.save_entry(entry)
+    # Downloads whose item vanished meanwhile are unreferenced blobs; the collector takes them.
+    release_uploads(repo, replaced | {filename for url, (_, filename, _, _) in downloads.items() if url not in used})
+    app.logger.info('mirror.entry id=%s mirrored=%s failed=%s', entry_id, len(used), failed)
+    return len(used), failed
+
+
+class MirrorJob:
+    """Mirrors remote attachments of many entries, one run at a time per process."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.state = {'running': False, 'entries': 0, 'done': 0, 'mirrored': 0, 'failed': 0,
+                      'started_at': None, 'finished_at': None}
+
+    def select(self, repo, entry_ids=None, page_id=None, verify=False):
+        if entry_ids is not None:
+            return [entry_id for entry_id in entry_ids if repo.get_entry(entry_id)]
+        return [
+            entry.get('id') for entry in repo.iter_entries(page_id)
+            if any(needs_mirror(item, verify) for item in entry.get('pdf_files') or [])
+        ]
+
+    def start(self, entry_ids, verify=False):
+        """Run in a background thread; returns False if a run is already in progress."""
+        with self.lock:
+            if self.state['running']:
+                return False
+            self._reset(entry_ids)
+        threading.Thread(target=self._run, args=(entry_ids, verify), name='attachment-mirror', daemon=True).start()
+        return True
+
+    def run(self, entry_ids, verify=False):
+        with self.lock:
+            if self.state['running']:
+                raise MirrorError('A mirror job is already running')
+            self._reset(entry_ids)
+        self._run(entry_ids, verify)
+        return self.info()
+
+    def _reset(self, entry_ids):
+        self.state.update(running=True, entries=len(entry_ids), done=0, mirrored=0, failed=0,
+                          started_at=datetime.now().strftime('%Y-%m-%d %H:%M:%S'), finished_at=None)
+
+    def _run(self, entry_ids, verify):
+        start = perf_counter()
+        repo = get_repository()
+        try:
+            for entry_id in entry_ids:
+                try:
+                    mirrored, failed = mirror_entry_attachments(repo, entry_id, verify)
+                except Exception:
+                    app.logger.exception('mirror.entry_failed id=%s', entry_id)
+                    mirrored, failed = 0, 1
+                with self.lock:
+                    self.state['done'] += 1
+                    self.state['mirrored'] += mirrored
+                    self.state['failed'] += failed
+        finally:
+            with self.lock:
+                self.state['running'] = False
+                self.state['finished_at'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+                mirrored, failed = self.state['mirrored'], self.state['failed']
+            app.logger.info('mirror.done entries=%s mirrored=%s failed=%s duration=%.3fs',
+                            len(entry_ids), mirrored, failed, perf_counter() - start)
+        if mirrored:
+            render_cache.schedule_prewarm()
+
+    def info(self):
+        with self.lock:
+            return dict(self.state)
+
+
+mirror_job = MirrorJob()
+
+
+@app.route('/api/mirror', methods=['GET'])
+@requires_admin
+def get_mirror_status():
+    """API endpoint to poll the attachment mirror job"""
+    return jsonify({'success': True, 'status': mirror_job.info()})
+
+
+@app.route('/api/mirror', methods=['POST'])
+@requires_admin
+def start_mirror():
+    """Start copying remote attachments into uploads/.
+
+    Body (all optional): entry_ids (list), page (page id), verify (rehash mirrored copies).
+    """
+    data = request.get_json(silent=True) or {}
+    entry_ids = data.get('entry_ids')
+    if entry_ids is not None:
+        if not isinstance(entry_ids, list) or not all(isinstance(i, int) for i in entry_ids):
+            return jsonify({'success': False, 'error': 'entry_ids must be a list of ids'}), 400
+    page_id = data.get('page')
+    if page_id is not None and not isinstance(page_id, int):
+        return jsonify({'success': False, 'error': 'page must be a page id'}), 400
+    verify = bool(data.get('verify'))
+    ids = mirror_job.select(get_repository(), entry_ids, page_id, verify)
+    if not mirror_job.start(ids, verify):
+        return jsonify({'success': False, 'error': 'A mirror job is already running',
+                        'status': mirror_job.info()}), 409
+    app.logger.info('mirror.start entries=%s verify=%s', len(ids), verify)
+    return jsonify({'success': True, 'status': mirror_job.info()}), 202
+
+
+@app.cli.command('mirror-attachments')
+@click.option('--page', 'page_id', type=int, default=None, help='Only entries of this page id.')
+@click.option('--entry', 'entry_ids', type=int, multiple=True, help='Entry id (repeatable).')
+@click.option('--verify', is_flag=True, help='Rehash mirrored copies and fetch corrupt ones again.')
+def mirror_attachments_command(page_id, entry_ids, verify):
+    """Copy remote (Wayback) attachments into uploads/ and link entries to the local files."""
+    repo = get_repository()
+    ids = mirror_job.select(repo, list(entry_ids) or None, page_id, verify)
+    click.echo(f'Mirroring attachments of {len(ids)} entries...')
+    status = mirror_job.run(ids, verify)
+    click.echo(f"Done: {status['mirrored']} mirrored, {status['failed']} failed.")
+
+
+# Content-addressed blobs and timestamped legacy uploads never change under the same name.
+LEGACY_UPLOAD_NAME_RE = re.compile(r'^\d{8}_\d{6}_')
+IMMUTABLE_CACHE_CONTROL = 'public, max-age=31536000, immutable'
+
+
+def send_upload(filename, mimetype=None):
+    """Serve a file from UPLOAD_FOLDER, or hand it to the front proxy when FILE_OFFLOAD is set.
+
+    Direct responses are conditional and answer Range requests (206) so PDF viewers can
+    load pages on demand. Immutable names are cached for a year; anything else (the
+    profile logo) is revalidated.
+    """
+    path = safe_join(app.config['UPLOAD_FOLDER'], filename)
+    if path is None or not os.path.isfile(path):
+        raise NotFound()
+    offload = app.config['FILE_OFFLOAD']
+    if offload:
+        response = Response(mimetype=mimetype or mimetypes.guess_type(filename)[0] or 'application/octet-stream')
+        response.automatically_set_content_length = False
+        if offload == 'x-accel':
+            response.headers['X-Accel-Redirect'] = f"{app.config['X_ACCEL_PREFIX'].rstrip('/')}/{quote(filename)}"
+        else:
+            response.headers['X-Sendfile'] = path
+    else:
+        response = send_from_directory(app.config['UPLOAD_FOLDER'], filename, mimetype=mimetype, conditional=True)
+    if BLOB_NAME_RE.match(filename) or LEGACY_UPLOAD_NAME_RE.match(filename):
+        response.headers['Cache-Control'] = IMMUTABLE_CACHE_CONTROL
+    else:
+        response.headers['Cache-Control'] = 'public, no-cache'
+    return response
+
+
 @app.route('/uploads/<filename>')
 def uploaded_file(filename):
     """Serve uploaded attachment files"""
-    return send_from_directory(app.config['UPLOAD_FOLDER'], filename)
+    return send_upload(filename)
 
 @app.route('/pdf/<filename>')
 def pdf_viewer(filename):
@@ -870,20 +3664,26 @@ def pdf_viewer(filename):
             'doc': 'application/msword',
             'docx': 'application/vnd.openxmlformats-officedocument.wordprocessingml.document'
         }.get(extension)
-        return send_from_directory(app.config['UPLOAD_FOLDER'], filename, mimetype=mimetype)
+        return send_upload(filename, mimetype=mimetype)
     return render_template('pdf_viewer.html', filename=filename)
 
 @app.route('/api/pages', methods=['GET'])
 @requires_admin
 def get_pages():
     """API endpoint to get all pages"""
-    pages = load_pages()
+    pages = get_repository().list_pages()
     return jsonify(pages)
 
+@app.route('/api/cache/stats', methods=['GET'])
+@requires_admin
+def get_cache_stats():
+    """API endpoint to inspect snapshot and rendered-page cache counters"""
+    return jsonify({'snapshots': snapshot_stats(), 'render': render_cache.info()})
+
 @app.route('/api/profile', methods=['GET'])
 @requires_admin
 def get_profile():
-    return jsonify(load_profile())
+    return jsonify(get_repository().load_profile())
 
 @app.route('/api/profile', methods=['PUT'])
 @requires_admin
@@ -896,7 +3696,10 @@ def update_profile():
         if not title or not body:
             return jsonify({'success': False, 'error': 'Missing required fields'}), 400
         profile = {'title': title, 'body': body, 'files': files}
-        save_profile(profile)
+        repo = get_repository()
+        previous_files = document_upload_files(repo.load_profile())
+        repo.save_profile(profile)
+        release_uploads(repo, previous_files - document_upload_files(profile))
         app.logger.info('profile.update files=%s', len(files))
         return jsonify({'success': True, 'profile': profile})
 
@@ -905,34 +3708,42 @@ def update_profile():
     if not title or not body:
         return jsonify({'success': False, 'error': 'Missing required fields'}), 400
 
-    profile = load_profile()
+    profile = get_repository().load_profile(mutable=True)
     pdf_label = (request.form.get('pdf_label') or '').strip()
     files = request.files.getlist('pdf_files')
+    uploads = read_upload_ids(request.form.get('upload_ids'))
     existing_files = profile.get('files', [])
-    incoming_count = len([f for f in files if f and f.filename])
+    incoming_count = len([f for f in files if f and f.filename]) + len(uploads)
     if len(existing_files) + incoming_count > MAX_PROFILE_PDF_FILES:
         return jsonify({'success': False, 'error': f'Maximum {MAX_PROFILE_PDF_FILES} files allowed'}), 400
 
-    total_files = len([f for f in files if f and f.filename])
+    total_files = incoming_count
     label_index = 1
     for file in files:
         if not file or file.filename == '':
             continue
         if not allowed_file(file.filename):
             return jsonify({'success': False, 'error': 'Only PDF or Word files allowed'}), 400
-        pdf_filename = build_upload_filename(file.filename)
-        save_path = os.path.join(app.config['UPLOAD_FOLDER'], pdf_filename)
-        file.save(save_path)
-        label = build_pdf_label(pdf_label, label_index, total_files) or pdf_filename
+        pdf_filename = store_upload(file)
+        label = build_pdf_label(pdf_label, label_index, total_files) or file.filename
         existing_files.append({
             'name': label,
             'filename': pdf_filename,
             'url': f"/pdf/{pdf_filename}"
         })
         label_index += 1
+    for upload in uploads:
+        existing_files.append({
+            'name': build_pdf_label(pdf_label, label_index, total_files) or upload['name'],
+            'filename': upload['blob'],
+            'url': f"/pdf/{upload['blob']}"
+        })
+        label_index += 1
 
     profile = {'title': title, 'body': body, 'files': existing_files}
-    save_profile(profile)
+    get_repository().save_profile(profile)
+    for upload in uploads:
+        upload_sessions.discard(upload['id'])
     app.logger.info('profile.update files=%s', len(existing_files))
     return jsonify({'success': True, 'profile': profile})
 
@@ -941,7 +3752,7 @@ def update_profile():
 def delete_profile_pdf(filename):
     if not allowed_file(filename):
         return jsonify({'success': False, 'error': 'Invalid file'}), 400
-    profile = load_profile()
+    profile = get_repository().load_profile(mutable=True)
     files = profile.get('files', [])
     removed = False
     updated_files = []
@@ -950,12 +3761,10 @@ def delete_profile_pdf(filename):
             removed = True
             continue
         updated_files.append(item)
-    if removed:
-        pdf_path = os.path.join(app.config['UPLOAD_FOLDER'], filename)
-        if os.path.exists(pdf_path):
-            os.remove(pdf_path)
     profile['files'] = updated_files
-    save_profile(profile)
+    get_repository().save_profile(profile)
+    if removed:
+        release_uploads(get_repository(), [filename])
     app.logger.info('profile.delete_pdf filename=%s removed=%s', filename, removed)
     return jsonify({'success': True, 'removed': removed})
 
@@ -963,20 +3772,21 @@ def delete_profile_pdf(filename):
 @app.route('/api/terms', methods=['GET'])
 @requires_admin
 def get_terms():
-    return jsonify(load_terms())
+    return jsonify(get_repository().load_terms())
 
 
 @app.route('/api/terms', methods=['PUT'])
 @requires_admin
 def update_terms():
-    terms = load_terms()
+    terms = get_repository().load_terms(mutable=True)
     files = terms.get('files', [])
     name = (request.form.get('name') or '').strip()
     description = (request.form.get('description') or '').strip()
     incoming_files = request.files.getlist('files') or request.files.getlist('file')
+    uploads = read_upload_ids(request.form.get('upload_ids'))
 
     valid_uploads = [f for f in incoming_files if f and f.filename]
-    upload_count = len(valid_uploads)
+    upload_count = len(valid_uploads) + len(uploads)
     if upload_count < 1:
         return jsonify({'success': False, 'error': 'Upload at least one PDF/Word file'}), 400
     if len(files) + upload_count > MAX_TERMS_FILES:
@@ -987,16 +3797,23 @@ def update_terms():
     for index, file in enumerate(valid_uploads, start=1):
         if not allowed_file(file.filename):
             return jsonify({'success': False, 'error': 'Only PDF or Word files allowed'}), 400
-        filename = build_upload_filename(file.filename)
-        save_path = os.path.join(app.config['UPLOAD_FOLDER'], filename)
-        file.save(save_path)
+        filename = store_upload(file)
         files.append({
-            'name': build_pdf_label(name, index, upload_count) or filename,
+            'name': build_pdf_label(name, index, upload_count) or file.filename,
             'description': description,
             'filename': filename,
             'url': f"/pdf/{filename}"
         })
-    save_terms({'files': files})
+    for index, upload in enumerate(uploads, start=len(valid_uploads) + 1):
+        files.append({
+            'name': build_pdf_label(name, index, upload_count) or upload['name'],
+            'description': description,
+            'filename': upload['blob'],
+            'url': f"/pdf/{upload['blob']}"
+        })
+    get_repository().save_terms({'files': files})
+    for upload in uploads:
+        upload_sessions.discard(upload['id'])
     app.logger.info('terms.update files=%s', len(files))
     return jsonify({'success': True, 'terms': {'files': files}})
 
@@ -1006,7 +3823,7 @@ def update_terms():
 def delete_terms_file(filename):
     if not allowed_file(filename):
         return jsonify({'success': False, 'error': 'Invalid file'}), 400
-    terms = load_terms()
+    terms = get_repository().load_terms(mutable=True)
     files = terms.get('files', [])
     removed = False
     updated_files = []
@@ -1015,11 +3832,9 @@ def delete_terms_file(filename):
             removed = True
             continue
         updated_files.append(item)
+    get_repository().save_terms({'files': updated_files})
     if removed:
-        file_path = os.path.join(app.config['UPLOAD_FOLDER'], filename)
-        if os.path.exists(file_path):
-            os.remove(file_path)
-    save_terms({'files': updated_files})
+        release_uploads(get_repository(), [filename])
     app.logger.info('terms.delete_file filename=%s removed=%s', filename, removed)
     return jsonify({'success': True, 'removed': removed})
 
@@ -1028,7 +3843,7 @@ def delete_terms_file(filename):
 def add_page():
     """API endpoint to add a new page"""
     data = request.json
-    pages = load_pages()
+    pages = get_repository().list_pages(mutable=True)
     
     new_page = {
         'id': max([p['id'] for p in pages], default=0) + 1,
@@ -1037,71 +3852,79 @@ def add_page():
     }
     
     pages.append(new_page)
-    save_pages(pages)
+    get_repository().save_pages(pages)
     app.logger.info('pages.add id=%s name=%s', new_page.get('id'), new_page.get('name'))
 
     return jsonify({'success': True, 'page': new_page})
 
 @app.route('/api/search')
 def search_entries():
+    """Ranked entry search.
+
+    Query args: q, page (page id), limit/offset, fields (comma-separated
+    projection, id is always included) and snippet=1 for highlighted excerpts.
+    """
     query = request.args.get('q', '').strip().lower()
     page_id = request.args.get('page')
+    limit = parse_int_arg('limit', SEARCH_DEFAULT_LIMIT, minimum=1, maximum=SEARCH_MAX_LIMIT)
+    offset = parse_int_arg('offset', 0)
+    fields = [f.strip() for f in request.args.get('fields', '').split(',') if f.strip()]
+    with_snippet = request.args.get('snippet') in ('1', 'true')
+    # Results change when attachment text finishes extracting, not only on admin writes; the
+    # text stamp comes from uploads/.text on disk, so every worker derives the same validator.
+    not_modified = check_not_modified(attachment_texts.stamp())
+    if not_modified:
+        return not_modified
 
     if not query:
-        return jsonify([])
+        return jsonify({'results': [], 'total': 0, 'limit': limit, 'offset': offset})
 
-    entries = load_entries()
-    pages = load_pages()
+    repo = get_repository()
+    pages = repo.list_pages()
 
     searchable_pages = {
         p['id'] for p in pages if p.get('searchable', False)
     }
 
-    results = []
+    candidates = None
+    if page_id:
+        try:
+            candidates = repo.entry_ids(int(page_id))
+        except ValueError:
+            candidates = set()
+
+    search_index.ensure_current(repo)
+    matches = []
 
-    for e in entries:
+    for e in search_index.search(query, candidates):
         if e['page_id'] not in searchable_pages:
             continue
 
-        if page_id and str(e['page_id']) != page_id:
-            continue
+        matches.append(e)
+
+    results = []
+    for e in matches[offset:offset + limit]:
+        item = project_entry(e, fields)
+        if with_snippet:
+            item['snippet'] = build_search_snippet(e, query)
+        results.append(item)
 
-        files_text = ""
-        for f in e.get('files', []) or []:
-            name = f.get('name', '') if isinstance(f, dict) else ''
-            url = f.get('url', '') if isinstance(f, dict) else ''
-            published = f.get('published_at', '') if isinstance(f, dict) else ''
-            files_text += f" {name} {url} {published}"
-
-        haystack = (
-            f"{e.get('title','')} "
-            f"{e.get('heading','')} "
-            f"{e.get('aop_number','')} "
-            f"{e.get('publish_date','')} "
-            f"{e.get('internal_number','')} "
-            f"{e.get('content','')} "
-            f"{files_text}"
-        ).lower()
-
-        if query in haystack:
-            results.append(e)
-
-    app.logger.info('search query=%s results=%s page_id=%s', query, len(results), page_id or '')
-    return jsonify(results)
+    app.logger.info('search query=%s results=%s page_id=%s', query, len(matches), page_id or '')
+    return jsonify({'results': results, 'total': len(matches), 'limit': limit, 'offset': offset})
 
 @app.route('/api/pages/<int:page_id>', methods=['PUT'])
 @requires_admin
 def update_page(page_id):
     """API endpoint to rename a page"""
     data = request.json
-    pages = load_pages()
+    pages = get_repository().list_pages(mutable=True)
     
     for page in pages:
         if page['id'] == page_id:
             page['name'] = data.get('name', page['name'])
             break
     
-    save_pages(pages)
+    get_repository().save_pages(pages)
     app.logger.info('pages.update id=%s', page_id)
     return jsonify({'success': True})
 
@@ -1109,19 +3932,19 @@ def update_page(page_id):
 @requires_admin
 def delete_page(page_id):
     """API endpoint to delete a page"""
-    pages = load_pages()
-    entries = load_entries()
+    repo = get_repository()
+    pages = repo.list_pages()
     
     # Don't allow deletion if entries exist on this page
-    page_entries = [e for e in entries if e.get('page_id') == page_id]
-    if page_entries:
+    if repo.count_entries(page_id):
         return jsonify({'success': False, 'error': 'Cannot delete page with entries'}), 400
     
     pages = [p for p in pages if p['id'] != page_id]
-    save_pages(pages)
+    repo.save_pages(pages)
     app.logger.info('pages.delete id=%s', page_id)
 
     return jsonify({'success': True})
 
 if __name__ == '__main__':
+    prepare_data()
     app.run(debug=True, host='0.0.0.0', port=5000)
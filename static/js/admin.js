@@ -1,187 +1,294 @@
 const log = (...args) => console.log('[admin]', ...args);
 const logError = (...args) => console.error('[admin]', ...args);
-
-function syncDateField(field) {
-    const input = field.querySelector('input');
-    if (!input) {
-        return;
-    }
-    field.classList.toggle('has-value', Boolean(input.value));
-}
-
-function setupDateFields() {
-    document.querySelectorAll('.date-field').forEach(field => {
-        const input = field.querySelector('input');
-        if (!input) {
-            return;
-        }
-        const update = () => syncDateField(field);
-        input.addEventListener('input', update);
-        input.addEventListener('change', update);
-        update();
-    });
-}
-
-function setupCollapsibles() {
-    document.querySelectorAll('.admin-section[data-collapsible="true"]').forEach(section => {
-        const toggle = section.querySelector('.section-toggle');
-        const body = section.querySelector('.section-body');
-        const isCollapsed = section.dataset.collapsed === 'true';
-        const applyState = collapsed => {
-            section.classList.toggle('collapsed', collapsed);
-            if (toggle) {
-                toggle.setAttribute('aria-expanded', collapsed ? 'false' : 'true');
-                toggle.textContent = collapsed ? 'Покажи' : 'Скрий';
-            }
-            if (body) {
-                body.style.display = collapsed ? 'none' : '';
-            }
-        };
-        applyState(isCollapsed);
-        if (toggle) {
-            toggle.addEventListener('click', () => {
-                const currentlyCollapsed = section.classList.contains('collapsed');
-                section.dataset.collapsed = currentlyCollapsed ? 'false' : 'true';
-                applyState(!currentlyCollapsed);
-            });
-        }
-    });
-}
-
-function setupProfileForm() {
-    const form = document.getElementById('profile-form');
-    if (!form) {
-        return;
-    }
-    form.addEventListener('submit', async event => {
-        event.preventDefault();
-        const title = document.getElementById('profile-title').value.trim();
-        const body = document.getElementById('profile-body').value.trim();
-        if (!title || !body) {
-            alert('Моля, попълнете заглавие и съдържание.');
-            return;
-        }
-        try {
-            const formData = new FormData();
-            formData.append('title', title);
-            formData.append('body', body);
-            const labelInput = document.getElementById('profile-pdf-label');
-            if (labelInput) {
-                formData.append('pdf_label', labelInput.value || '');
-            }
-            const fileInput = document.getElementById('profile-pdf-files');
-            if (fileInput && fileInput.files.length > 0) {
-                Array.from(fileInput.files).forEach(file => {
-                    formData.append('pdf_files', file);
-                });
-            }
-            const response = await fetch('/api/profile', {
-                method: 'PUT',
-                body: formData
-            });
-            const result = await response.json();
-            if (result.success) {
-                alert('Профилът е обновен успешно.');
-                if (fileInput) {
-                    fileInput.value = '';
-                }
-                if (labelInput) {
-                    labelInput.value = '';
-                }
-                if (result.profile && result.profile.files) {
-                    renderProfileFiles(result.profile.files);
-                }
-            } else {
-                alert(result.error || 'Неуспешно обновяване на профил.');
-            }
-        } catch (error) {
-            logError('Profile update failed', error);
-            alert('Възникна грешка при обновяване на профил.');
-        }
-    });
-}
-
-function renderProfileFiles(files) {
-    const container = document.querySelector('.profile-files-group');
-    if (!container) {
-        return;
-    }
-    const list = container.querySelector('.profile-files-list');
-    const empty = container.querySelector('.profile-no-files');
-    if (list) {
-        list.remove();
-    }
-    if (empty) {
-        empty.remove();
-    }
-    if (!files || files.length === 0) {
-        const p = document.createElement('p');
-        p.className = 'no-files profile-no-files';
-        p.textContent = 'Няма прикачени файлове.';
-        container.appendChild(p);
-        return;
-    }
-    const ul = document.createElement('ul');
-    ul.className = 'files profile-files-list';
-    files.forEach(file => {
-        const li = document.createElement('li');
-        if (file.filename) {
-            li.dataset.filename = file.filename;
-        }
-        const link = document.createElement('a');
-        link.href = file.url || '#';
-        link.target = '_blank';
-        link.rel = 'noopener';
-        link.textContent = file.name || file.filename || file.url || 'PDF';
-        const btn = document.createElement('button');
-        btn.type = 'button';
-        btn.className = 'btn-small btn-delete profile-file-delete';
-        btn.textContent = 'Изтрий';
-        li.appendChild(link);
-        li.appendChild(btn);
-        ul.appendChild(li);
-    });
-    container.appendChild(ul);
-}
-
+
+function syncDateField(field) {
+    const input = field.querySelector('input');
+    if (!input) {
+        return;
+    }
+    field.classList.toggle('has-value', Boolean(input.value));
+}
+
+function setupDateFields() {
+    document.querySelectorAll('.date-field').forEach(field => {
+        const input = field.querySelector('input');
+        if (!input) {
+            return;
+        }
+        const update = () => syncDateField(field);
+        input.addEventListener('input', update);
+        input.addEventListener('change', update);
+        update();
+    });
+}
+
+function setupCollapsibles() {
+    document.querySelectorAll('.admin-section[data-collapsible="true"]').forEach(section => {
+        const toggle = section.querySelector('.section-toggle');
+        const body = section.querySelector('.section-body');
+        const isCollapsed = section.dataset.collapsed === 'true';
+        const applyState = collapsed => {
+            section.classList.toggle('collapsed', collapsed);
+            if (toggle) {
+                toggle.setAttribute('aria-expanded', collapsed ? 'false' : 'true');
+                toggle.textContent = collapsed ? 'Покажи' : 'Скрий';
+            }
+            if (body) {
+                body.style.display = collapsed ? 'none' : '';
+            }
+        };
+        applyState(isCollapsed);
+        if (toggle) {
+            toggle.addEventListener('click', () => {
+                const currentlyCollapsed = section.classList.contains('collapsed');
+                section.dataset.collapsed = currentlyCollapsed ? 'false' : 'true';
+                applyState(!currentlyCollapsed);
+            });
+        }
+    });
+}
+
+const UPLOAD_CHUNK_SIZE = 4 * 1024 * 1024;
+const UPLOAD_RETRIES = 5;
+
+// Check a file input against its data-max-files limit and accept list before anything is uploaded,
+// so a selection the server would reject does not leave finished uploads behind. Returns an error message or ''.
+function checkUploadSelection(input, existingCount = 0) {
+    const files = Array.from((input && input.files) || []);
+    const maxFiles = Number(input && input.dataset.maxFiles);
+    if (maxFiles && existingCount + files.length > maxFiles) {
+        return existingCount > 0
+            ? `Може да има най-много ${maxFiles} файла (вече са прикачени ${existingCount}).`
+            : `Може да качите най-много ${maxFiles} файла.`;
+    }
+    const accepted = (input && input.accept ? input.accept.split(',') : []).map(ext => ext.trim().toLowerCase());
+    const rejected = files.find(file => accepted.length && !accepted.some(ext => file.name.toLowerCase().endsWith(ext)));
+    return rejected ? `Разрешени са само PDF/Word файлове (${rejected.name}).` : '';
+}
+
+// Open a resumable upload session; the server checks the name and size before any bytes are sent.
+async function startUpload(file) {
+    const createResponse = await fetch('/api/uploads', {
+        method: 'POST',
+        headers: { 'Content-Type': 'application/json' },
+        body: JSON.stringify({ name: file.name, size: file.size })
+    });
+    const created = await createResponse.json();
+    if (!created.success) {
+        throw new Error(created.error || 'Upload could not be started');
+    }
+    return created.upload.id;
+}
+
+// Send a file to an upload session in chunks; resolves to the finished upload id.
+// A failed chunk is retried after asking the server how many bytes it already has.
+async function uploadInChunks(uploadId, file) {
+    let offset = 0;
+    let failures = 0;
+    while (offset < file.size) {
+        const end = Math.min(offset + UPLOAD_CHUNK_SIZE, file.size);
+        let response = null;
+        try {
+            response = await fetch(`/api/uploads/${uploadId}`, {
+                method: 'PUT',
+                headers: { 'Content-Range': `bytes ${offset}-${end - 1}/${file.size}` },
+                body: file.slice(offset, end)
+            });
+        } catch (error) {
+            logError('Upload chunk failed', error);
+        }
+        if (response && response.ok) {
+            offset = (await response.json()).upload.received;
+            failures = 0;
+            continue;
+        }
+        if (response && response.status !== 409 && response.status < 500) {
+            const result = await response.json().catch(() => ({}));
+            throw new Error(result.error || 'Upload failed');
+        }
+        failures += 1;
+        if (failures > UPLOAD_RETRIES) {
+            throw new Error('Upload failed after several retries');
+        }
+        await new Promise(resolve => setTimeout(resolve, 1000 * failures));
+        try {
+            const state = await (await fetch(`/api/uploads/${uploadId}`)).json();
+            if (state.success) {
+                offset = state.upload.received;
+            }
+        } catch (error) {
+            logError('Upload state check failed', error);
+        }
+    }
+    const finishResponse = await fetch(`/api/uploads/${uploadId}/finish`, { method: 'POST' });
+    const finished = await finishResponse.json();
+    if (!finished.success) {
+        throw new Error(finished.error || 'Upload failed');
+    }
+    return uploadId;
+}
+
+// Upload the files one by one and reference them from the form instead of sending them inline.
+// Every session is opened before the first chunk, so a file the server refuses costs no uploads.
+async function appendUploads(formData, files) {
+    if (!files || files.length === 0) {
+        return;
+    }
+    const selected = Array.from(files);
+    const uploadIds = [];
+    try {
+        for (const file of selected) {
+            uploadIds.push(await startUpload(file));
+        }
+    } catch (error) {
+        await Promise.all(uploadIds.map(uploadId => fetch(`/api/uploads/${uploadId}`, { method: 'DELETE' })
+            .catch(deleteError => logError('Upload abort failed', deleteError))));
+        throw error;
+    }
+    for (const [index, file] of selected.entries()) {
+        await uploadInChunks(uploadIds[index], file);
+    }
+    formData.append('upload_ids', JSON.stringify(uploadIds));
+}
+
+function setupProfileForm() {
+    const form = document.getElementById('profile-form');
+    if (!form) {
+        return;
+    }
+    form.addEventListener('submit', async event => {
+        event.preventDefault();
+        const title = document.getElementById('profile-title').value.trim();
+        const body = document.getElementById('profile-body').value.trim();
+        if (!title || !body) {
+            alert('Моля, попълнете заглавие и съдържание.');
+            return;
+        }
+        try {
+            const formData = new FormData();
+            formData.append('title', title);
+            formData.append('body', body);
+            const labelInput = document.getElementById('profile-pdf-label');
+            if (labelInput) {
+                formData.append('pdf_label', labelInput.value || '');
+            }
+            const fileInput = document.getElementById('profile-pdf-files');
+            if (fileInput) {
+                const existingCount = document.querySelectorAll('.profile-files-list li').length;
+                const selectionError = checkUploadSelection(fileInput, existingCount);
+                if (selectionError) {
+                    alert(selectionError);
+                    return;
+                }
+                await appendUploads(formData, fileInput.files);
+            }
+            const response = await fetch('/api/profile', {
+                method: 'PUT',
+                body: formData
+            });
+            const result = await response.json();
+            if (result.success) {
+                alert('Профилът е обновен успешно.');
+                if (fileInput) {
+                    fileInput.value = '';
+                }
+                if (labelInput) {
+                    labelInput.value = '';
+                }
+                if (result.profile && result.profile.files) {
+                    renderProfileFiles(result.profile.files);
+                }
+            } else {
+                alert(result.error || 'Неуспешно обновяване на профил.');
+            }
+        } catch (error) {
+            logError('Profile update failed', error);
+            alert('Възникна грешка при обновяване на профил.');
+        }
+    });
+}
+
+function renderProfileFiles(files) {
+    const container = document.querySelector('.profile-files-group');
+    if (!container) {
+        return;
+    }
+    const list = container.querySelector('.profile-files-list');
+    const empty = container.querySelector('.profile-no-files');
+    if (list) {
+        list.remove();
+    }
+    if (empty) {
+        empty.remove();
+    }
+    if (!files || files.length === 0) {
+        const p = document.createElement('p');
+        p.className = 'no-files profile-no-files';
+        p.textContent = 'Няма прикачени файлове.';
+        container.appendChild(p);
+        return;
+    }
+    const ul = document.createElement('ul');
+    ul.className = 'files profile-files-list';
+    files.forEach(file => {
+        const li = document.createElement('li');
+        if (file.filename) {
+            li.dataset.filename = file.filename;
+        }
+        const link = document.createElement('a');
+        link.href = file.url || '#';
+        link.target = '_blank';
+        link.rel = 'noopener';
+        link.textContent = file.name || file.filename || file.url || 'PDF';
+        const btn = document.createElement('button');
+        btn.type = 'button';
+        btn.className = 'btn-small btn-delete profile-file-delete';
+        btn.textContent = 'Изтрий';
+        li.appendChild(link);
+        li.appendChild(btn);
+        ul.appendChild(li);
+    });
+    container.appendChild(ul);
+}
+
 function setupProfileFileDeletes() {
-    const container = document.querySelector('.profile-files-group');
-    if (!container) {
-        return;
-    }
-    container.addEventListener('click', async event => {
-        const button = event.target.closest('.profile-file-delete');
-        if (!button) {
-            return;
-        }
-        const item = button.closest('li');
-        const filename = item ? item.dataset.filename : '';
-        if (!filename) {
-            return;
-        }
-        if (!confirm('Сигурни ли сте, че искате да изтриете този PDF?')) {
-            return;
-        }
-        try {
-            const response = await fetch(`/api/profile/pdfs/${encodeURIComponent(filename)}`, {
-                method: 'DELETE'
-            });
-            const result = await response.json();
-            if (result.success) {
-                if (item) {
-                    item.remove();
-                }
-                const remaining = container.querySelectorAll('li');
-                if (remaining.length === 0) {
-                    renderProfileFiles([]);
-                }
-            } else {
-                alert(result.error || 'Неуспешно изтриване на PDF.');
-            }
-        } catch (error) {
-            logError('Profile PDF delete failed', error);
-            alert('Възникна грешка при изтриване на PDF.');
-        }
+    const container = document.querySelector('.profile-files-group');
+    if (!container) {
+        return;
+    }
+    container.addEventListener('click', async event => {
+        const button = event.target.closest('.profile-file-delete');
+        if (!button) {
+            return;
+        }
+        const item = button.closest('li');
+        const filename = item ? item.dataset.filename : '';
+        if (!filename) {
+            return;
+        }
+        if (!confirm('Сигурни ли сте, че искате да изтриете този PDF?')) {
+            return;
+        }
+        try {
+            const response = await fetch(`/api/profile/pdfs/${encodeURIComponent(filename)}`, {
+                method: 'DELETE'
+            });
+            const result = await response.json();
+            if (result.success) {
+                if (item) {
+                    item.remove();
+                }
+                const remaining = container.querySelectorAll('li');
+                if (remaining.length === 0) {
+                    renderProfileFiles([]);
+                }
+            } else {
+                alert(result.error || 'Неуспешно изтриване на PDF.');
+            }
+        } catch (error) {
+            logError('Profile PDF delete failed', error);
+            alert('Възникна грешка при изтриване на PDF.');
+        }
     });
 }
 
@@ -203,13 +310,16 @@ function setupTermsForm() {
             alert('Моля, качете поне един PDF/Word файл.');
             return;
         }
+        const selectionError = checkUploadSelection(fileInput, document.querySelectorAll('.terms-files-list li').length);
+        if (selectionError) {
+            alert(selectionError);
+            return;
+        }
         try {
             const formData = new FormData();
             formData.append('name', name);
             formData.append('description', description);
-            Array.from(fileInput.files).forEach(file => {
-                formData.append('files', file);
-            });
+            await appendUploads(formData, fileInput.files);
             const response = await fetch('/api/terms', {
                 method: 'PUT',
                 body: formData
@@ -329,300 +439,337 @@ document.addEventListener('DOMContentLoaded', () => {
     setupTermsFileDeletes();
     log('Admin UI ready');
 });
-
-const addForm = document.getElementById('add-entry-form');
-if (addForm) {
-    addForm.addEventListener('submit', async function(e) {
-        e.preventDefault();
-
-        const formData = new FormData();
-        formData.append('heading', document.getElementById('heading').value);
-        formData.append('aop_number', document.getElementById('aop_number').value);
-        formData.append('publish_date', document.getElementById('publish_date').value);
-        formData.append('title', document.getElementById('title').value);
-        formData.append('content', document.getElementById('content').value);
-        formData.append('page_id', document.getElementById('page_id').value);
-        formData.append('pdf_label', document.getElementById('pdf_label').value);
-
-        const fileInput = document.getElementById('pdf_files');
-        if (fileInput.files.length > 0) {
-            Array.from(fileInput.files).forEach(file => {
-                formData.append('pdf_files', file);
-            });
-        }
-
-        try {
-            const response = await fetch('/api/entries', {
-                method: 'POST',
-                body: formData
-            });
-
-            const result = await response.json();
-
-            if (result.success) {
-                alert('Записът е добавен успешно.');
-                location.reload();
-            } else {
-                alert(result.error || 'Неуспешно добавяне на запис.');
-            }
-        } catch (error) {
-            logError('Add entry failed', error);
-            alert('Възникна грешка при добавяне на запис.');
-        }
-    });
-}
-
-async function deleteEntry(entryId) {
-    if (!confirm('Сигурни ли сте, че искате да изтриете този запис?')) {
-        return;
-    }
-
-    try {
-        const response = await fetch(`/api/entries/${entryId}`, {
-            method: 'DELETE'
-        });
-
-        const result = await response.json();
-
-        if (result.success) {
-            const entryEl = document.getElementById(`entry-${entryId}`);
-            if (entryEl) {
-                entryEl.remove();
-            }
-            alert('Записът е изтрит успешно.');
-
-            const entriesList = document.querySelector('.entries-list');
-            if (entriesList && entriesList.children.length === 0) {
-                entriesList.innerHTML = '<p class="no-entries">Няма записи.</p>';
-            }
-        } else {
-            alert(result.error || 'Неуспешно изтриване на запис.');
-        }
-    } catch (error) {
-        logError('Delete entry failed', error);
-        alert('Възникна грешка при изтриване на запис.');
-    }
-}
-
-function editEntry(entryId) {
-    fetch('/api/entries')
-        .then(response => response.json())
-        .then(entries => {
-            const entry = entries.find(e => e.id === entryId);
-            if (entry) {
-                document.getElementById('edit-id').value = entry.id;
-                document.getElementById('edit-heading').value = entry.heading;
-                document.getElementById('edit-aop_number').value = entry.aop_number || '';
-                const editPublishDate = document.getElementById('edit-publish_date');
-                editPublishDate.value = entry.publish_date || '';
-                editPublishDate.dispatchEvent(new Event('change', { bubbles: true }));
-                document.getElementById('edit-title').value = entry.title;
-                document.getElementById('edit-content').value = entry.content;
-                document.getElementById('edit-page_id').value = entry.page_id;
-                document.getElementById('edit-pdf_label').value = '';
-
-                const pdfInfo = document.getElementById('current-pdf-info');
-                const pdfFiles = Array.isArray(entry.pdf_files) ? entry.pdf_files : [];
-                if (pdfFiles.length > 0) {
-                    const displayNames = pdfFiles.map(item => {
-                        if (typeof item === 'string') {
-                            return item;
-                        }
-                        return item.name || item.filename || item.url || 'PDF';
-                    });
-                    pdfInfo.textContent = `Текущи PDF файлове: ${displayNames.join(', ')}`;
-                } else {
-                    pdfInfo.textContent = 'Няма прикачени PDF файлове.';
-                }
-
-                document.getElementById('edit-modal').style.display = 'block';
-            }
-        })
-        .catch(error => {
-            logError('Load entry failed', error);
-            alert('Неуспешно зареждане на запис.');
-        });
-}
-
-function closeEditModal() {
-    document.getElementById('edit-modal').style.display = 'none';
-}
-
-async function removeAllPdfs() {
-    const entryId = document.getElementById('edit-id').value;
-    if (!entryId) {
-        return;
-    }
-    if (!confirm('Сигурни ли сте, че искате да изтриете всички PDF файлове?')) {
-        return;
-    }
-    try {
-        const response = await fetch(`/api/entries/${entryId}/pdfs`, {
-            method: 'DELETE'
-        });
-        const result = await response.json();
-        if (result.success) {
-            const pdfInfo = document.getElementById('current-pdf-info');
-            pdfInfo.textContent = 'Няма прикачени PDF файлове.';
-            document.getElementById('edit-pdf_files').value = '';
-            alert('Всички PDF файлове са изтрити.');
-        } else {
-            alert(result.error || 'Неуспешно изтриване на PDF файлове.');
-        }
-    } catch (error) {
-        logError('Delete PDFs failed', error);
-        alert('Възникна грешка при изтриване на PDF файлове.');
-    }
-}
-
-const editForm = document.getElementById('edit-entry-form');
-if (editForm) {
-    editForm.addEventListener('submit', async function(e) {
-        e.preventDefault();
-
-        const entryId = document.getElementById('edit-id').value;
-        const formData = new FormData();
-        formData.append('heading', document.getElementById('edit-heading').value);
-        formData.append('aop_number', document.getElementById('edit-aop_number').value);
-        formData.append('publish_date', document.getElementById('edit-publish_date').value);
-        formData.append('title', document.getElementById('edit-title').value);
-        formData.append('content', document.getElementById('edit-content').value);
-        formData.append('page_id', document.getElementById('edit-page_id').value);
-        formData.append('pdf_label', document.getElementById('edit-pdf_label').value);
-
-        const fileInput = document.getElementById('edit-pdf_files');
-        if (fileInput.files.length > 0) {
-            Array.from(fileInput.files).forEach(file => {
-                formData.append('pdf_files', file);
-            });
-        }
-
-        try {
-            const response = await fetch(`/api/entries/${entryId}`, {
-                method: 'PUT',
-                body: formData
-            });
-
-            const result = await response.json();
-
-            if (result.success) {
-                alert('Записът е обновен успешно.');
-                closeEditModal();
-                location.reload();
-            } else {
-                alert(result.error || 'Неуспешно обновяване на запис.');
-            }
-        } catch (error) {
-            logError('Update entry failed', error);
-            alert('Възникна грешка при обновяване на запис.');
-        }
-    });
-}
-
-window.onclick = function(event) {
-    const editModal = document.getElementById('edit-modal');
-    const pageModal = document.getElementById('page-modal');
-    if (event.target == editModal) {
-        closeEditModal();
-    }
-    if (event.target == pageModal) {
-        closePageModal();
-    }
-};
-
-function showAddPageModal() {
-    document.getElementById('page-modal-title').textContent = 'Нова страница';
-    document.getElementById('page-id').value = '';
-    document.getElementById('page-name').value = '';
-    document.getElementById('page-modal').style.display = 'block';
-}
-
-function renamePage(pageId, currentName) {
-    document.getElementById('page-modal-title').textContent = 'Преименуване на страница';
-    document.getElementById('page-id').value = pageId;
-    document.getElementById('page-name').value = currentName;
-    document.getElementById('page-modal').style.display = 'block';
-}
-
-function closePageModal() {
-    document.getElementById('page-modal').style.display = 'none';
-}
-
-async function deletePage(pageId) {
-    if (!confirm('Сигурни ли сте, че искате да изтриете тази страница? Може да изтриете само страници без записи.')) {
-        return;
-    }
-
-    try {
-        const response = await fetch(`/api/pages/${pageId}`, {
-            method: 'DELETE'
-        });
-
-        const result = await response.json();
-
-        if (result.success) {
-            alert('Страницата е изтрита успешно.');
-            location.reload();
-        } else {
-            alert(result.error || 'Неуспешно изтриване на страница.');
-        }
-    } catch (error) {
-        logError('Delete page failed', error);
-        alert('Възникна грешка при изтриване на страница.');
-    }
-}
-
-const pageForm = document.getElementById('page-form');
-if (pageForm) {
-    pageForm.addEventListener('submit', async function(e) {
-        e.preventDefault();
-
-        const pageId = document.getElementById('page-id').value;
-        const pageName = document.getElementById('page-name').value;
-
-        const isEdit = pageId !== '';
-        const url = isEdit ? `/api/pages/${pageId}` : '/api/pages';
-        const method = isEdit ? 'PUT' : 'POST';
-
-        try {
-            const response = await fetch(url, {
-                method: method,
-                headers: {
-                    'Content-Type': 'application/json'
-                },
-                body: JSON.stringify({ name: pageName })
-            });
-
-            const result = await response.json();
-
-            if (result.success) {
-                alert(isEdit ? 'Страницата е преименувана успешно.' : 'Страницата е добавена успешно.');
-                closePageModal();
-                location.reload();
-            } else {
-                alert(result.error || 'Неуспешно запазване на страница.');
-            }
-        } catch (error) {
-            logError('Save page failed', error);
-            alert('Възникна грешка при запазване на страница.');
-        }
-    });
-}
-
-function filterEntries() {
-    const selectedPage = document.getElementById('filter-page').value;
-    const entries = document.querySelectorAll('.entry-item');
-
-    entries.forEach(entry => {
-        if (selectedPage === 'all') {
-            entry.style.display = 'flex';
-        } else {
-            const entryPageId = entry.getAttribute('data-page-id');
-            if (entryPageId === selectedPage) {
-                entry.style.display = 'flex';
-            } else {
-                entry.style.display = 'none';
-            }
-        }
-    });
-}
+
+function adjustPageCount(pageId, delta) {
+    const countEl = document.querySelector(`#page-item-${pageId} .page-count`);
+    if (countEl) {
+        countEl.textContent = Math.max(0, (parseInt(countEl.textContent, 10) || 0) + delta);
+    }
+}
+
+// Apply a single-entry change from an API response to the list without reloading it.
+function upsertEntryItem(html) {
+    const entriesList = document.querySelector('.entries-list');
+    if (!entriesList) {
+        return;
+    }
+    const template = document.createElement('template');
+    template.innerHTML = html.trim();
+    const item = template.content.firstElementChild;
+    const existing = document.getElementById(item.id);
+    if (existing) {
+        adjustPageCount(existing.getAttribute('data-page-id'), -1);
+        existing.replaceWith(item);
+    } else {
+        const placeholder = entriesList.querySelector('.no-entries');
+        if (placeholder) {
+            placeholder.remove();
+        }
+        entriesList.prepend(item);
+    }
+    adjustPageCount(item.getAttribute('data-page-id'), 1);
+    filterEntries();
+}
+
+const addForm = document.getElementById('add-entry-form');
+if (addForm) {
+    addForm.addEventListener('submit', async function(e) {
+        e.preventDefault();
+
+        const formData = new FormData();
+        formData.append('heading', document.getElementById('heading').value);
+        formData.append('aop_number', document.getElementById('aop_number').value);
+        formData.append('publish_date', document.getElementById('publish_date').value);
+        formData.append('title', document.getElementById('title').value);
+        formData.append('content', document.getElementById('content').value);
+        formData.append('page_id', document.getElementById('page_id').value);
+        formData.append('pdf_label', document.getElementById('pdf_label').value);
+
+        const fileInput = document.getElementById('pdf_files');
+        const selectionError = checkUploadSelection(fileInput);
+        if (selectionError) {
+            alert(selectionError);
+            return;
+        }
+        try {
+            await appendUploads(formData, fileInput.files);
+            const response = await fetch('/api/entries', {
+                method: 'POST',
+                body: formData
+            });
+
+            const result = await response.json();
+
+            if (result.success) {
+                alert('Записът е добавен успешно.');
+                upsertEntryItem(result.html);
+                addForm.reset();
+            } else {
+                alert(result.error || 'Неуспешно добавяне на запис.');
+            }
+        } catch (error) {
+            logError('Add entry failed', error);
+            alert('Възникна грешка при добавяне на запис.');
+        }
+    });
+}
+
+async function deleteEntry(entryId) {
+    if (!confirm('Сигурни ли сте, че искате да изтриете този запис?')) {
+        return;
+    }
+
+    try {
+        const response = await fetch(`/api/entries/${entryId}`, {
+            method: 'DELETE'
+        });
+
+        const result = await response.json();
+
+        if (result.success) {
+            const entryEl = document.getElementById(`entry-${entryId}`);
+            if (entryEl) {
+                adjustPageCount(entryEl.getAttribute('data-page-id'), -1);
+                entryEl.remove();
+            }
+            alert('Записът е изтрит успешно.');
+
+            const entriesList = document.querySelector('.entries-list');
+            if (entriesList && entriesList.children.length === 0) {
+                entriesList.innerHTML = '<p class="no-entries">Няма записи.</p>';
+            }
+        } else {
+            alert(result.error || 'Неуспешно изтриване на запис.');
+        }
+    } catch (error) {
+        logError('Delete entry failed', error);
+        alert('Възникна грешка при изтриване на запис.');
+    }
+}
+
+function editEntry(entryId) {
+    fetch(`/api/entries/${entryId}`)
+        .then(response => response.json())
+        .then(result => {
+            const entry = result.success ? result.entry : null;
+            if (entry) {
+                document.getElementById('edit-id').value = entry.id;
+                document.getElementById('edit-heading').value = entry.heading;
+                document.getElementById('edit-aop_number').value = entry.aop_number || '';
+                const editPublishDate = document.getElementById('edit-publish_date');
+                editPublishDate.value = entry.publish_date || '';
+                editPublishDate.dispatchEvent(new Event('change', { bubbles: true }));
+                document.getElementById('edit-title').value = entry.title;
+                document.getElementById('edit-content').value = entry.content;
+                document.getElementById('edit-page_id').value = entry.page_id;
+                document.getElementById('edit-pdf_label').value = '';
+
+                const pdfInfo = document.getElementById('current-pdf-info');
+                const pdfFiles = Array.isArray(entry.pdf_files) ? entry.pdf_files : [];
+                document.getElementById('edit-pdf_files').dataset.existingFiles = pdfFiles.length;
+                if (pdfFiles.length > 0) {
+                    const displayNames = pdfFiles.map(item => {
+                        if (typeof item === 'string') {
+                            return item;
+                        }
+                        return item.name || item.filename || item.url || 'PDF';
+                    });
+                    pdfInfo.textContent = `Текущи PDF файлове: ${displayNames.join(', ')}`;
+                } else {
+                    pdfInfo.textContent = 'Няма прикачени PDF файлове.';
+                }
+
+                document.getElementById('edit-modal').style.display = 'block';
+            }
+        })
+        .catch(error => {
+            logError('Load entry failed', error);
+            alert('Неуспешно зареждане на запис.');
+        });
+}
+
+function closeEditModal() {
+    document.getElementById('edit-modal').style.display = 'none';
+}
+
+async function removeAllPdfs() {
+    const entryId = document.getElementById('edit-id').value;
+    if (!entryId) {
+        return;
+    }
+    if (!confirm('Сигурни ли сте, че искате да изтриете всички PDF файлове?')) {
+        return;
+    }
+    try {
+        const response = await fetch(`/api/entries/${entryId}/pdfs`, {
+            method: 'DELETE'
+        });
+        const result = await response.json();
+        if (result.success) {
+            const pdfInfo = document.getElementById('current-pdf-info');
+            pdfInfo.textContent = 'Няма прикачени PDF файлове.';
+            document.getElementById('edit-pdf_files').value = '';
+            document.getElementById('edit-pdf_files').dataset.existingFiles = 0;
+            upsertEntryItem(result.html);
+            alert('Всички PDF файлове са изтрити.');
+        } else {
+            alert(result.error || 'Неуспешно изтриване на PDF файлове.');
+        }
+    } catch (error) {
+        logError('Delete PDFs failed', error);
+        alert('Възникна грешка при изтриване на PDF файлове.');
+    }
+}
+
+const editForm = document.getElementById('edit-entry-form');
+if (editForm) {
+    editForm.addEventListener('submit', async function(e) {
+        e.preventDefault();
+
+        const entryId = document.getElementById('edit-id').value;
+        const formData = new FormData();
+        formData.append('heading', document.getElementById('edit-heading').value);
+        formData.append('aop_number', document.getElementById('edit-aop_number').value);
+        formData.append('publish_date', document.getElementById('edit-publish_date').value);
+        formData.append('title', document.getElementById('edit-title').value);
+        formData.append('content', document.getElementById('edit-content').value);
+        formData.append('page_id', document.getElementById('edit-page_id').value);
+        formData.append('pdf_label', document.getElementById('edit-pdf_label').value);
+
+        const fileInput = document.getElementById('edit-pdf_files');
+        const selectionError = checkUploadSelection(fileInput, Number(fileInput.dataset.existingFiles || 0));
+        if (selectionError) {
+            alert(selectionError);
+            return;
+        }
+        try {
+            await appendUploads(formData, fileInput.files);
+            const response = await fetch(`/api/entries/${entryId}`, {
+                method: 'PUT',
+                body: formData
+            });
+
+            const result = await response.json();
+
+            if (result.success) {
+                alert('Записът е обновен успешно.');
+                closeEditModal();
+                upsertEntryItem(result.html);
+            } else {
+                alert(result.error || 'Неуспешно обновяване на запис.');
+            }
+        } catch (error) {
+            logError('Update entry failed', error);
+            alert('Възникна грешка при обновяване на запис.');
+        }
+    });
+}
+
+window.onclick = function(event) {
+    const editModal = document.getElementById('edit-modal');
+    const pageModal = document.getElementById('page-modal');
+    if (event.target == editModal) {
+        closeEditModal();
+    }
+    if (event.target == pageModal) {
+        closePageModal();
+    }
+};
+
+function showAddPageModal() {
+    document.getElementById('page-modal-title').textContent = 'Нова страница';
+    document.getElementById('page-id').value = '';
+    document.getElementById('page-name').value = '';
+    document.getElementById('page-modal').style.display = 'block';
+}
+
+function renamePage(pageId, currentName) {
+    document.getElementById('page-modal-title').textContent = 'Преименуване на страница';
+    document.getElementById('page-id').value = pageId;
+    document.getElementById('page-name').value = currentName;
+    document.getElementById('page-modal').style.display = 'block';
+}
+
+function closePageModal() {
+    document.getElementById('page-modal').style.display = 'none';
+}
+
+async function deletePage(pageId) {
+    if (!confirm('Сигурни ли сте, че искате да изтриете тази страница? Може да изтриете само страници без записи.')) {
+        return;
+    }
+
+    try {
+        const response = await fetch(`/api/pages/${pageId}`, {
+            method: 'DELETE'
+        });
+
+        const result = await response.json();
+
+        if (result.success) {
+            alert('Страницата е изтрита успешно.');
+            location.reload();
+        } else {
+            alert(result.error || 'Неуспешно изтриване на страница.');
+        }
+    } catch (error) {
+        logError('Delete page failed', error);
+        alert('Възникна грешка при изтриване на страница.');
+    }
+}
+
+const pageForm = document.getElementById('page-form');
+if (pageForm) {
+    pageForm.addEventListener('submit', async function(e) {
+        e.preventDefault();
+
+        const pageId = document.getElementById('page-id').value;
+        const pageName = document.getElementById('page-name').value;
+
+        const isEdit = pageId !== '';
+        const url = isEdit ? `/api/pages/${pageId}` : '/api/pages';
+        const method = isEdit ? 'PUT' : 'POST';
+
+        try {
+            const response = await fetch(url, {
+                method: method,
+                headers: {
+                    'Content-Type': 'application/json'
+                },
+                body: JSON.stringify({ name: pageName })
+            });
+
+            const result = await response.json();
+
+            if (result.success) {
+                alert(isEdit ? 'Страницата е преименувана успешно.' : 'Страницата е добавена успешно.');
+                closePageModal();
+                location.reload();
+            } else {
+                alert(result.error || 'Неуспешно запазване на страница.');
+            }
+        } catch (error) {
+            logError('Save page failed', error);
+            alert('Възникна грешка при запазване на страница.');
+        }
+    });
+}
+
+function filterEntries() {
+    const selectedPage = document.getElementById('filter-page').value;
+    const entries = document.querySelectorAll('.entry-item');
+
+    entries.forEach(entry => {
+        if (selectedPage === 'all') {
+            entry.style.display = 'flex';
+        } else {
+            const entryPageId = entry.getAttribute('data-page-id');
+            if (entryPageId === selectedPage) {
+                entry.style.display = 'flex';
+            } else {
+                entry.style.display = 'none';
+            }
+        }
+    });
+}
+
@@ -81,15 +81,90 @@ function setupProfileToggle() {
     });
 }
 
+let loadingPanels = false;
+
+async function loadMorePanels(sentinel) {
+    if (loadingPanels || !sentinel.isConnected) {
+        return;
+    }
+    loadingPanels = true;
+    const params = new URLSearchParams();
+    params.set('page', sentinel.dataset.page);
+    params.set('cursor', sentinel.dataset.nextCursor);
+    try {
+        const response = await fetch(`/api/panels?${params.toString()}`);
+        const data = await response.json();
+        if (!data.success) {
+            logError('Loading panels failed', data.error);
+            return;
+        }
+        sentinel.insertAdjacentHTML('beforebegin', data.html);
+        if (data.next_cursor === null) {
+            sentinel.remove();
+        } else {
+            sentinel.dataset.nextCursor = data.next_cursor;
+        }
+        syncToggleAllState();
+    } catch (err) {
+        logError('Loading panels failed', err);
+    } finally {
+        loadingPanels = false;
+    }
+}
+
+function setupLazyPanels() {
+    const sentinel = document.querySelector('.panels-sentinel');
+    if (!sentinel || !('IntersectionObserver' in window)) {
+        return;
+    }
+    const observer = new IntersectionObserver(async items => {
+        if (!items.some(item => item.isIntersecting)) {
+            return;
+        }
+        await loadMorePanels(sentinel);
+        if (!sentinel.isConnected) {
+            observer.disconnect();
+            return;
+        }
+        // Re-observing fires again if the sentinel is still on screen after the insert.
+        observer.unobserve(sentinel);
+        observer.observe(sentinel);
+    }, { rootMargin: '400px 0px' });
+    observer.observe(sentinel);
+    sentinel.addEventListener('click', event => {
+        event.preventDefault();
+        loadMorePanels(sentinel);
+    });
+}
+
 // Initialize all panels as collapsed on page load
 document.addEventListener('DOMContentLoaded', function() {
     setAllPanels(false);
     syncToggleAllState();
     setupProfileToggle();
+    setupLazyPanels();
     log('Main UI ready');
 });
 
 let searchTimeout = null;
+const SEARCH_PAGE_SIZE = 50;
+const SEARCH_FIELDS = 'title,heading,aop_number,publish_date,internal_number,content,files,pdf_files,date';
+let searchState = { query: '', offset: 0, total: 0 };
+
+async function fetchSearchPage(query, offset) {
+    const params = new URLSearchParams(window.location.search);
+    const pageId = params.get('page');
+    const searchParams = new URLSearchParams();
+    searchParams.set('q', query);
+    searchParams.set('limit', SEARCH_PAGE_SIZE);
+    searchParams.set('offset', offset);
+    searchParams.set('fields', SEARCH_FIELDS);
+    if (pageId) {
+        searchParams.set('page', pageId);
+    }
+    const response = await fetch(`/api/search?${searchParams.toString()}`);
+    return response.json();
+}
 
 async function searchEntries(query) {
     clearTimeout(searchTimeout);
@@ -102,35 +177,54 @@ async function searchEntries(query) {
             return;
         }
 
-        const params = new URLSearchParams(window.location.search);
-        const pageId = params.get('page');
-        const searchParams = new URLSearchParams();
-        searchParams.set('q', trimmed);
-        if (pageId) {
-            searchParams.set('page', pageId);
-        }
-
         try {
-            const response = await fetch(
-                `/api/search?${searchParams.toString()}`
-            );
-
-            const entries = await response.json();
-            renderEntries(entries);
+            const data = await fetchSearchPage(trimmed, 0);
+            searchState = { query: trimmed, offset: data.results.length, total: data.total };
+            renderEntries(data.results);
         } catch (err) {
             logError('Search failed', err);
         }
     }, 300);
 }
 
-function renderEntries(entries) {
+async function loadMoreSearchResults() {
+    try {
+        const data = await fetchSearchPage(searchState.query, searchState.offset);
+        searchState.offset += data.results.length;
+        searchState.total = data.total;
+        renderEntries(data.results, true);
+    } catch (err) {
+        logError('Search failed', err);
+    }
+}
+
+function renderSearchMoreButton(container) {
+    const existing = container.querySelector('.search-more');
+    if (existing) {
+        existing.remove();
+    }
+    if (searchState.offset >= searchState.total) {
+        return;
+    }
+    container.insertAdjacentHTML('beforeend', `
+        <div class="search-more">
+            <button type="button" class="page-btn" onclick="loadMoreSearchResults()">
+                Покажи още (${searchState.total - searchState.offset})
+            </button>
+        </div>
+    `);
+}
+
+function renderEntries(entries, append = false) {
     const container = document.querySelector('.entries-container');
     if (!container) {
         return;
     }
-    container.innerHTML = '';
+    if (!append) {
+        container.innerHTML = '';
+    }
 
-    if (!entries.length) {
+    if (!entries.length && !append) {
         container.innerHTML = '<div class="no-entries"><p>Няма намерени резултати.</p></div>';
         return;
     }
@@ -202,6 +296,7 @@ function renderEntries(entries) {
         `);
     });
 
+    renderSearchMoreButton(container);
     setAllPanels(false);
     syncToggleAllState();
 }
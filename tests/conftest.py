@@ -0,0 +1,67 @@
+import importlib
+import sys
+from logging.handlers import RotatingFileHandler
+
+import pytest
+
+
+@pytest.fixture
+def load_app(tmp_path, monkeypatch):
+    """Import app afresh with its data, uploads and logs in tmp_path; returns the module."""
+    loaded = []
+
+    def load(backend='json', prepare=True):
+        monkeypatch.setenv('DATA_DIR', str(tmp_path / 'data'))
+        monkeypatch.setenv('UPLOAD_FOLDER', str(tmp_path / 'uploads'))
+        monkeypatch.setenv('LOG_DIR', str(tmp_path / 'logs'))
+        monkeypatch.setenv('STORAGE_BACKEND', backend)
+        for name in ('SQLITE_PATH', 'RENDER_CACHE_DIR', 'FILE_OFFLOAD'):
+            monkeypatch.delenv(name, raising=False)
+        sys.modules.pop('app', None)
+        module = importlib.import_module('app')
+        module.app.config['TESTING'] = True
+        if prepare:
+            module.prepare_data()
+            module.get_repository().save_pages(
+                [{'id': page_id, 'name': f'Page {page_id}', 'searchable': True} for page_id in (1, 2, 3)]
+            )
+        loaded.append(module)
+        return module
+
+    yield load
+    for module in loaded:
+        if module.attachment_texts.executor is not None:
+            module.attachment_texts.executor.shutdown(wait=True)
+        for handler in list(module.app.logger.handlers):
+            if isinstance(handler, RotatingFileHandler):
+                module.app.logger.removeHandler(handler)
+                handler.close()
+    sys.modules.pop('app', None)
+
+
+@pytest.fixture
+def app_module(load_app):
+    return load_app()
+
+
+@pytest.fixture(params=['json', 'sqlite'])
+def any_backend(request, load_app):
+    return load_app(request.param)
+
+
+def admin_client(module):
+    client = module.app.test_client()
+    with client.session_transaction() as session:
+        session['admin_authenticated'] = True
+    return client
+
+
+@pytest.fixture
+def admin(app_module):
+    return admin_client(app_module)
+
+
+def add_entry(client, title, page_id=1, **fields):
+    response = client.post('/api/entries', data={'title': title, 'page_id': str(page_id), **fields})
+    assert response.status_code == 200, response.get_json()
+    return response.get_json()['entry']
@@ -0,0 +1,61 @@
+import json
+
+from conftest import add_entry, admin_client
+
+
+def statuses(response):
+    assert response.status_code == 200, response.get_json()
+    return [result['status'] for result in response.get_json()['results']]
+
+
+def test_bulk_reports_created_duplicate_and_invalid(any_backend):
+    client = admin_client(any_backend)
+    existing = add_entry(client, 'Доставка на мляко', publish_date='01.02.2026')
+    items = [
+        {'page_id': 1, 'title': '  ДОСТАВКА   на мляко ', 'publish_date': '01.02.2026'},
+        {'page_id': 1, 'title': 'Ремонт на покрив', 'publish_date': '03.02.2026'},
+        {'page_id': 1, 'title': 'ремонт на  покрив', 'publish_date': '03.02.2026'},
+        {'page_id': 2, 'title': 'Ремонт на покрив', 'publish_date': '03.02.2026'},
+        {'page_id': 1, 'title': ''},
+        {'page_id': 42, 'title': 'Непозната страница'},
+        'not an object',
+    ]
+
+    response = client.post('/api/entries/bulk', json=items)
+
+    assert statuses(response) == ['duplicate', 'created', 'duplicate', 'created', 'invalid', 'invalid', 'invalid']
+    body = response.get_json()
+    assert (body['created'], body['duplicate'], body['invalid']) == (2, 2, 3)
+    created_ids = [result['id'] for result in body['results'] if result['status'] == 'created']
+    assert created_ids == [existing['id'] + 1, existing['id'] + 2]
+    repo = any_backend.get_repository()
+    assert repo.count_entries() == 3
+    assert statuses(client.post('/api/entries/bulk', json=items[1:2])) == ['duplicate']
+
+
+def test_bulk_dedup_follows_deletes(app_module, admin):
+    entry = add_entry(admin, 'Доставка', publish_date='01.02.2026')
+    item = {'page_id': 1, 'title': 'Доставка', 'publish_date': '01.02.2026'}
+    assert statuses(admin.post('/api/entries/bulk', json=[item])) == ['duplicate']
+    admin.delete(f"/api/entries/{entry['id']}")
+    assert statuses(admin.post('/api/entries/bulk', json=[item])) == ['created']
+
+
+def test_bulk_accepts_ndjson(app_module, admin):
+    body = '\n'.join([json.dumps({'page_id': 1, 'title': 'Първи'}), '{broken', '', json.dumps({'page_id': 1, 'title': 'Втори'})])
+    response = admin.post('/api/entries/bulk', data=body, content_type='application/x-ndjson')
+    assert statuses(response) == ['created', 'invalid', 'created']
+
+
+def test_bulk_rejects_oversized_batches(app_module, admin):
+    items = [{'page_id': 1, 'title': f'Entry {n}'} for n in range(app_module.BULK_MAX_ITEMS + 1)]
+    assert admin.post('/api/entries/bulk', json=items).status_code == 400
+    assert admin.post('/api/entries/bulk', json={'title': 'x'}).status_code == 400
+    assert app_module.get_repository().count_entries() == 0
+
+
+def test_bulk_is_one_journal_write(app_module, admin):
+    app = app_module
+    version = app.current_data_stamp()[0]
+    admin.post('/api/entries/bulk', json=[{'page_id': 1, 'title': f'Entry {n}'} for n in range(5)])
+    assert app.current_data_stamp()[0] == version + 1
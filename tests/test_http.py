@@ -0,0 +1,93 @@
+import gzip
+import json
+
+from conftest import add_entry, admin_client
+
+
+def test_index_revalidates_until_data_changes(any_backend):
+    client = admin_client(any_backend)
+    add_entry(client, 'Първи')
+
+    first = client.get('/')
+    etag = first.headers['ETag']
+    assert first.status_code == 200
+    assert 'no-cache' in first.headers['Cache-Control']
+    assert client.get('/', headers={'If-None-Match': etag}).status_code == 304
+
+    add_entry(client, 'Втори')
+    changed = client.get('/', headers={'If-None-Match': etag})
+    assert changed.status_code == 200
+    assert changed.headers['ETag'] != etag
+
+
+def test_validators_differ_per_url(app_module, admin):
+    add_entry(admin, 'Първи')
+    assert admin.get('/').headers['ETag'] != admin.get('/?page=1').headers['ETag']
+
+
+def test_api_entries_not_modified(any_backend):
+    client = admin_client(any_backend)
+    add_entry(client, 'Първи')
+    response = client.get('/api/entries')
+    assert client.get('/api/entries', headers={'If-None-Match': response.headers['ETag']}).status_code == 304
+
+
+def test_failed_write_keeps_validators(app_module, admin):
+    add_entry(admin, 'Първи')
+    etag = admin.get('/').headers['ETag']
+    assert admin.post('/api/entries', data={'title': ''}).status_code == 400
+    assert admin.get('/', headers={'If-None-Match': etag}).status_code == 304
+
+
+def test_change_feed(any_backend):
+    client = admin_client(any_backend)
+    kept = add_entry(client, 'Остава')
+    removed = add_entry(client, 'Изтрит')
+    since = client.get('/api/entries?since=0').get_json()['version']
+
+    client.put(f"/api/entries/{kept['id']}", data={'title': 'Променен', 'page_id': '1'})
+    client.delete(f"/api/entries/{removed['id']}")
+    added = add_entry(client, 'Нов')
+
+    feed = client.get(f'/api/entries?since={since}').get_json()
+    assert feed['full'] is False
+    assert sorted(entry['id'] for entry in feed['entries']) == sorted([kept['id'], added['id']])
+    assert feed['deleted'] == [removed['id']]
+    assert client.get(f"/api/entries?since={feed['version']}").get_json()['entries'] == []
+
+
+def test_change_feed_before_floor_is_a_full_resync(app_module, admin):
+    app = app_module
+    add_entry(admin, 'Първи')
+    app.get_repository().replace_entries(app.get_repository().list_entries())
+    feed = admin.get('/api/entries?since=0').get_json()
+    assert feed['full'] is True
+    assert len(feed['entries']) == 1
+
+
+def read_ndjson(body):
+    return [json.loads(line) for line in body.decode('utf-8').splitlines() if line]
+
+
+def test_export_filters_by_publish_date(any_backend):
+    client = admin_client(any_backend)
+    add_entry(client, 'Януари', publish_date='15.01.2026')
+    february = add_entry(client, 'Февруари', publish_date='2026-02-01')
+    add_entry(client, 'Без дата')
+
+    response = client.get('/api/entries/export?from=2026-02-01&to=2026-02-28')
+    assert response.status_code == 200
+    assert 'Accept-Encoding' in response.headers['Vary']
+    assert [entry['id'] for entry in read_ndjson(response.data)] == [february['id']]
+    assert len(read_ndjson(client.get('/api/entries/export').data)) == 3
+    assert client.get('/api/entries/export?from=01.02.2026').status_code == 400
+
+
+def test_export_gzip_follows_accept_encoding(app_module, admin):
+    add_entry(admin, 'Първи')
+    compressed = admin.get('/api/entries/export', headers={'Accept-Encoding': 'gzip'})
+    assert compressed.headers['Content-Encoding'] == 'gzip'
+    assert len(read_ndjson(gzip.decompress(compressed.data))) == 1
+    refused = admin.get('/api/entries/export', headers={'Accept-Encoding': 'gzip;q=0, identity'})
+    assert 'Content-Encoding' not in refused.headers
+    assert len(read_ndjson(refused.data)) == 1
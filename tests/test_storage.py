@@ -0,0 +1,81 @@
+import json
+import os
+
+from conftest import add_entry, admin_client
+
+
+def read_lines(path):
+    with open(path, encoding='utf-8') as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def test_import_does_not_touch_data(load_app):
+    app = load_app(prepare=False)
+    assert not os.path.exists(app.META_FILE)
+
+    app.app.test_client().get('/')
+
+    meta = app.load_meta()
+    assert meta['schema_version'] == app.SCHEMA_VERSION
+    assert 'changes_floor' in meta
+    assert app.migrate_data() is False
+
+
+def test_writes_go_to_the_journal_and_replay(app_module, admin):
+    app = app_module
+    first = add_entry(admin, 'First', publish_date='01.02.2026')
+    second = add_entry(admin, 'Second', publish_date='02.02.2026')
+    admin.delete(f"/api/entries/{first['id']}")
+
+    assert [op['op'] for op in read_lines(app.ENTRIES_JOURNAL_FILE)] == ['put', 'put', 'delete']
+    assert app.load_json_file(app.DATA_FILE, []) == []
+    assert [entry['id'] for entry in app.read_entries()] == [second['id']]
+
+
+def test_compaction_folds_the_journal_without_a_new_version(app_module, admin):
+    app = app_module
+    entries = [add_entry(admin, f'Entry {n}') for n in range(3)]
+    admin.delete(f"/api/entries/{entries[0]['id']}")
+    version = app.current_data_stamp()[0]
+
+    app.compact_entries_journal()
+
+    assert read_lines(app.ENTRIES_JOURNAL_FILE) == []
+    stored = app.load_json_file(app.DATA_FILE, [])
+    assert sorted(entry['id'] for entry in stored) == sorted(entry['id'] for entry in entries[1:])
+    assert app.current_data_stamp()[0] == version
+    assert sorted(entry['id'] for entry in app.get_repository().list_entries()) == [e['id'] for e in entries[1:]]
+
+
+def test_torn_journal_line_is_skipped(app_module, admin):
+    app = app_module
+    entry = add_entry(admin, 'Kept')
+    with open(app.ENTRIES_JOURNAL_FILE, 'a', encoding='utf-8') as f:
+        f.write('{"op": "put", "entry": {"id": 99')
+    assert [item['id'] for item in app.read_entries()] == [entry['id']]
+
+
+def test_ids_are_not_reused_after_delete(app_module, admin):
+    entry = add_entry(admin, 'Old')
+    admin.delete(f"/api/entries/{entry['id']}")
+    assert add_entry(admin, 'New')['id'] > entry['id']
+
+
+def test_deleting_an_unknown_entry_is_404(any_backend):
+    app = any_backend
+    client = admin_client(app)
+    version = app.get_repository().data_stamp()[0]
+
+    response = client.delete('/api/entries/12345')
+
+    assert response.status_code == 404
+    assert app.get_repository().data_stamp()[0] == version
+
+
+def test_backends_agree_on_listing(any_backend):
+    client = admin_client(any_backend)
+    created = [add_entry(client, f'Entry {n}', page_id=1 + n % 2) for n in range(4)]
+    repo = any_backend.get_repository()
+    assert [entry['id'] for entry in repo.list_entries()] == [entry['id'] for entry in reversed(created)]
+    assert repo.count_entries(1) == 2
+    assert repo.page_counts() == {1: 2, 2: 2}
@@ -0,0 +1,113 @@
+import hashlib
+import os
+import time
+
+from conftest import add_entry
+
+
+PDF_BYTES = b'%PDF-1.4\n' + bytes(range(256)) * 40
+
+
+def start_upload(client, name='doc.pdf', size=len(PDF_BYTES)):
+    response = client.post('/api/uploads', json={'name': name, 'size': size})
+    assert response.status_code == 201, response.get_json()
+    return response.get_json()['upload']['id']
+
+
+def put_chunk(client, upload_id, start, end, data=PDF_BYTES):
+    return client.put(f'/api/uploads/{upload_id}', data=data[start:end + 1],
+                      headers={'Content-Range': f'bytes {start}-{end}/{len(data)}'})
+
+
+def upload(client, data=PDF_BYTES):
+    upload_id = start_upload(client, size=len(data))
+    half = len(data) // 2
+    assert put_chunk(client, upload_id, 0, half - 1, data).status_code == 200
+    assert put_chunk(client, upload_id, half, len(data) - 1, data).status_code == 200
+    response = client.post(f'/api/uploads/{upload_id}/finish')
+    assert response.status_code == 200
+    return upload_id, response.get_json()['upload']
+
+
+def test_chunked_upload_is_stored_by_content_hash(app_module, admin):
+    upload_id, state = upload(admin)
+    assert state['filename'] == f'{hashlib.sha256(PDF_BYTES).hexdigest()}.pdf'
+
+    entry = add_entry(admin, 'С файл', upload_ids=f'["{upload_id}"]')
+
+    assert [item['filename'] for item in entry['pdf_files']] == [state['filename']]
+    assert admin.get(f'/api/uploads/{upload_id}').status_code == 404
+    with open(os.path.join(app_module.app.config['UPLOAD_FOLDER'], state['filename']), 'rb') as f:
+        assert f.read() == PDF_BYTES
+
+
+def test_chunks_must_arrive_in_order(app_module, admin):
+    upload_id = start_upload(admin)
+    assert put_chunk(admin, upload_id, 100, 199).status_code == 409
+    assert put_chunk(admin, upload_id, 0, 99).status_code == 200
+    # A retried chunk the server already has is accepted without writing it twice.
+    assert put_chunk(admin, upload_id, 0, 99).get_json()['upload']['received'] == 100
+    assert admin.post(f'/api/uploads/{upload_id}/finish').status_code == 409
+
+
+def test_upload_rejects_other_file_types(app_module, admin):
+    response = admin.post('/api/uploads', json={'name': 'script.exe', 'size': 10})
+    assert response.status_code == 400
+
+
+def test_range_requests(app_module, admin):
+    _, state = upload(admin)
+    url = f"/uploads/{state['filename']}"
+
+    full = admin.get(url)
+    assert full.status_code == 200
+    assert full.headers['Accept-Ranges'] == 'bytes'
+    assert 'immutable' in full.headers['Cache-Control']
+
+    partial = admin.get(url, headers={'Range': 'bytes=10-19'})
+    assert partial.status_code == 206
+    assert partial.data == PDF_BYTES[10:20]
+    assert partial.headers['Content-Range'] == f'bytes 10-19/{len(PDF_BYTES)}'
+
+    assert admin.get(url, headers={'Range': f'bytes={len(PDF_BYTES) + 10}-'}).status_code == 416
+    assert admin.get('/uploads/missing.pdf').status_code == 404
+
+
+def age(app, upload_id, seconds):
+    path = os.path.join(app.upload_sessions.directory, f'{upload_id}.json')
+    stamp = time.time() - seconds
+    os.utime(path, (stamp, stamp))
+
+
+def test_idle_upload_sessions_expire_when_a_new_one_starts(app_module, admin):
+    app = app_module
+    stale = start_upload(admin)
+    fresh = start_upload(admin)
+    age(app, stale, app.UPLOAD_SESSION_TTL_SECONDS + 60)
+    app.upload_sessions.swept_at = 0
+
+    start_upload(admin)
+
+    assert admin.get(f'/api/uploads/{stale}').status_code == 404
+    assert admin.get(f'/api/uploads/{fresh}').status_code == 200
+    assert not os.path.exists(os.path.join(app.upload_sessions.directory, f'{stale}.part'))
+
+
+def test_upload_session_sweeps_are_rate_limited(app_module, admin):
+    app = app_module
+    start_upload(admin)
+    stale = start_upload(admin)
+    age(app, stale, app.UPLOAD_SESSION_TTL_SECONDS + 60)
+
+    start_upload(admin)
+
+    assert admin.get(f'/api/uploads/{stale}').status_code == 200
+
+
+def test_upload_sessions_do_not_trigger_prewarm(app_module, admin, monkeypatch):
+    calls = []
+    monkeypatch.setattr(app_module.render_cache, 'schedule_prewarm', lambda: calls.append(1))
+    upload(admin)
+    assert calls == []
+    add_entry(admin, 'Запис')
+    assert calls == [1]
@@ -1,23 +1,32 @@
 ﻿#!/usr/bin/env python
 import argparse
 import csv
+import hashlib
 import json
 import os
 import re
 import sys
+import threading
 import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
+from itertools import islice
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 from urllib.parse import urlparse, urljoin
 
 import requests
 from bs4 import BeautifulSoup
+from requests.structures import CaseInsensitiveDict
 
 try:
-    import lxml  # noqa: F401
+    import lxml.etree
+    import lxml.html
     HTML_PARSER = "lxml"
 except Exception:
+    lxml = None
     HTML_PARSER = "html.parser"
 
 DATE_RE = re.compile(r"([0-9]{2}\.[0-9]{2}\.[0-9]{4})")
@@ -36,6 +45,530 @@ ALLOWED_CONTENT_TYPES = {
     "application/octet-stream",
 }
 ALLOWED_EXTENSIONS = (".pdf", ".doc", ".docx", ".xls", ".xlsx")
+# Wayback snapshot URLs (/web/<timestamp>/...) never change, so a good result for them never expires.
+SNAPSHOT_URL_RE = re.compile(r"^https?://web\.archive\.org/web/[0-9]+")
+# POST /api/entries/bulk rejects larger batches (BULK_MAX_ITEMS in app.py).
+BULK_MAX_ITEMS = 1000
+
+
+def normalize_text(text: str) -> str:
+    return " ".join((text or "").split())
+
+
+def normalize_for_compare(text: str) -> str:
+    return normalize_text(text).casefold()
+
+
+EntryKey = Tuple[int, str, str]
+
+
+def duplicate_key(page_id, title: str, publish_date: str) -> EntryKey:
+    return int(page_id or 0), normalize_for_compare(title), normalize_text(publish_date)
+
+
+def clean_aop_number(value: str) -> str:
+    if not value:
+        return ""
+    if DATE_DOTTED_RE.search(value):
+        return ""
+    cleaned = "".join(ch for ch in value if ch.isdigit() or ch in "/-")
+    if not any(ch.isdigit() for ch in cleaned):
+        return ""
+    return cleaned
+
+
+def extract_labeled_value(lines: List[str], label: str) -> Tuple[bool, str]:
+    for idx, line in enumerate(lines):
+        if label in line:
+            remainder = line.split(label, 1)[1].strip()
+            if remainder:
+                return True, normalize_text(remainder).strip(" ;:.-")
+            if idx + 1 < len(lines):
+                return True, normalize_text(lines[idx + 1]).strip(" ;:.-")
+            return True, ""
+    return False, ""
+
+
+def extract_publish_date(lines: List[str]) -> str:
+    found, remainder = extract_labeled_value(lines, LABEL_PUBLISH_DATE)
+    if not found:
+        return ""
+    match = DATE_RE.search(remainder)
+    if match:
+        return match.group(1)
+    return ""
+
+
+def normalize_file_url(href: str, base_url: str) -> str:
+    if not href:
+        return ""
+    if href.startswith("/web/"):
+        return f"https://web.archive.org{href}"
+    if href.startswith("http://") or href.startswith("https://"):
+        return href
+    return urljoin(base_url, href)
+
+
+def extract_files(body_el, base_url: str) -> List[Dict]:
+    files = []
+    label = None
+    for tag in body_el.find_all(["strong", "b"]):
+        if normalize_text(tag.get_text(" ", strip=True)).casefold() == "файлове":
+            label = tag
+            break
+    if not label:
+        for node in body_el.find_all(string=True):
+            if "Файлове" in normalize_text(str(node)):
+                label = node.parent
+                break
+
+    files_list_el = None
+    if label:
+        candidate = label.find_next(["ul", "ol"])
+        if candidate and body_el in candidate.parents:
+            files_list_el = candidate
+        else:
+            siblings = []
+            for sib in label.parent.next_siblings:
+                if getattr(sib, "name", None) in ["ul", "ol"]:
+                    files_list_el = sib
+                    break
+                if getattr(sib, "name", None) == "li":
+                    siblings.append(sib)
+                if siblings and getattr(sib, "name", None) not in ["li", None]:
+                    break
+            if not files_list_el and siblings:
+                files_list_el = siblings
+
+    if not files_list_el:
+        return files
+
+    list_items = []
+    if isinstance(files_list_el, list):
+        list_items = files_list_el
+    else:
+        list_items = files_list_el.find_all("li")
+
+    for li in list_items:
+        link = li.find("a", href=True)
+        if not link:
+            continue
+        name = normalize_text(link.get_text(" ", strip=True))
+        raw_url = (link.get("href") or "").strip()
+        url = normalize_file_url(raw_url, base_url)
+        li_text = normalize_text(li.get_text(" ", strip=True))
+        published = ""
+        match = PUBLISHED_RE.search(li_text)
+        if match:
+            published = normalize_text(match.group(1)).strip()
+        if name or url:
+            files.append({
+                "name": name,
+                "url": url,
+                "published_at": published,
+            })
+
+    return files
+
+
+def parse_offer_page(panel, source_url: str, subtopic: str, log: List[str]) -> Optional[Dict]:
+    title_el = panel.select_one(".panel-heading .panel-title") or panel.select_one(".panel-title")
+    title = normalize_text(title_el.get_text(" ", strip=True)) if title_el else ""
+    if not title:
+        log.append("  !! Missing title for panel, skipping")
+        return None
+
+    body_el = panel.select_one(".panel-collapse .panel-body") or panel.select_one(".panel-body")
+
+    if not body_el:
+        log.append(f"  !! Missing body for panel '{title}', skipping")
+        return None
+
+    body_text = body_el.get_text("\n", strip=True)
+    files = extract_files(body_el, source_url)
+    return build_offer_entry(title, body_text, files, source_url)
+
+
+def build_offer_entry(title: str, body_text: str, files: List[Dict], source_url: str) -> Dict:
+    lines = [normalize_text(line) for line in body_text.splitlines() if normalize_text(line)]
+    publish_date = extract_publish_date(lines)
+    _, aop_raw = extract_labeled_value(lines, LABEL_AOP)
+    aop_number = clean_aop_number(aop_raw)
+    _, internal_number = extract_labeled_value(lines, LABEL_INTERNAL)
+
+    heading = title
+    if normalize_for_compare(heading) == normalize_for_compare(title):
+        heading = ""
+
+    content_lines = []
+    if files:
+        content_lines.append("Файлове:")
+        for f in files:
+            name = f.get("name") or ""
+            if name:
+                content_lines.append(f"- {name}")
+    content = "\n".join(content_lines)
+
+    entry = {
+        "title": title,
+        "heading": heading,
+        "publish_date": publish_date,
+        "aop_number": aop_number,
+        "internal_number": internal_number,
+        "files": files,
+        "content": content,
+        "pdf_files": [],
+        "source_url": source_url,
+        "imported_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+    }
+    return entry
+
+
+ParsedPanels = List[Tuple[Optional[Dict], List[str]]]
+
+
+def parse_page_soup(html: str, source_url: str, subtopic: str) -> ParsedPanels:
+    soup = BeautifulSoup(html, HTML_PARSER)
+    parsed = []
+    for panel in soup.select(".panel.panel-default"):
+        log: List[str] = []
+        parsed.append((parse_offer_page(panel, source_url, subtopic, log), log))
+    return parsed
+
+
+class SoupFallback(Exception):
+    """The lxml fast path met markup it does not handle; parse the page with BeautifulSoup instead."""
+
+
+def xpath_class(name: str) -> str:
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+PANEL_XPATH = f"//*[{xpath_class('panel')} and {xpath_class('panel-default')}]"
+TITLE_XPATHS = (
+    f"(.//*[{xpath_class('panel-heading')}]//*[{xpath_class('panel-title')}])[1]",
+    f"(.//*[{xpath_class('panel-title')}])[1]",
+)
+BODY_XPATHS = (
+    f"(.//*[{xpath_class('panel-collapse')}]//*[{xpath_class('panel-body')}])[1]",
+    f"(.//*[{xpath_class('panel-body')}])[1]",
+)
+
+
+def lxml_text(el, separator: str) -> str:
+    """Same result as BeautifulSoup's get_text(separator, strip=True)."""
+    if el.xpath(".//script | .//style | .//template"):
+        raise SoupFallback("script/style content")
+    return separator.join(t.strip() for t in el.xpath(".//text()") if t.strip())
+
+
+def lxml_first(el, xpaths: Tuple[str, ...]):
+    for xpath in xpaths:
+        found = el.xpath(xpath)
+        if found:
+            return found[0]
+    return None
+
+
+def extract_files_lxml(body_el, base_url: str) -> List[Dict]:
+    label = None
+    for tag in body_el.iter("strong", "b"):
+        if normalize_text(lxml_text(tag, " ")).casefold() == "файлове":
+            label = tag
+            break
+    if label is None:
+        for node in body_el.xpath(".//text()"):
+            if "Файлове" in normalize_text(str(node)):
+                label = node.getparent().getparent() if node.is_tail else node.getparent()
+                break
+    if label is None:
+        return []
+
+    # The known layout: the first list after the label, inside the panel body.
+    found = label.xpath("(descendant::ul | descendant::ol | following::ul | following::ol)[1]")
+    if not found or body_el not in found[0].iterancestors():
+        raise SoupFallback("files list outside the usual layout")
+
+    files = []
+    for li in found[0].iter("li"):
+        links = li.xpath(".//a[@href]")
+        if not links:
+            continue
+        name = normalize_text(lxml_text(links[0], " "))
+        url = normalize_file_url((links[0].get("href") or "").strip(), base_url)
+        match = PUBLISHED_RE.search(normalize_text(lxml_text(li, " ")))
+        published = normalize_text(match.group(1)).strip() if match else ""
+        if name or url:
+            files.append({"name": name, "url": url, "published_at": published})
+    return files
+
+
+def parse_page_lxml(html: str, source_url: str, subtopic: str) -> ParsedPanels:
+    try:
+        doc = lxml.html.fromstring(html)
+    except ValueError as exc:
+        # lxml refuses str input that carries an XML encoding declaration.
+        raise SoupFallback(str(exc)) from exc
+    parsed = []
+    for panel in doc.xpath(PANEL_XPATH):
+        log: List[str] = []
+        title_el = lxml_first(panel, TITLE_XPATHS)
+        title = normalize_text(lxml_text(title_el, " ")) if title_el is not None else ""
+        if not title:
+            log.append("  !! Missing title for panel, skipping")
+            parsed.append((None, log))
+            continue
+        body_el = lxml_first(panel, BODY_XPATHS)
+        if body_el is None:
+            log.append(f"  !! Missing body for panel '{title}', skipping")
+            parsed.append((None, log))
+            continue
+        files = extract_files_lxml(body_el, source_url)
+        parsed.append((build_offer_entry(title, lxml_text(body_el, "\n"), files, source_url), log))
+    return parsed
+
+
+def parse_page(html: str, source_url: str, subtopic: str) -> ParsedPanels:
+    """Parse an archive page into (entry or None, log lines) per panel.
+
+    Uses direct lxml/XPath extraction for the known .panel.panel-default
+    layout and falls back to BeautifulSoup for anything else. Module level
+    so it can run in a process pool. Unexpected errors in the fast path are
+    reported on stderr before falling back, so a broken fast path is visible.
+    """
+    if lxml is not None:
+        try:
+            return parse_page_lxml(html, source_url, subtopic)
+        except (SoupFallback, lxml.etree.ParserError):
+            pass
+        except Exception as exc:
+            print(f"Warning: lxml parser failed on {source_url}, using BeautifulSoup: {exc!r}",
+                  file=sys.stderr, flush=True)
+    return parse_page_soup(html, source_url, subtopic)
+
+
+class HostRateLimiter:
+    """Token bucket per host: `rate` requests per second, bursts of up to `burst` requests."""
+
+    def __init__(self, rate: float, burst: int = 1) -> None:
+        self.rate = rate
+        self.burst = max(1, burst)
+        self.lock = threading.Lock()
+        self.buckets: Dict[str, Tuple[float, float]] = {}
+
+    def acquire(self, url: str) -> None:
+        if self.rate <= 0:
+            return
+        host = urlparse(url).netloc.lower()
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                tokens, updated = self.buckets.get(host, (float(self.burst), now))
+                tokens = min(float(self.burst), tokens + (now - updated) * self.rate)
+                if tokens >= 1:
+                    self.buckets[host] = (tokens - 1, now)
+                    return
+                self.buckets[host] = (tokens, now)
+                wait = (1 - tokens) / self.rate
+            time.sleep(wait)
+
+
+class ResponseCache:
+    """On-disk cache of successful GET responses for Wayback snapshot URLs, keyed by sha256 of the URL.
+
+    Each entry is a <key>.body file with the raw bytes plus a <key>.json file
+    with url, headers and fetched_at. Reads touch the body's mtime, and the
+    least recently used entries are evicted once the total body size passes
+    max_bytes.
+    """
+
+    def __init__(self, directory: str, max_bytes: int) -> None:
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+        self.sizes: Dict[str, int] = {}
+        for name in os.listdir(directory):
+            if name.endswith(".body"):
+                self.sizes[name[:-5]] = os.path.getsize(os.path.join(directory, name))
+        self.total = sum(self.sizes.values())
+
+    def _paths(self, url: str) -> Tuple[str, str, str]:
+        key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        base = os.path.join(self.directory, key)
+        return key, f"{base}.body", f"{base}.json"
+
+    def get(self, url: str) -> Optional[requests.Response]:
+        _, body_path, meta_path = self._paths(url)
+        try:
+            with open(meta_path, "r", encoding="utf-8") as f:
+                meta = json.load(f)
+            with open(body_path, "rb") as f:
+                body = f.read()
+            os.utime(body_path)
+        except (OSError, ValueError):
+            return None
+        if meta.get("url") != url:
+            return None
+        resp = requests.Response()
+        resp.status_code = 200
+        resp.url = url
+        resp.headers = CaseInsensitiveDict(meta.get("headers") or {})
+        resp._content = body
+        return resp
+
+    @staticmethod
+    def _write_atomic(path: str, data: bytes) -> None:
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+    def put(self, url: str, resp: requests.Response) -> None:
+        key, body_path, meta_path = self._paths(url)
+        meta = {
+            "url": url,
+            "headers": dict(resp.headers),
+            "fetched_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        }
+        body = resp.content
+        self._write_atomic(body_path, body)
+        self._write_atomic(meta_path, json.dumps(meta, ensure_ascii=False).encode("utf-8"))
+        with self.lock:
+            self.total += len(body) - self.sizes.get(key, 0)
+            self.sizes[key] = len(body)
+            if self.total > self.max_bytes:
+                self.evict()
+
+    def evict(self) -> None:
+        def last_used(key: str) -> float:
+            try:
+                return os.path.getmtime(os.path.join(self.directory, f"{key}.body"))
+            except OSError:
+                return 0.0
+
+        for key in sorted(self.sizes, key=last_used):
+            if self.total <= self.max_bytes:
+                break
+            for suffix in (".body", ".json"):
+                try:
+                    os.remove(os.path.join(self.directory, f"{key}{suffix}"))
+                except OSError:
+                    pass
+            self.total -= self.sizes.pop(key)
+
+
+# Only these outcomes are cached; timeouts, connection errors, 429 and 5xx are checked again next run.
+DEFINITIVE_LINK_STATUSES = (404, 410)
+
+
+def is_definitive_link_result(result: Dict) -> bool:
+    status = result.get("status")
+    return isinstance(status, int) and (200 <= status < 300 or status in DEFINITIVE_LINK_STATUSES)
+
+
+class LinkCheckCache:
+    """Persistent attachment check results: url -> {ok, status, content_type, final_url, checked_at}."""
+
+    def __init__(self, path: Optional[str], ttl_seconds: float) -> None:
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.results: Dict[str, Dict] = {}
+        if path and os.path.isfile(path):
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                if isinstance(data, dict):
+                    self.results = data
+            except (OSError, ValueError):
+                self.results = {}
+
+    def get(self, url: str) -> Optional[Dict]:
+        result = self.results.get(url)
+        if not result or not is_definitive_link_result(result):
+            return None
+        if result.get("ok") and SNAPSHOT_URL_RE.match(url):
+            return result
+        if time.time() - result.get("checked_at", 0) > self.ttl_seconds:
+            return None
+        return result
+
+    def update(self, results: Dict[str, Dict]) -> None:
+        results = {url: result for url, result in results.items() if is_definitive_link_result(result)}
+        self.results.update(results)
+        if not self.path or not results:
+            return
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.results, f, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
+
+
+class ImportCheckpoint:
+    """Append-only JSONL journal of one CSV import, so an interrupted run can resume.
+
+    The first line identifies the run ({csv, flask_base}); then {"url": ...} is appended for every row
+    that finished and {"created": [page_id, title, publish_date]} for every entry the API accepted.
+    A journal written for another CSV or server is ignored and overwritten.
+    """
+
+    def __init__(self, path: str, csv_path: str, flask_base: str) -> None:
+        self.path = path
+        self.header = {"csv": os.path.abspath(csv_path), "flask_base": flask_base}
+        self.done_urls: Set[str] = set()
+        self.created_keys: Set[EntryKey] = set()
+        self.started = False
+        self.lock = threading.Lock()
+        self.load()
+
+    def load(self) -> None:
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                lines = f.read().splitlines()
+        except OSError:
+            return
+        records = []
+        for line in lines:
+            try:
+                records.append(json.loads(line))
+            except ValueError:
+                continue  # a torn last line from a killed run
+        if not records or records[0] != self.header:
+            return
+        self.started = True
+        for record in records[1:]:
+            if not isinstance(record, dict):
+                continue
+            if isinstance(record.get("url"), str):
+                self.done_urls.add(record["url"])
+            elif isinstance(record.get("created"), list) and len(record["created"]) == 3:
+                self.created_keys.add(duplicate_key(*record["created"]))
+
+    def append(self, record: Dict) -> None:
+        with self.lock:
+            with open(self.path, "a" if self.started else "w", encoding="utf-8") as f:
+                if not self.started:
+                    f.write(json.dumps(self.header, ensure_ascii=False) + "\n")
+                    self.started = True
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+
+    def mark_created(self, key: EntryKey) -> None:
+        self.created_keys.add(key)
+        self.append({"created": list(key)})
+
+    def mark_done(self, url: str) -> None:
+        self.done_urls.add(url)
+        self.append({"url": url})
+
+    def clear(self) -> None:
+        with self.lock:
+            self.done_urls.clear()
+            self.created_keys.clear()
+            self.started = False
+            if os.path.isfile(self.path):
+                os.remove(self.path)
 
 
 @dataclass
@@ -51,27 +584,102 @@ class Importer:
         flask_base: str,
         auth_user: Optional[str],
         auth_pass: Optional[str],
-        sleep_seconds: float,
+        rate: float,
         timeout: int,
         dry_run: bool,
+        state_file: Optional[str] = None,
+        batch_size: int = 0,
+        workers: int = 1,
+        burst: int = 1,
+        cache: Optional[ResponseCache] = None,
+        refresh: bool = False,
+        link_cache: Optional[LinkCheckCache] = None,
+        link_workers: int = 8,
+        parse_pool: Optional[ProcessPoolExecutor] = None,
+        checkpoint: Optional[ImportCheckpoint] = None,
+        mirror: bool = False,
     ) -> None:
         self.flask_base = flask_base.rstrip("/")
-        self.sleep_seconds = sleep_seconds
+        self.api_host = urlparse(self.flask_base).netloc.lower()
+        self.limiter = HostRateLimiter(rate, burst)
+        self.workers = max(1, workers)
+        self.cache = cache
+        self.refresh = refresh
+        self.link_cache = link_cache or LinkCheckCache(None, 0)
+        self.link_workers = max(1, link_workers)
+        self.parse_pool = parse_pool
         self.timeout = timeout
         self.dry_run = dry_run
-        self.session = requests.Session()
+        self._local = threading.local()
         self.api_auth = (auth_user, auth_pass) if auth_user and auth_pass else None
         self.pages_cache = None
         self.entries_cache = None
+        self.state_file = state_file
+        self.batch_size = batch_size
+        # (row url, entry) pairs waiting for the next bulk POST.
+        self.pending: List[Tuple[str, Dict]] = []
+        self.checkpoint = checkpoint
+        # Rows whose entries still sit in `pending`; checkpointed once their batch is accepted.
+        self.pending_urls: List[str] = []
+        # Rows with an entry the server did not create; never checkpointed, so the next run retries them.
+        self.failed_urls: Set[str] = set()
+        self.entry_keys: Set[EntryKey] = set()
+        self.mirror = mirror
+        self.created_ids: List[int] = []
+
+    @property
+    def session(self) -> requests.Session:
+        # requests.Session is not guaranteed thread-safe, so each worker gets its own.
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = self._local.session = requests.Session()
+        return session
 
     def log(self, message: str) -> None:
+        lines = getattr(self._local, "log_lines", None)
+        if lines is not None:
+            lines.append(message)
+            return
         print(message, flush=True)
 
-    def sleep(self) -> None:
-        if self.sleep_seconds > 0:
-            time.sleep(self.sleep_seconds)
+    @contextmanager
+    def capture_logs(self) -> Iterator[List[str]]:
+        """Buffer this thread's log lines so a worker's output can be replayed in input order."""
+        lines: List[str] = []
+        self._local.log_lines = lines
+        try:
+            yield lines
+        finally:
+            self._local.log_lines = None
+
+    def throttle(self, url: str) -> None:
+        """Wait for the per-host politeness budget; calls to our own API are not throttled."""
+        if urlparse(url).netloc.lower() != self.api_host:
+            self.limiter.acquire(url)
+
+    def map_ordered(self, func: Callable, items: Iterable) -> Iterator:
+        """Yield func(item) in input order while up to `workers` threads run ahead of the consumer."""
+        if self.workers <= 1:
+            for item in items:
+                yield func(item)
+            return
+        iterator = iter(items)
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            window = deque(pool.submit(func, item) for item in islice(iterator, self.workers * 2))
+            while window:
+                future = window.popleft()
+                window.extend(pool.submit(func, item) for item in islice(iterator, 1))
+                yield future.result()
 
     def fetch(self, url: str, stream: bool = False, use_auth: bool = False) -> Optional[requests.Response]:
+        # Archive snapshots never change, so their page fetches are served from the disk cache. Live pages
+        # (e.g. a non-snapshot --url) are always fetched.
+        cacheable = self.cache is not None and not stream and not use_auth and bool(SNAPSHOT_URL_RE.match(url))
+        if cacheable and not self.refresh:
+            cached = self.cache.get(url)
+            if cached is not None:
+                return cached
+        self.throttle(url)
         try:
             resp = self.session.get(
                 url,
@@ -79,10 +687,11 @@ class Importer:
                 stream=stream,
                 auth=self.api_auth if use_auth else None,
             )
-            self.sleep()
             if resp.status_code != 200:
                 self.log(f"  !! HTTP {resp.status_code} for {url}")
                 return None
+            if cacheable:
+                self.cache.put(url, resp)
             return resp
         except requests.RequestException as exc:
             self.log(f"  !! Request failed for {url}: {exc}")
@@ -93,24 +702,48 @@ class Importer:
             resp = self.session.head(url, timeout=self.timeout, allow_redirects=True)
             if resp.status_code == 405 or resp.status_code >= 400:
                 resp = self.session.get(url, timeout=self.timeout, stream=True, allow_redirects=True)
+                resp.close()
             return resp
         except requests.RequestException:
             try:
                 resp = self.session.get(url, timeout=self.timeout, stream=True, allow_redirects=True)
+                resp.close()
                 return resp
             except requests.RequestException:
                 return None
 
-    def is_working_file_url(self, url: str) -> bool:
+    def probe_file_url(self, url: str) -> Dict:
+        self.throttle(url)
         resp = self.head_or_get(url)
-        self.sleep()
-        if not resp or resp.status_code != 200:
-            return False
+        result = {"ok": False, "status": None, "content_type": "", "final_url": url, "checked_at": time.time()}
+        if not resp:
+            return result
         content_type = (resp.headers.get("Content-Type") or "").split(";")[0].strip().lower()
         final_url = resp.url or url
-        if content_type in ALLOWED_CONTENT_TYPES:
-            return True
-        return final_url.lower().endswith(ALLOWED_EXTENSIONS)
+        result.update(status=resp.status_code, content_type=content_type, final_url=final_url)
+        if resp.status_code == 200:
+            result["ok"] = content_type in ALLOWED_CONTENT_TYPES or final_url.lower().endswith(ALLOWED_EXTENSIONS)
+        return result
+
+    def verify_links(self, urls: Iterable[str]) -> Dict[str, bool]:
+        """Check attachment URLs, probing the ones without a fresh cached result in parallel."""
+        verified: Dict[str, bool] = {}
+        pending = []
+        for url in dict.fromkeys(urls):
+            cached = self.link_cache.get(url)
+            if cached is not None:
+                verified[url] = bool(cached.get("ok"))
+            else:
+                pending.append(url)
+        if pending:
+            with ThreadPoolExecutor(max_workers=min(self.link_workers, len(pending))) as pool:
+                results = dict(zip(pending, pool.map(self.probe_file_url, pending)))
+            self.link_cache.update(results)
+            verified.update({url: result["ok"] for url, result in results.items()})
+        return verified
+
+    def is_working_file_url(self, url: str) -> bool:
+        return self.verify_links([url])[url]
 
     def get_pages(self) -> List[Dict]:
         if self.pages_cache is not None:
@@ -122,209 +755,128 @@ class Importer:
         self.pages_cache = resp.json()
         return self.pages_cache
 
+    def load_state(self) -> Optional[Dict]:
+        if not self.state_file or not os.path.isfile(self.state_file):
+            return None
+        try:
+            with open(self.state_file, "r", encoding="utf-8") as f:
+                state = json.load(f)
+        except (OSError, ValueError) as exc:
+            self.log(f"  !! Ignoring unreadable state file {self.state_file}: {exc}")
+            return None
+        if not isinstance(state, dict) or state.get("flask_base") != self.flask_base:
+            return None
+        if not isinstance(state.get("version"), int) or not isinstance(state.get("entries"), list):
+            return None
+        return state
+
+    def save_state(self, version: int, entries: List[Dict]) -> None:
+        if not self.state_file:
+            return
+        tmp_path = f"{self.state_file}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"flask_base": self.flask_base, "version": version, "entries": entries}, f, ensure_ascii=False)
+        os.replace(tmp_path, self.state_file)
+
     def get_entries(self) -> List[Dict]:
+        """Sync the local entry cache through the /api/entries?since= change feed."""
         if self.entries_cache is not None:
             return self.entries_cache
-        url = f"{self.flask_base}/api/entries"
+        state = self.load_state()
+        since = state["version"] if state else 0
+        url = f"{self.flask_base}/api/entries?since={since}"
         resp = self.fetch(url, use_auth=True)
         if not resp:
             raise RuntimeError(f"Failed to fetch entries from {url}")
-        self.entries_cache = resp.json()
+        data = resp.json()
+        if isinstance(data, list):
+            # Older server without the change feed: always the full list.
+            self.entries_cache = data
+            self.index_entries()
+            return self.entries_cache
+        entries = {}
+        if state and not data.get("full"):
+            entries = {entry.get("id"): entry for entry in state["entries"]}
+        for entry_id in data.get("deleted", []):
+            entries.pop(entry_id, None)
+        for entry in data.get("entries", []):
+            entries[entry.get("id")] = entry
+        self.entries_cache = list(entries.values())
+        self.log(
+            f"Synced entries: {len(data.get('entries', []))} changed, {len(data.get('deleted', []))} deleted, "
+            f"{len(self.entries_cache)} total (version {data.get('version')})"
+        )
+        # Entries this run creates are not written back; the next sync returns them as changes.
+        self.save_state(int(data.get("version", 0)), self.entries_cache)
+        self.index_entries()
         return self.entries_cache
 
+    def index_entries(self) -> None:
+        """Build the duplicate key set once; add_entry_to_cache keeps it current."""
+        self.entry_keys = {self.entry_key(entry) for entry in self.entries_cache}
+        if self.checkpoint is not None:
+            self.entry_keys |= self.checkpoint.created_keys
+
     def ensure_page(self, page_name: str) -> Optional[int]:
         pages = self.get_pages()
-        normalized = self.normalize_for_compare(page_name)
+        normalized = normalize_for_compare(page_name)
         for page in pages:
-            if self.normalize_for_compare(str(page.get("name", ""))) == normalized:
+            if normalize_for_compare(str(page.get("name", ""))) == normalized:
                 return int(page["id"])
-        available = ", ".join(sorted([self.normalize_text(str(p.get("name", ""))) for p in pages if p.get("name")]))
+        available = ", ".join(sorted([normalize_text(str(p.get("name", ""))) for p in pages if p.get("name")]))
         self.log(
             f"  !! No page mapping for CSV page_name '{page_name}'. "
             f"Available pages: {available}"
         )
         return None
 
-    def entry_key(self, entry: Dict) -> Tuple[int, str, str]:
-        page_id = int(entry.get("page_id", 0))
-        title = entry.get("title") or ""
+    def entry_key(self, entry: Dict) -> EntryKey:
         publish_date = entry.get("publish_date") or ""
         heading = entry.get("heading") or ""
-        return page_id, title, publish_date or heading
+        return duplicate_key(entry.get("page_id"), entry.get("title") or "", publish_date or heading)
 
     def is_duplicate(self, page_id: int, title: str, publish_date: str) -> bool:
-        entries = self.get_entries()
-        key = (page_id, title, publish_date)
-        for entry in entries:
-            if self.entry_key(entry) == key:
-                return True
-        return False
+        self.get_entries()
+        return duplicate_key(page_id, title, publish_date) in self.entry_keys
 
     def add_entry_to_cache(self, entry: Dict) -> None:
         if self.entries_cache is None:
             self.entries_cache = []
         self.entries_cache.append(entry)
+        self.entry_keys.add(self.entry_key(entry))
 
-    def normalize_text(self, text: str) -> str:
-        return " ".join((text or "").split())
-
-    def normalize_for_compare(self, text: str) -> str:
-        return self.normalize_text(text).casefold()
-
-    def clean_aop_number(self, value: str) -> str:
-        if not value:
-            return ""
-        if DATE_DOTTED_RE.search(value):
-            return ""
-        cleaned = "".join(ch for ch in value if ch.isdigit() or ch in "/-")
-        if not any(ch.isdigit() for ch in cleaned):
-            return ""
-        return cleaned
-
-    def extract_labeled_value(self, lines: List[str], label: str) -> Tuple[bool, str]:
-        for idx, line in enumerate(lines):
-            if label in line:
-                remainder = line.split(label, 1)[1].strip()
-                if remainder:
-                    return True, self.normalize_text(remainder).strip(" ;:.-")
-                if idx + 1 < len(lines):
-                    return True, self.normalize_text(lines[idx + 1]).strip(" ;:.-")
-                return True, ""
-        return False, ""
-
-    def extract_publish_date(self, lines: List[str]) -> str:
-        found, remainder = self.extract_labeled_value(lines, LABEL_PUBLISH_DATE)
-        if not found:
-            return ""
-        match = DATE_RE.search(remainder)
-        if match:
-            return match.group(1)
-        return ""
+    def remove_entry_from_cache(self, entry: Dict) -> None:
+        """Forget a queued entry that was not created, so it no longer counts as a duplicate."""
+        key = self.entry_key(entry)
+        self.entry_keys.discard(key)
+        self.entries_cache = [
+            cached
+            for cached in self.entries_cache or []
+            if cached.get("id") is not None or self.entry_key(cached) != key
+        ]
 
-    def normalize_file_url(self, href: str, base_url: str) -> str:
-        if not href:
-            return ""
-        if href.startswith("/web/"):
-            return f"https://web.archive.org{href}"
-        if href.startswith("http://") or href.startswith("https://"):
-            return href
-        return urljoin(base_url, href)
-
-    def extract_files(self, body_el, base_url: str) -> List[Dict]:
-        files = []
-        label = None
-        for tag in body_el.find_all(["strong", "b"]):
-            if self.normalize_text(tag.get_text(" ", strip=True)).casefold() == "файлове":
-                label = tag
-                break
-        if not label:
-            for node in body_el.find_all(string=True):
-                if "Файлове" in self.normalize_text(str(node)):
-                    label = node.parent
-                    break
+    def record_created(self, entry: Dict) -> None:
+        if entry.get("id") is not None:
+            self.created_ids.append(entry["id"])
+        if self.checkpoint is not None:
+            self.checkpoint.mark_created(self.entry_key(entry))
 
-        files_list_el = None
-        if label:
-            candidate = label.find_next(["ul", "ol"])
-            if candidate and body_el in candidate.parents:
-                files_list_el = candidate
-            else:
-                siblings = []
-                for sib in label.parent.next_siblings:
-                    if getattr(sib, "name", None) in ["ul", "ol"]:
-                        files_list_el = sib
-                        break
-                    if getattr(sib, "name", None) == "li":
-                        siblings.append(sib)
-                    if siblings and getattr(sib, "name", None) not in ["li", None]:
-                        break
-                if not files_list_el and siblings:
-                    files_list_el = siblings
-
-        if not files_list_el:
-            return files
-
-        list_items = []
-        if isinstance(files_list_el, list):
-            list_items = files_list_el
+    def finish_row(self, url: str) -> None:
+        """Checkpoint a fully imported row, or hold it until its queued entries are sent."""
+        if self.checkpoint is None or url in self.failed_urls:
+            return
+        if self.pending:
+            self.pending_urls.append(url)
         else:
-            list_items = files_list_el.find_all("li")
+            self.checkpoint.mark_done(url)
 
-        for li in list_items:
-            link = li.find("a", href=True)
-            if not link:
-                continue
-            name = self.normalize_text(link.get_text(" ", strip=True))
-            raw_url = (link.get("href") or "").strip()
-            url = self.normalize_file_url(raw_url, base_url)
-            li_text = self.normalize_text(li.get_text(" ", strip=True))
-            published = ""
-            match = PUBLISHED_RE.search(li_text)
-            if match:
-                published = self.normalize_text(match.group(1)).strip()
-            if name or url:
-                files.append({
-                    "name": name,
-                    "url": url,
-                    "published_at": published,
-                })
-
-        return files
-
-    def parse_offer_page(self, panel, soup, source_url: str, subtopic: str) -> Optional[Dict]:
-        title_el = panel.select_one(".panel-heading .panel-title") or panel.select_one(".panel-title")
-        title = self.normalize_text(title_el.get_text(" ", strip=True)) if title_el else ""
-        if not title:
-            self.log("  !! Missing title for panel, skipping")
-            return None
-
-        body_el = panel.select_one(".panel-collapse .panel-body") or panel.select_one(".panel-body")
-
-        if not body_el:
-            self.log(f"  !! Missing body for panel '{title}', skipping")
-            return None
-
-        body_text = body_el.get_text("\n", strip=True)
-        lines = [self.normalize_text(line) for line in body_text.splitlines() if self.normalize_text(line)]
-        publish_date = self.extract_publish_date(lines)
-        _, aop_raw = self.extract_labeled_value(lines, LABEL_AOP)
-        aop_number = self.clean_aop_number(aop_raw)
-        _, internal_number = self.extract_labeled_value(lines, LABEL_INTERNAL)
-        files = self.extract_files(body_el, source_url)
-
-        heading = title
-        if self.normalize_for_compare(heading) == self.normalize_for_compare(title):
-            heading = ""
-
-        content_lines = []
-        if files:
-            content_lines.append("Файлове:")
-            for f in files:
-                name = f.get("name") or ""
-                if name:
-                    content_lines.append(f"- {name}")
-        content = "\n".join(content_lines)
-
-        pdf_files = []
-        for f in files:
-            url = f.get("url") or ""
-            name = f.get("name") or url
-            if url and self.is_working_file_url(url):
-                pdf_files.append({"name": name, "url": url})
-
-        entry = {
-            "title": title,
-            "heading": heading,
-            "publish_date": publish_date,
-            "aop_number": aop_number,
-            "internal_number": internal_number,
-            "files": files,
-            "content": content,
-            "pdf_files": pdf_files,
-            "source_url": source_url,
-            "imported_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-        }
-        return entry
+    def attach_verified_files(self, entry: Dict, verified: Dict[str, bool]) -> None:
+        """Fill pdf_files with the entry's attachments that passed verify_links()."""
+        entry["pdf_files"] = [
+            {"name": f.get("name") or f.get("url"), "url": f.get("url")}
+            for f in entry.get("files", [])
+            if f.get("url") and verified.get(f.get("url"))
+        ]
 
     def validate_entry(self, entry: Dict) -> bool:
         required_keys = [
@@ -400,38 +952,161 @@ class Importer:
 
         url = f"{self.flask_base}/api/entries"
         resp = self.session.post(url, data=payload, timeout=self.timeout, auth=self.api_auth)
-        self.sleep()
         if resp.status_code != 200:
             self.log(f"  !! Failed to create entry '{entry.get('title','')}': {resp.text}")
             return None
         entry_resp = resp.json().get("entry")
         if entry_resp:
             self.add_entry_to_cache(entry_resp)
+            self.record_created(entry_resp)
         return entry_resp
 
-    def import_row(self, row: CsvRow) -> None:
+    def queue_entry(self, row_url: str, page_id: int, entry: Dict) -> None:
+        """Collect an entry for POST /api/entries/bulk; sent once batch_size entries are pending."""
+        item = dict(entry, page_id=page_id)
+        self.pending.append((row_url, item))
+        # Cache it right away so later panels in this run are still caught as duplicates.
+        self.add_entry_to_cache(dict(item, id=None))
+        if len(self.pending) >= self.batch_size:
+            self.flush_entries()
+
+    def fail_entry(self, row_url: str, item: Dict) -> None:
+        self.failed_urls.add(row_url)
+        self.remove_entry_from_cache(item)
+
+    def flush_entries(self) -> None:
+        """Send the pending entries; rows with an entry that was not created stay out of the checkpoint."""
+        if not self.pending:
+            return
+        batch, self.pending = self.pending, []
+        urls, self.pending_urls = self.pending_urls, []
+        if self.dry_run:
+            for _, item in batch:
+                self.log(
+                    f"  [dry-run] Would create entry: title='{item.get('title','')}' "
+                    f"publish_date='{item.get('publish_date','')}'"
+                )
+            return
+        payload = [
+            {
+                "title": item.get("title", ""),
+                "heading": item.get("heading", ""),
+                "publish_date": item.get("publish_date", ""),
+                "aop_number": item.get("aop_number", ""),
+                "internal_number": item.get("internal_number", ""),
+                "content": item.get("content", ""),
+                "files": item.get("files", []),
+                "pdf_files": item.get("pdf_files", []),
+                "source_url": item.get("source_url", ""),
+                "imported_at": item.get("imported_at", ""),
+                "page_id": item["page_id"],
+            }
+            for _, item in batch
+        ]
+        url = f"{self.flask_base}/api/entries/bulk"
+        results: List[Dict] = []
+        try:
+            resp = self.session.post(url, json=payload, timeout=self.timeout, auth=self.api_auth)
+            if resp.status_code != 200:
+                self.log(f"  !! Bulk create of {len(batch)} entries failed: {resp.text}")
+            else:
+                results = resp.json().get("results", [])
+        except (requests.RequestException, ValueError) as exc:
+            self.log(f"  !! Bulk create of {len(batch)} entries failed: {exc}")
+        for index, (row_url, item) in enumerate(batch):
+            result = results[index] if index < len(results) else {}
+            status = result.get("status")
+            if status == "created":
+                self.log(f"  ++ Created entry: '{item.get('title','')}'")
+                self.record_created(dict(item, id=result.get("id")))
+            elif status == "duplicate":
+                self.log(f"  == Duplicate on server, skipped: '{item.get('title','')}'")
+            else:
+                if result:
+                    self.log(f"  !! Rejected entry '{item.get('title','')}': {result.get('error')}")
+                self.fail_entry(row_url, item)
+        for url in urls:
+            if url not in self.failed_urls:
+                self.checkpoint.mark_done(url)
+
+    def mirror_created(self, poll_interval: float = 2.0) -> None:
+        """Have the server copy the new entries' verified attachments into uploads/ (POST /api/mirror)."""
+        if not self.mirror or not self.created_ids:
+            return
+        url = f"{self.flask_base}/api/mirror"
+        resp = self.session.post(url, json={"entry_ids": self.created_ids}, timeout=self.timeout, auth=self.api_auth)
+        if resp.status_code != 202:
+            self.log(f"  !! Could not start attachment mirroring: {resp.text}")
+            return
+        self.log(f"Mirroring attachments of {len(self.created_ids)} entries...")
+        status = resp.json().get("status", {})
+        while status.get("running"):
+            time.sleep(poll_interval)
+            resp = self.fetch(url, use_auth=True)
+            if not resp:
+                self.log("  !! Lost track of the mirror job; check GET /api/mirror")
+                return
+            status = resp.json().get("status", {})
+        self.log(f"Mirrored {status.get('mirrored', 0)} attachments, {status.get('failed', 0)} failed")
+
+    def fetch_page(self, url: str) -> Tuple[Optional[str], List[str]]:
+        """Fetch and decode a page; returns (html, log lines). Safe to run on worker threads."""
+        with self.capture_logs() as lines:
+            html = None
+            try:
+                resp = self.fetch(url)
+                if resp:
+                    resp.encoding = resp.apparent_encoding or "utf-8"
+                    html = resp.text
+            except Exception as exc:
+                self.log(f"  !! Error fetching {url}: {exc}")
+        return html, lines
+
+    def load_page(self, row: CsvRow) -> Tuple[Optional[ParsedPanels], List[str]]:
+        """Fetch and parse a page; returns (parsed panels or None if the fetch failed, fetch log lines).
+
+        Parsing is CPU-bound, so with a process pool the worker thread hands the HTML over and only waits.
+        """
+        html, lines = self.fetch_page(row.url)
+        if html is None:
+            return None, lines
+        if self.parse_pool is not None:
+            return self.parse_pool.submit(parse_page, html, row.url, row.subtopic).result(), lines
+        return parse_page(html, row.url, row.subtopic), lines
+
+    def prefetch_pages(self, rows: List[CsvRow]) -> Iterator[Tuple[Optional[ParsedPanels], List[str]]]:
+        return self.map_ordered(self.load_page, rows)
+
+    def import_row(self, row: CsvRow, fetched: Optional[Tuple[Optional[ParsedPanels], List[str]]] = None) -> bool:
+        """Import one CSV row; returns False if it should be retried on the next run."""
         self.log(f"Processing: {row.url}")
         page_id = self.ensure_page(row.page_name)
         if page_id is None:
             self.log("  !! Skipping row due to missing page mapping")
-            return
-        resp = self.fetch(row.url)
-        if not resp:
+            return False
+        parsed, fetch_log = fetched if fetched is not None else self.load_page(row)
+        for line in fetch_log:
+            self.log(line)
+        if parsed is None:
             self.log("  !! Failed to fetch page, skipping")
-            return
-        resp.encoding = resp.apparent_encoding or "utf-8"
-        html = resp.text
-
-        soup = BeautifulSoup(html, HTML_PARSER)
-        panels = soup.select(".panel.panel-default")
-        if not panels:
+            return False
+        if not parsed:
             self.log("  !! No panels found, skipping page")
-            return
+            return True
 
-        for panel in panels:
-            entry = self.parse_offer_page(panel, soup, row.url, row.subtopic)
+        # Every panel is parsed up front so all attachment links of the page are verified as one parallel
+        # batch; each panel's parse log is replayed in place to keep the output order.
+        verified = self.verify_links(
+            f.get("url") for entry, _ in parsed if entry for f in entry.get("files", []) if f.get("url")
+        )
+
+        complete = True
+        for entry, parse_log in parsed:
+            for line in parse_log:
+                self.log(line)
             if not entry:
                 continue
+            self.attach_verified_files(entry, verified)
             if not self.validate_entry(entry):
                 self.log("  !! Entry failed validation, skipping")
                 continue
@@ -448,9 +1123,16 @@ class Importer:
                 )
                 continue
 
+            if self.batch_size > 0:
+                self.queue_entry(row.url, page_id, entry)
+                continue
             created = self.post_entry(page_id, entry)
             if created:
                 self.log(f"  ++ Created entry: '{entry.get('title','')}'")
+            else:
+                complete = False
+        # A bulk flush triggered while queueing this row's entries may already have failed.
+        return complete and row.url not in self.failed_urls
 
 
 def read_csv(csv_path: str, logger) -> List[CsvRow]:
@@ -489,10 +1171,56 @@ def main() -> int:
     parser.add_argument("--flask-base", default="http://localhost:5000", help="Flask base URL")
     parser.add_argument("--auth-user", default=None, help="Basic Auth username")
     parser.add_argument("--auth-pass", default=None, help="Basic Auth password")
-    parser.add_argument("--sleep", type=float, default=1.0, help="Delay between external fetches")
+    parser.add_argument(
+        "--sleep",
+        type=float,
+        default=1.0,
+        help="Politeness budget: minimum average delay between requests to the same external host",
+    )
+    parser.add_argument("--burst", type=int, default=1, help="Requests a host may receive back to back")
+    parser.add_argument("--workers", type=int, default=4, help="Pages fetched concurrently")
+    parser.add_argument(
+        "--parse-workers",
+        type=int,
+        default=0,
+        help="Parse pages in this many worker processes (0 = parse on the fetch threads)",
+    )
+    parser.add_argument("--cache-dir", default=".wayback_cache", help="Raw response cache directory ('' to disable)")
+    parser.add_argument("--cache-max-mb", type=int, default=512, help="Evict least recently used responses past this size")
+    parser.add_argument("--refresh", action="store_true", help="Refetch pages even if cached (and update the cache)")
+    parser.add_argument("--link-cache", default=".link_cache.json", help="Attachment check results file ('' to disable)")
+    parser.add_argument("--link-ttl-hours", type=float, default=168, help="Re-check non-snapshot attachments after this")
+    parser.add_argument("--link-workers", type=int, default=8, help="Attachment checks run concurrently")
     parser.add_argument("--timeout", type=int, default=60, help="Request timeout seconds")
     parser.add_argument("--dry-run", action="store_true", help="Print actions without posting")
+    parser.add_argument(
+        "--state-file",
+        default=".import_state.json",
+        help="Local cache of synced entries for incremental /api/entries?since= syncs ('' to disable)",
+    )
+    parser.add_argument(
+        "--checkpoint",
+        default=".import_checkpoint.jsonl",
+        help="Journal of finished CSV rows and created entries; an interrupted import resumes from it ('' to disable)",
+    )
+    parser.add_argument("--restart", action="store_true", help="Discard the checkpoint and import every row again")
+    parser.add_argument(
+        "--mirror",
+        action="store_true",
+        help="After importing, have the server copy the new entries' attachments into uploads/",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=0,
+        help=(
+            "Send entries through /api/entries/bulk in batches of this size "
+            f"(0 = one POST per entry, max {BULK_MAX_ITEMS})"
+        ),
+    )
     args = parser.parse_args()
+    if args.batch_size > BULK_MAX_ITEMS:
+        parser.error(f"--batch-size may be at most {BULK_MAX_ITEMS} (the server's bulk limit)")
 
     if HTML_PARSER != "lxml":
         print("Warning: lxml not available, falling back to html.parser", file=sys.stderr)
@@ -501,11 +1229,39 @@ def main() -> int:
         flask_base=args.flask_base,
         auth_user=args.auth_user,
         auth_pass=args.auth_pass,
-        sleep_seconds=args.sleep,
+        rate=1.0 / args.sleep if args.sleep > 0 else 0.0,
         timeout=args.timeout,
         dry_run=args.dry_run,
+        state_file=args.state_file or None,
+        batch_size=max(0, args.batch_size),
+        workers=args.workers,
+        burst=args.burst,
+        cache=ResponseCache(args.cache_dir, args.cache_max_mb * 1024 * 1024) if args.cache_dir else None,
+        refresh=args.refresh,
+        link_cache=LinkCheckCache(args.link_cache or None, args.link_ttl_hours * 3600),
+        link_workers=args.link_workers,
+        parse_pool=ProcessPoolExecutor(max_workers=args.parse_workers) if args.parse_workers > 0 else None,
+        # Dry runs create nothing, so they neither read nor write the checkpoint.
+        checkpoint=(
+            ImportCheckpoint(args.checkpoint, args.csv, args.flask_base.rstrip("/"))
+            if args.checkpoint and not args.url and not args.dry_run
+            else None
+        ),
+        mirror=args.mirror,
     )
 
+    try:
+        return run_import(importer, args)
+    finally:
+        if importer.parse_pool is not None:
+            importer.parse_pool.shutdown()
+
+
+def run_import(importer: Importer, args: argparse.Namespace) -> int:
+    checkpoint = importer.checkpoint
+    if checkpoint is not None and args.restart:
+        checkpoint.clear()
+
     try:
         importer.get_entries()
     except Exception as exc:
@@ -519,6 +1275,8 @@ def main() -> int:
         row = CsvRow(url=args.url.strip(), page_name=args.page_name.strip(), subtopic=args.subtopic.strip())
         try:
             importer.import_row(row)
+            importer.flush_entries()
+            importer.mirror_created()
         except Exception as exc:
             importer.log(f"  !! Error importing {row.url}: {exc}")
             return 1
@@ -533,12 +1291,26 @@ def main() -> int:
             print(f"Failed to read CSV: {exc}", file=sys.stderr)
             return 1
 
-        for row in rows:
+        todo = rows
+        if checkpoint is not None and checkpoint.done_urls:
+            todo = [row for row in rows if row.url not in checkpoint.done_urls]
+            importer.log(
+                f"Resuming from {checkpoint.path}: {len(rows) - len(todo)} of {len(rows)} rows already imported"
+            )
+        for row, fetched in zip(todo, importer.prefetch_pages(todo)):
             try:
-                importer.import_row(row)
+                if importer.import_row(row, fetched):
+                    importer.finish_row(row.url)
             except Exception as exc:
                 importer.log(f"  !! Error importing {row.url}: {exc}")
                 continue
+        importer.flush_entries()
+        importer.mirror_created()
+        if checkpoint is not None:
+            if all(row.url in checkpoint.done_urls for row in rows):
+                checkpoint.clear()
+            else:
+                importer.log(f"Some rows did not finish; rerun to resume from {checkpoint.path}")
 
     importer.log("Done")
     return 0